@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
 # Please refer to the accompanying LICENSE file.
 
+import ctypes
+
 import jni
 from jni._config import make_config, get_config, set_config
 from .lib import public
@@ -12,7 +14,19 @@ public(set_config  = set_config)
 
 
 def str2jchars(val):
-    jbuf = val.encode("utf-16")[jni.sizeof(jni.jchar):]  # skip byte-order mark
+    jbuf = val.encode("utf-16-le", "surrogatepass")  # Java chars are UTF-16 code units
     jchars = jni.cast(jni.as_cstr(jbuf), jni.POINTER(jni.jchar))
-    size = len(jbuf) // jni.sizeof(jni.jchar)
+    size = len(jbuf) // 2
     return jchars, size, jbuf
+
+
+def address(ptr) -> int:
+    # The integer address of a native pointer
+    # (ctypes: int|None, c_void_p or a pointer instance, cffi: cdata).
+    if ptr is None or isinstance(ptr, int):
+        return ptr or 0
+    if isinstance(ptr, ctypes._SimpleCData):
+        return ptr.value or 0
+    if isinstance(ptr, ctypes._Pointer):
+        return ctypes.cast(ptr, ctypes.c_void_p).value or 0
+    return int(jni.cast(ptr, jni.jlong))
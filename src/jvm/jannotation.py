@@ -35,10 +35,7 @@ class JAnnotation(obj):
     def __del__(self):
         """Finalizer"""
         if not self._own or not self.jvm: return
-        try: jvm, jenv = self.jvm
-        except Exception: return  # pragma: no cover
-        if jvm.jnijvm:
-            jenv.DeleteGlobalRef(self._jobj)
+        self.jvm._release(self._jobj)
 
     handle = property(lambda self: self._jobj)
 
@@ -0,0 +1,155 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+from __future__ import annotations
+
+import sys
+import threading
+
+import jni
+from .lib import public
+from .lib import obj
+from .lib import platform
+
+
+class _Local(threading.local):
+    arena = None  # the innermost active arena of the thread
+
+
+_local = _Local()
+
+
+@public
+class JArena(obj):
+    """Scope of local references of the wrappers (see JVM.arena())
+
+    On enter, one local frame is pushed (PushLocalFrame). Inside the scope
+    the wrappers (JObject, JClass, JMethod, ...) created by the thread are
+    backed by local references of this frame instead of global ones (no
+    NewGlobalRef/DeleteGlobalRef) and the JFrames of the bridge reserve their
+    local references in this frame too (the frame grows by EnsureLocalCapacity
+    up to limit references; beyond it the bridge falls back to its own frames
+    and to global references). The JFrames reset in loops always push their
+    own frames, as they release their references on every reset. On exit
+    the frame is popped (PopLocalFrame), so all its references are released
+    at once. The wrappers which are still referenced (escape the scope) are
+    promoted to global references just before, or explicitly by promote().
+
+    The wrappers created inside the scope (also the ones cached by other
+    wrappers) are usable only by the thread of the arena until its exit.
+    """
+
+    __slots__ = ('capacity', 'limit', '__jenv', '__count', '__frames', '__objects', '__outer')
+
+    def __init__(self, jenv: jni.JNIEnv, capacity: int = 256, limit: int = 65536):
+        """Initializer"""
+        self.capacity = max(capacity, 1)
+        self.limit    = max(limit, self.capacity)
+        self.__jenv    = jenv
+        self.__count   = 0     # number of the reserved local references
+        self.__frames  = 0     # number of the JFrames pushed on top of the arena frame
+        self.__objects = {}    # id(wrapper) -> wrapper, of the wrappers backed by the frame
+        self.__outer   = None  # the enclosing arena of the thread
+
+    def __enter__(self):
+        """Enter context"""
+        self.__jenv.PushLocalFrame(self.capacity)
+        self.__count   = 0
+        self.__frames  = 0
+        self.__outer   = _local.arena
+        _local.arena   = self
+        return self
+
+    def __exit__(self, *exc_info):
+        """Exit context"""
+        del exc_info
+        _local.arena = self.__outer
+        self.__outer = None
+        jenv = self.__jenv
+        objects = list(self.__objects.values())
+        self.__objects.clear()
+        # A wrapper referenced only by the 'objects' list, the loop variable
+        # and the getrefcount() argument does not escape the scope.
+        refcounts = platform.is_cpython
+        for wrapper in objects:
+            if not refcounts or sys.getrefcount(wrapper) > 3:
+                JArena.__promote(jenv, wrapper)
+        wrapper = None
+        jenv.PopLocalFrame(jni.NULL)
+
+    def __len__(self):
+        """Number of the wrappers backed by the arena"""
+        return len(self.__objects)
+
+    def promote(self, wrapper: JObjectBase) -> JObjectBase:  # noqa: F821
+        """Promotes the wrapper (created inside this or an enclosing arena) \
+        to a global reference, so it stays valid after the exit of the arena."""
+        arena = self
+        while arena is not None:
+            if arena.__objects.pop(id(wrapper), None) is not None:
+                JArena.__promote(arena.__jenv, wrapper)
+                break
+            arena = arena.__outer
+        return wrapper
+
+    @staticmethod
+    def current() -> JArena | None:
+        """Returns the innermost active arena of the current thread (or None)."""
+        return _local.arena
+
+    @staticmethod
+    def escape(wrapper: JObjectBase) -> JObjectBase:  # noqa: F821
+        """Promotes the wrapper if it is backed by an active arena of the \
+        current thread (for the wrappers stored into the shared caches)."""
+        arena = _local.arena
+        return arena.promote(wrapper) if arena is not None else wrapper
+
+    @staticmethod
+    def _suspend() -> JArena | None:
+        # Used by the callbacks from Java: their local references belong
+        # to the frame of the native method, not to the arena frame.
+        arena = _local.arena
+        _local.arena = None
+        return arena
+
+    @staticmethod
+    def _resume(arena: JArena | None):
+        _local.arena = arena
+
+    def _adopt(self, jenv: jni.JNIEnv, wrapper: JObjectBase,  # noqa: F821
+               jobj: jni.jobject) -> bool:
+        # Backs the wrapper by a new local reference of the arena frame
+        # (False if it is not the current frame or it is full).
+        if self.__frames or not self._reserve(1): return False
+        wrapper._jobj = jni.cast(jenv.NewLocalRef(jobj), jni.jobject)
+        wrapper._own  = False
+        self.__objects[id(wrapper)] = wrapper
+        return True
+
+    def _reserve(self, size: int) -> bool:
+        # Reserves size local references in the arena frame (growing
+        # it up to the limit).
+        count = self.__count + size
+        if count > self.capacity:
+            if count > self.limit: return False
+            capacity = min(max(self.capacity * 2, count), self.limit)
+            self.__jenv.EnsureLocalCapacity(capacity - self.__count)
+            self.capacity = capacity
+        self.__count = count
+        return True
+
+    def _absorb(self, size: int) -> bool:
+        # For a JFrame of size references: True if they are reserved
+        # in the arena frame (so the JFrame does not push its own frame).
+        return not self.__frames and self._reserve(size)
+
+    def _pushed(self, delta: int):
+        # A JFrame pushed (+1) or popped (-1) its own frame over the arena frame.
+        self.__frames += delta
+
+    @staticmethod
+    def __promote(jenv: jni.JNIEnv, wrapper: JObjectBase):  # noqa: F821
+        wrapper._jobj = jni.cast(jenv.NewGlobalRef(wrapper._jobj), jni.jobject)
+        wrapper._own  = True
+        wrapper._track(jenv)
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import threading
+
 import jni
 from .lib import public
 from .lib import obj
@@ -12,36 +14,131 @@ from .jconstants import EJavaType
 from .jframe     import JFrame
 from ._util      import str2jchars
 
+# Per-thread pools of the jvalue arrays of the local JArguments, by arity.
+_pools = threading.local()
+# Number of the pooled jvalue arrays of an arity.
+_POOL_SIZE = 8
+
 
 @public
 class JArguments(obj):
-    """ArgumentList"""
+    """ArgumentList
+
+    By default the reference arguments are held as global references (so
+    the JArguments may be kept and reused). JArguments(size, local=True) are
+    call-scoped instead: they are used as a context manager around the call,
+    the reference arguments are held as local references of a local frame
+    pushed for the with block (no NewGlobalRef/DeleteGlobalRef), and their
+    jvalue array is taken from a per-thread pool. retain() promotes them
+    to global references, so they can outlive the with block.
+    """
 
-    __slots__ = ('__jvalues', '__jtypes', '_own')
+    __slots__ = ('__jvalues', '__jtypes', '_own', '__local', '__frame', '__keep', '__exited')
 
-    def __init__(self, size: int, own: bool = True):
+    def __init__(self, size: int, own: bool = True, local: bool = False):
         """Initializer"""
         self._own = own
-        self.__jvalues = (jni.new_array(jni.jvalue, size)
-                          if size > 0 else
-                          jni.obj(jni.POINTER(jni.jvalue)))
+        self.__local = local
+        self.__frame = None
+        self.__keep  = None
+        self.__exited = False
+        if local and size > 0:
+            pool = _pools.__dict__.setdefault("arrays", {}).get(size)
+            self.__jvalues = pool.pop() if pool else jni.new_array(jni.jvalue, size)
+        else:
+            self.__jvalues = (jni.new_array(jni.jvalue, size)
+                              if size > 0 else
+                              jni.obj(jni.POINTER(jni.jvalue)))
         self.__jtypes  = [EJavaType.VOID] * max(size, 0)
 
     def __del__(self):
         """Finalizer"""
-        if not self._own or not self.jvm: return
-        try: jvm, jenv = self.jvm
-        except Exception: return  # pragma: no cover
-        if jvm.jnijvm and self.__jvalues:
-            for i, arg in enumerate(self.__jvalues):
-                if self.__jtypes[i] >= EJavaType.OBJECT:
-                    jenv.DeleteGlobalRef(arg.l)
-
-    arguments = property(lambda self: self.__jvalues)
+        if self.__local or not self._own or not self.jvm or not self.__jvalues: return
+        self.jvm._release(*(arg.l for i, arg in enumerate(self.__jvalues)
+                            if self.__jtypes[i] >= EJavaType.OBJECT))
+
+    def __enter__(self):
+        """Enter context"""
+        self.__checkScope()
+        if self.__local:
+            with self.jvm as (jvm, jenv):
+                self.__frame = JFrame(jenv, max(len(self.__jtypes), 1)).__enter__()
+                self.__keep  = []
+        return self
+
+    def __exit__(self, *exc_info):
+        """Exit context"""
+        del exc_info
+        if not self.__local or self.__frame is None: return
+        frame, self.__frame = self.__frame, None
+        self.__keep = None
+        jvalues, jtypes = self.__jvalues, self.__jtypes
+        for i, jtype in enumerate(jtypes):
+            if jtype >= EJavaType.OBJECT: jvalues[i].l = jni.NULL  # noqa: E741
+            jtypes[i] = EJavaType.VOID
+        frame.__exit__(None, None, None)
+        size = len(jtypes)
+        if size > 0:
+            pool = _pools.__dict__.setdefault("arrays", {}).setdefault(size, [])
+            if len(pool) < _POOL_SIZE: pool.append(jvalues)
+        self.__jvalues = jni.obj(jni.POINTER(jni.jvalue))
+        self.__exited  = True
+
+    def retain(self) -> JArguments:
+        """Promotes the reference arguments of the call-scoped JArguments \
+        to global references (so they can outlive the with block)."""
+        if not self.__local: return self
+        self.__checkScope()
+        with self.jvm as (jvm, jenv):
+            jvalues = jni.new_array(jni.jvalue, len(self.__jtypes)) if self.__jtypes else \
+                      self.__jvalues
+            for i, jtype in enumerate(self.__jtypes):
+                jvalues[i] = self.__jvalues[i]
+                jref = self.__jvalues[i].l
+                if jtype >= EJavaType.OBJECT and jref:
+                    jvalues[i].l = self.__newGlobalRef(jvm, jenv, jref)  # noqa: E741
+            if self.__frame is not None:
+                jtypes = list(self.__jtypes)
+                self.__exit__(None, None, None)
+                self.__jtypes = jtypes  # (reset by __exit__)
+            self.__jvalues = jvalues
+            self.__exited = False
+            self.__local = False
+            self._own = True
+        return self
+
+    @property
+    def arguments(self):
+        """The jvalue array of the arguments."""
+        self.__checkScope()
+        return self.__jvalues
+
     argtypes  = property(lambda self: self.__jtypes)
 
+    def __checkScope(self):
+        # The jvalue array of the call-scoped JArguments is given back to
+        # the pool on exit of their with block (unless retained).
+        if self.__local and self.__exited:
+            raise RuntimeError("local JArguments used after their with block")
+
+    def __reference(self, jvm, jenv: jni.JNIEnv, val: JObjectBase) -> jni.jobject:
+        # The reference of the argument held by this JArguments.
+        if self.__local:
+            if self.__frame is None:
+                raise RuntimeError("local JArguments used outside of their with block")
+            self.__keep.append(val)  # holds the object (and its reference) during the call
+            return val.handle
+        return self.__newGlobalRef(jvm, jenv, val.handle)
+
+    def __newGlobalRef(self, jvm, jenv: jni.JNIEnv, jref: jni.jobject) -> jni.jobject:
+        jref = jenv.NewGlobalRef(jref)
+        if jvm.refstats is not None:  # see JRefStats
+            jvm.refstats.track(jvm, jenv, jref, type(self).__name__)
+        return jref
+
     def setBoolean(self, pos: int, val: bool):
 
+        self.__checkScope()
         try:
             self.__jvalues[pos].z = val
             self.__jtypes[pos]    = EJavaType.BOOLEAN
@@ -50,6 +147,7 @@ class JArguments(obj):
 
     def setChar(self, pos: int, val: str):
 
+        self.__checkScope()
         try:
             self.__jvalues[pos].c = val
             self.__jtypes[pos]    = EJavaType.CHAR
@@ -58,6 +156,7 @@ class JArguments(obj):
 
     def setByte(self, pos: int, val: int):
 
+        self.__checkScope()
         try:
             self.__jvalues[pos].b = val
             self.__jtypes[pos]    = EJavaType.BYTE
@@ -66,6 +165,7 @@ class JArguments(obj):
 
     def setShort(self, pos: int, val: int):
 
+        self.__checkScope()
         try:
             self.__jvalues[pos].s = val
             self.__jtypes[pos]    = EJavaType.SHORT
@@ -74,6 +174,7 @@ class JArguments(obj):
 
     def setInt(self, pos: int, val: int):
 
+        self.__checkScope()
         try:
             self.__jvalues[pos].i = val
             self.__jtypes[pos]    = EJavaType.INT
@@ -82,6 +183,7 @@ class JArguments(obj):
 
     def setLong(self, pos: int, val: int):
 
+        self.__checkScope()
         try:
             self.__jvalues[pos].j = val
             self.__jtypes[pos]    = EJavaType.LONG
@@ -90,6 +192,7 @@ class JArguments(obj):
 
     def setFloat(self, pos: int, val: float):
 
+        self.__checkScope()
         try:
             self.__jvalues[pos].f = val
             self.__jtypes[pos]    = EJavaType.FLOAT
@@ -98,6 +201,7 @@ class JArguments(obj):
 
     def setDouble(self, pos: int, val: float):
 
+        self.__checkScope()
         try:
             self.__jvalues[pos].d = val
             self.__jtypes[pos]    = EJavaType.DOUBLE
@@ -106,51 +210,62 @@ class JArguments(obj):
 
     def setString(self, pos: int, val: str | None):
 
-        with self.jvm as (jvm, jenv), JFrame(jenv, 1):
+        self.__checkScope()
+        with self.jvm as (jvm, jenv), JFrame(jenv, 0 if self.__local else 1):
             if val is None:
                 self.__jvalues[pos].l = jni.NULL  # noqa: E741
             else:
                 if not isinstance(val, str):
                     raise TypeError(f"str expected instead of {type(val)}")
                 jchars, size, jbuf = str2jchars(val)
-                jstr = jenv.NewString(jchars, size)
-                self.__jvalues[pos].l = jenv.NewGlobalRef(jstr)  # noqa: E741
+                if self.__local:
+                    if self.__frame is None:
+                        raise RuntimeError("local JArguments used outside of their with block")
+                    # A local reference of the frame of the with block.
+                    self.__jvalues[pos].l = jenv.NewString(jchars, size)  # noqa: E741
+                else:
+                    jstr = jenv.NewString(jchars, size)
+                    self.__jvalues[pos].l = self.__newGlobalRef(jvm, jenv, jstr)  # noqa: E741
             self.__jtypes[pos] = EJavaType.STRING
 
     def setClass(self, pos: int, val: JClass | None):
 
+        self.__checkScope()
         with self.jvm as (jvm, jenv):
             if val is None:
                 self.__jvalues[pos].l = jni.NULL  # noqa: E741
             else:
                 if not isinstance(val, self.jvm.JClass):
                     raise TypeError(f"JClass expected instead of {type(val)}")
-                self.__jvalues[pos].l = jenv.NewGlobalRef(val.handle)  # noqa: E741
+                self.__jvalues[pos].l = self.__reference(jvm, jenv, val)  # noqa: E741
             self.__jtypes[pos]    = EJavaType.CLASS
 
     def setObject(self, pos: int, val: JObject | None):
 
+        self.__checkScope()
         with self.jvm as (jvm, jenv):
             if val is None:
                 self.__jvalues[pos].l = jni.NULL  # noqa: E741
             else:
                 if not isinstance(val, self.jvm.JObject):
                     raise TypeError(f"JObject expected instead of {type(val)}")
-                self.__jvalues[pos].l = jenv.NewGlobalRef(val.handle)  # noqa: E741
+                self.__jvalues[pos].l = self.__reference(jvm, jenv, val)  # noqa: E741
             self.__jtypes[pos]    = EJavaType.OBJECT
 
     def setArray(self, pos: int, val: JArray | None):
 
+        self.__checkScope()
         with self.jvm as (jvm, jenv):
             if val is None:
                 self.__jvalues[pos].l = jni.NULL  # noqa: E741
             else:
                 if not isinstance(val, self.jvm.JArray):
                     raise TypeError(f"JArray expected instead of {type(val)}")
-                self.__jvalues[pos].l = jenv.NewGlobalRef(val.handle)  # noqa: E741
+                self.__jvalues[pos].l = self.__reference(jvm, jenv, val)  # noqa: E741
             self.__jtypes[pos]    = EJavaType.ARRAY
 
 
-from .jclass  import JClass   # noqa: E402
-from .jobject import JObject  # noqa: E402
-from .jarray  import JArray   # noqa: E402
+from .jobjectbase import JObjectBase  # noqa: E402
+from .jclass      import JClass       # noqa: E402
+from .jobject     import JObject      # noqa: E402
+from .jarray      import JArray       # noqa: E402
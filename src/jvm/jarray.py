@@ -4,19 +4,26 @@
 
 from __future__ import annotations
 
-from typing import Sequence, NamedTuple
+from typing import List, Sequence, NamedTuple
 import sys
 import math
+import struct
+import array
+import ctypes
+import weakref
+import gc
 
 import jni
 from .lib import public
+from .lib import obj
 from .lib import cached
 from .lib import memoryview as memview
+from .lib import platform
 
 from .jframe      import JFrame
 from .jstring     import JString
 from .jobjectbase import JObjectBase
-from ._util       import str2jchars
+from ._util       import str2jchars, address
 
 def bitsof(x):  return (int(math.log(x, 2)) + 1)
 def bytesof(x): return (int(math.log(x, 2)) + 8) // 8
@@ -31,6 +38,82 @@ class JArrayBuffer(NamedTuple):
     is_copy: bool
 
 
+class JArrayCritical(obj):
+    """Critical (zero-copy) access to the elements of a primitive Java array.
+
+    Entering the context pins the array by GetPrimitiveArrayCritical and
+    returns its elements as a memoryview (of the same format as the
+    corresponding get<Type>Buffer); exiting releases both. Inside the context
+    no other JNI call may be made and the thread must not block.
+    The views of the elements (slices, NumPy arrays, ...) must not outlive
+    the context: the array is released nonetheless (its changes discarded
+    if it was copied) and BufferError is raised.
+    """
+
+    __slots__ = ('__jarr', '__readonly', '__jenv', '__carr', '__buf', '__cbuf', 'is_copy')
+
+    def __init__(self, jarr: JArray, readonly: bool = False):
+        """Initializer"""
+        self.__jarr     = jarr
+        self.__readonly = readonly
+        self.__jenv     = None
+        self.__carr     = None
+        self.__buf      = None
+        self.__cbuf     = None
+        self.is_copy    = None
+
+    def __enter__(self) -> memoryview:
+        """Enter context"""
+        with self.__jarr.jvm as (jvm, jenv):
+            jarr = self.__jarr.handle
+            fmt = JArray._buffer_formats.get(self.__jarr._getComponentCode())
+            if fmt is None:
+                raise TypeError("Critical access is only possible to primitive arrays")
+            itemsize = struct.calcsize(fmt)
+            size = len(self.__jarr)
+            is_copy = jni.obj(jni.jboolean)
+            carr = jenv.GetPrimitiveArrayCritical(jarr, is_copy)
+            try:
+                if size and not address(carr):
+                    raise MemoryError("Unable to get the critical array")
+                cbuf = (ctypes.c_ubyte * (size * itemsize)).from_address(address(carr))
+                buf = memoryview(cbuf).cast("B").cast(fmt)
+            except Exception as exc:
+                jenv.ReleasePrimitiveArrayCritical(jarr, carr, jni.JNI_ABORT)
+                raise exc
+            self.__jenv = jenv
+            self.__carr = carr
+            self.is_copy = bool(is_copy)
+            self.__buf = buf.toreadonly() if self.__readonly else buf
+            # The ctypes array is held only by the views of the elements
+            # (all of them share its buffer), so it is alive while any is.
+            self.__cbuf = weakref.ref(cbuf)
+            return self.__buf
+
+    def __exit__(self, exc_type, exc, exc_tb):
+        """Exit context"""
+        del exc_type, exc_tb
+        if self.__carr is None: return
+        buf,  self.__buf  = self.__buf,  None
+        cbuf, self.__cbuf = self.__cbuf, None
+        try:
+            buf.release()  # fails under the exports of buf (e.g. NumPy arrays)
+        except BufferError:
+            exported = True
+        else:
+            del buf
+            if cbuf() is not None and not platform.is_cpython: gc.collect()
+            exported = cbuf() is not None  # other views (e.g. slices)
+        carr, self.__carr = self.__carr, None
+        jenv, self.__jenv = self.__jenv, None
+        jenv.ReleasePrimitiveArrayCritical(self.__jarr.handle, carr,
+                                           jni.JNI_ABORT
+                                           if self.__readonly or exc or exported else 0)
+        if exported:
+            raise BufferError("The elements of the critical array were still exported "
+                              "at the exit (the views outliving the context are invalid)")
+
+
 @public
 class JArray(JObjectBase):
     """Java Array"""
@@ -40,6 +123,17 @@ class JArray(JObjectBase):
     _jbyte_equiv_byte    = (jni.sizeof(jni.jbyte) == 1)
     _jchar_equiv_unicode = (jni.sizeof(jni.jchar) == bytesof(sys.maxunicode))
 
+    # buffer (struct) formats of the elements of primitive arrays
+    _buffer_formats = dict(Z="B", C="H", B="b", S="h", I="i", J="q", F="f", D="d")
+    # NumPy dtypes of the elements of primitive arrays
+    _numpy_dtypes = dict(Z="bool", C="uint16", B="int8", S="int16",
+                         I="int32", J="int64", F="float32", D="float64")
+    # JNI names and types of the elements of primitive arrays
+    _array_types = dict(Z=("Boolean", jni.jboolean), C=("Char",   jni.jchar),
+                        B=("Byte",    jni.jbyte),    S=("Short",  jni.jshort),
+                        I=("Int",     jni.jint),     J=("Long",   jni.jlong),
+                        F=("Float",   jni.jfloat),   D=("Double", jni.jdouble))
+
     @staticmethod
     def size(start, stop, step=1):
         return max(0, (stop + step - (1 if step >= 0 else -1) - start) // step)
@@ -114,6 +208,45 @@ class JArray(JObjectBase):
             jarr = jenv.NewObjectArray(size, jni.cast(componentClass.handle, jni.jclass))
             return cls.jvm.JArray(jenv, jarr)
 
+    @classmethod
+    def newFromNumpy(cls, ndarray) -> JArray:
+        """New primitive array (or array of primitive arrays for 2-D) from a NumPy array.
+
+        The dtype of the ndarray determines the type of the Java array
+        (bool: boolean[], uint16: char[], int8: byte[], int16: short[],
+        int32: int[], int64: long[], float32: float[], float64: double[]).
+        """
+        import numpy
+        ndarray = numpy.ascontiguousarray(ndarray)
+        for code, dtype in JArray._numpy_dtypes.items():
+            if ndarray.dtype == numpy.dtype(dtype):
+                break
+        else:
+            raise TypeError(f"Unsupported dtype of the ndarray: {ndarray.dtype}")
+        if ndarray.ndim not in (1, 2):
+            raise ValueError("Only 1-D and 2-D ndarrays can be converted to Java arrays")
+        name, ctype = JArray._array_types[code]
+        with cls.jvm as (jvm, jenv), JFrame(jenv, 2):
+            NewArray       = getattr(jenv, f"New{name}Array")
+            SetArrayRegion = getattr(jenv, f"Set{name}ArrayRegion")
+            ptype = jni.POINTER(ctype)
+            if ndarray.ndim == 1:
+                size = len(ndarray)
+                jarr = NewArray(size)
+                if size:
+                    SetArrayRegion(jarr, 0, size, jni.cast(ndarray.ctypes.data, ptype))
+            else:
+                nrows, ncols = ndarray.shape
+                row_class = getattr(jvm.java_array, f"{name}Array1Class")
+                jarr = jenv.NewObjectArray(nrows, row_class)
+                for idx in range(nrows):
+                    jrow = NewArray(ncols)
+                    if ncols:
+                        SetArrayRegion(jrow, 0, ncols, jni.cast(ndarray[idx].ctypes.data, ptype))
+                    jenv.SetObjectArrayElement(jarr, idx, jrow)
+                    jenv.DeleteLocalRef(jrow)
+            return cls.jvm.JArray(jenv, jarr)
+
     def __init__(self, jenv: jni.JNIEnv, jarr: jni.jarray, own: bool = True):
         """Initializer"""
         super().__init__(jenv, jni.cast(jarr, jni.jarray), own=own)
@@ -130,10 +263,7 @@ class JArray(JObjectBase):
         if not isinstance(other, self.jvm.JArray):
             return NotImplemented
 
-        if len(self) != len(other):
-            return False
-
-        return NotImplemented
+        return super().__eq__(other)
 
     def __len__(self):
         """Length of"""
@@ -144,6 +274,23 @@ class JArray(JObjectBase):
         with self.jvm as (jvm, jenv):
             return self.jvm.JObject(jenv, self._jobj, own=own)
 
+    @cached
+    def _getComponentCode(self) -> str | None:
+        # JNI type signature of the elements of a primitive array, else None.
+        with self.jvm as (jvm, jenv):
+            java_array = jvm.java_array
+            for code, jcls in (("Z", java_array.BooleanArray1Class),
+                               ("C", java_array.CharArray1Class),
+                               ("B", java_array.ByteArray1Class),
+                               ("S", java_array.ShortArray1Class),
+                               ("I", java_array.IntArray1Class),
+                               ("J", java_array.LongArray1Class),
+                               ("F", java_array.FloatArray1Class),
+                               ("D", java_array.DoubleArray1Class)):
+                if jenv.IsInstanceOf(self._jobj, jcls):
+                    return code
+            return None
+
     @cached
     def getLength(self) -> int:
         """???."""
@@ -295,21 +442,10 @@ class JArray(JObjectBase):
             size = JArray.size(start, stop, step)
             jarr = self._jobj
             jarr_ret = jenv.NewBooleanArray(size)
-            jels_ret = jenv.GetBooleanArrayElements(jarr_ret)
-            try:
-                if step == 1:
-                    jenv.GetBooleanArrayRegion(jarr, start, size, jels_ret)
-                else:
-                    jels = jenv.GetBooleanArrayElements(jarr)
-                    try:
-                        for ix, idx in enumerate(range(start, stop, step)):
-                            jels_ret[ix] = jels[idx]
-                    finally:
-                        jenv.ReleaseBooleanArrayElements(jarr, jels, jni.JNI_ABORT)
-                jenv.ReleaseBooleanArrayElements(jarr_ret, jels_ret)
-            except Exception as exc:
-                jenv.ReleaseBooleanArrayElements(jarr_ret, jels_ret, jni.JNI_ABORT)
-                raise exc
+            if size:
+                jbuf = JArray._getRegion(jenv, jarr, "Z", start, step, size)
+                jels = jni.cast(jni.from_buffer(jbuf), jni.POINTER(jni.jboolean))
+                jenv.SetBooleanArrayRegion(jarr_ret, 0, size, jels)
             return self.jvm.JArray(jenv, jarr_ret)
 
     def getCharSlice(self, start: int, stop: int, step: int) -> JArray:
@@ -318,21 +454,10 @@ class JArray(JObjectBase):
             size = JArray.size(start, stop, step)
             jarr = self._jobj
             jarr_ret = jenv.NewCharArray(size)
-            jels_ret = jenv.GetCharArrayElements(jarr_ret)
-            try:
-                if step == 1:
-                    jenv.GetCharArrayRegion(jarr, start, size, jels_ret)
-                else:
-                    jels = jenv.GetCharArrayElements(jarr)
-                    try:
-                        for ix, idx in enumerate(range(start, stop, step)):
-                            jels_ret[ix] = jels[idx]
-                    finally:
-                        jenv.ReleaseCharArrayElements(jarr, jels, jni.JNI_ABORT)
-                jenv.ReleaseCharArrayElements(jarr_ret, jels_ret)
-            except Exception as exc:
-                jenv.ReleaseCharArrayElements(jarr_ret, jels_ret, jni.JNI_ABORT)
-                raise exc
+            if size:
+                jbuf = JArray._getRegion(jenv, jarr, "C", start, step, size)
+                jels = jni.cast(jni.from_buffer(jbuf), jni.POINTER(jni.jchar))
+                jenv.SetCharArrayRegion(jarr_ret, 0, size, jels)
             return self.jvm.JArray(jenv, jarr_ret)
 
     def getByteSlice(self, start: int, stop: int, step: int) -> JArray:
@@ -341,21 +466,10 @@ class JArray(JObjectBase):
             size = JArray.size(start, stop, step)
             jarr = self._jobj
             jarr_ret = jenv.NewByteArray(size)
-            jels_ret = jenv.GetByteArrayElements(jarr_ret)
-            try:
-                if step == 1:
-                    jenv.GetByteArrayRegion(jarr, start, size, jels_ret)
-                else:
-                    jels = jenv.GetByteArrayElements(jarr)
-                    try:
-                        for ix, idx in enumerate(range(start, stop, step)):
-                            jels_ret[ix] = jels[idx]
-                    finally:
-                        jenv.ReleaseByteArrayElements(jarr, jels, jni.JNI_ABORT)
-                jenv.ReleaseByteArrayElements(jarr_ret, jels_ret)
-            except Exception as exc:
-                jenv.ReleaseByteArrayElements(jarr_ret, jels_ret, jni.JNI_ABORT)
-                raise exc
+            if size:
+                jbuf = JArray._getRegion(jenv, jarr, "B", start, step, size)
+                jels = jni.cast(jni.from_buffer(jbuf), jni.POINTER(jni.jbyte))
+                jenv.SetByteArrayRegion(jarr_ret, 0, size, jels)
             return self.jvm.JArray(jenv, jarr_ret)
 
     def getShortSlice(self, start: int, stop: int, step: int) -> JArray:
@@ -364,21 +478,10 @@ class JArray(JObjectBase):
             size = JArray.size(start, stop, step)
             jarr = self._jobj
             jarr_ret = jenv.NewShortArray(size)
-            jels_ret = jenv.GetShortArrayElements(jarr_ret)
-            try:
-                if step == 1:
-                    jenv.GetShortArrayRegion(jarr, start, size, jels_ret)
-                else:
-                    jels = jenv.GetShortArrayElements(jarr)
-                    try:
-                        for ix, idx in enumerate(range(start, stop, step)):
-                            jels_ret[ix] = jels[idx]
-                    finally:
-                        jenv.ReleaseShortArrayElements(jarr, jels, jni.JNI_ABORT)
-                jenv.ReleaseShortArrayElements(jarr_ret, jels_ret)
-            except Exception as exc:
-                jenv.ReleaseShortArrayElements(jarr_ret, jels_ret, jni.JNI_ABORT)
-                raise exc
+            if size:
+                jbuf = JArray._getRegion(jenv, jarr, "S", start, step, size)
+                jels = jni.cast(jni.from_buffer(jbuf), jni.POINTER(jni.jshort))
+                jenv.SetShortArrayRegion(jarr_ret, 0, size, jels)
             return self.jvm.JArray(jenv, jarr_ret)
 
     def getIntSlice(self, start: int, stop: int, step: int) -> JArray:
@@ -387,21 +490,10 @@ class JArray(JObjectBase):
             size = JArray.size(start, stop, step)
             jarr = self._jobj
             jarr_ret = jenv.NewIntArray(size)
-            jels_ret = jenv.GetIntArrayElements(jarr_ret)
-            try:
-                if step == 1:
-                    jenv.GetIntArrayRegion(jarr, start, size, jels_ret)
-                else:
-                    jels = jenv.GetIntArrayElements(jarr)
-                    try:
-                        for ix, idx in enumerate(range(start, stop, step)):
-                            jels_ret[ix] = jels[idx]
-                    finally:
-                        jenv.ReleaseIntArrayElements(jarr, jels, jni.JNI_ABORT)
-                jenv.ReleaseIntArrayElements(jarr_ret, jels_ret)
-            except Exception as exc:
-                jenv.ReleaseIntArrayElements(jarr_ret, jels_ret, jni.JNI_ABORT)
-                raise exc
+            if size:
+                jbuf = JArray._getRegion(jenv, jarr, "I", start, step, size)
+                jels = jni.cast(jni.from_buffer(jbuf), jni.POINTER(jni.jint))
+                jenv.SetIntArrayRegion(jarr_ret, 0, size, jels)
             return self.jvm.JArray(jenv, jarr_ret)
 
     def getLongSlice(self, start: int, stop: int, step: int) -> JArray:
@@ -410,21 +502,10 @@ class JArray(JObjectBase):
             size = JArray.size(start, stop, step)
             jarr = self._jobj
             jarr_ret = jenv.NewLongArray(size)
-            jels_ret = jenv.GetLongArrayElements(jarr_ret)
-            try:
-                if step == 1:
-                    jenv.GetLongArrayRegion(jarr, start, size, jels_ret)
-                else:
-                    jels = jenv.GetLongArrayElements(jarr)
-                    try:
-                        for ix, idx in enumerate(range(start, stop, step)):
-                            jels_ret[ix] = jels[idx]
-                    finally:
-                        jenv.ReleaseLongArrayElements(jarr, jels, jni.JNI_ABORT)
-                jenv.ReleaseLongArrayElements(jarr_ret, jels_ret)
-            except Exception as exc:
-                jenv.ReleaseLongArrayElements(jarr_ret, jels_ret, jni.JNI_ABORT)
-                raise exc
+            if size:
+                jbuf = JArray._getRegion(jenv, jarr, "J", start, step, size)
+                jels = jni.cast(jni.from_buffer(jbuf), jni.POINTER(jni.jlong))
+                jenv.SetLongArrayRegion(jarr_ret, 0, size, jels)
             return self.jvm.JArray(jenv, jarr_ret)
 
     def getFloatSlice(self, start: int, stop: int, step: int) -> JArray:
@@ -433,21 +514,10 @@ class JArray(JObjectBase):
             size = JArray.size(start, stop, step)
             jarr = self._jobj
             jarr_ret = jenv.NewFloatArray(size)
-            jels_ret = jenv.GetFloatArrayElements(jarr_ret)
-            try:
-                if step == 1:
-                    jenv.GetFloatArrayRegion(jarr, start, size, jels_ret)
-                else:
-                    jels = jenv.GetFloatArrayElements(jarr)
-                    try:
-                        for ix, idx in enumerate(range(start, stop, step)):
-                            jels_ret[ix] = jels[idx]
-                    finally:
-                        jenv.ReleaseFloatArrayElements(jarr, jels, jni.JNI_ABORT)
-                jenv.ReleaseFloatArrayElements(jarr_ret, jels_ret)
-            except Exception as exc:
-                jenv.ReleaseFloatArrayElements(jarr_ret, jels_ret, jni.JNI_ABORT)
-                raise exc
+            if size:
+                jbuf = JArray._getRegion(jenv, jarr, "F", start, step, size)
+                jels = jni.cast(jni.from_buffer(jbuf), jni.POINTER(jni.jfloat))
+                jenv.SetFloatArrayRegion(jarr_ret, 0, size, jels)
             return self.jvm.JArray(jenv, jarr_ret)
 
     def getDoubleSlice(self, start: int, stop: int, step: int) -> JArray:
@@ -456,21 +526,10 @@ class JArray(JObjectBase):
             size = JArray.size(start, stop, step)
             jarr = self._jobj
             jarr_ret = jenv.NewDoubleArray(size)
-            jels_ret = jenv.GetDoubleArrayElements(jarr_ret)
-            try:
-                if step == 1:
-                    jenv.GetDoubleArrayRegion(jarr, start, size, jels_ret)
-                else:
-                    jels = jenv.GetDoubleArrayElements(jarr)
-                    try:
-                        for ix, idx in enumerate(range(start, stop, step)):
-                            jels_ret[ix] = jels[idx]
-                    finally:
-                        jenv.ReleaseDoubleArrayElements(jarr, jels, jni.JNI_ABORT)
-                jenv.ReleaseDoubleArrayElements(jarr_ret, jels_ret)
-            except Exception as exc:
-                jenv.ReleaseDoubleArrayElements(jarr_ret, jels_ret, jni.JNI_ABORT)
-                raise exc
+            if size:
+                jbuf = JArray._getRegion(jenv, jarr, "D", start, step, size)
+                jels = jni.cast(jni.from_buffer(jbuf), jni.POINTER(jni.jdouble))
+                jenv.SetDoubleArrayRegion(jarr_ret, 0, size, jels)
             return self.jvm.JArray(jenv, jarr_ret)
 
     def getStringSlice(self, start: int, stop: int, step: int) -> JArray:
@@ -479,24 +538,62 @@ class JArray(JObjectBase):
             size = JArray.size(start, stop, step)
             jarr = self._jobj
             jarr_ret = jenv.NewObjectArray(size, jvm.String.Class)
-            with JFrame(jenv) as jfrm:
-                for ix, idx in enumerate(range(start, stop, step)):
-                    if not (ix % 256): jfrm.reset(256)
-                    jobj = jenv.GetObjectArrayElement(jarr, idx)
-                    jenv.SetObjectArrayElement(jarr_ret, ix, jobj)
+            if size:
+                jargs = jni.new_array(jni.jvalue, 4)
+                jargs[0].l = jarr  # noqa: E741
+                jargs[1].i = start
+                jargs[2].i = step
+                jargs[3].l = jarr_ret  # noqa: E741
+                jenv.CallStaticVoidMethod(jvm.jt_lang_ObjectArrays.Class,
+                                          jvm.jt_lang_ObjectArrays.copy, jargs)
             return self.jvm.JArray(jenv, jarr_ret)
 
+    def getStringList(self, start: int, stop: int, step: int) -> List[str | None]:
+        """Converts a slice of a String array to a list of str (or None) in bulk."""
+        with self.jvm as (jvm, jenv), JFrame(jenv, 2):
+            size = JArray.size(start, stop, step)
+            if not size: return []
+            jlengths = jenv.NewIntArray(size)
+            jargs = jni.new_array(jni.jvalue, 4)
+            jargs[0].l = self._jobj  # noqa: E741
+            jargs[1].i = start
+            jargs[2].i = step
+            jargs[3].l = jlengths  # noqa: E741
+            jchars = jni.cast(jenv.CallStaticObjectMethod(jvm.jt_lang_ObjectArrays.Class,
+                                                          jvm.jt_lang_ObjectArrays.packStrings,
+                                                          jargs), jni.jcharArray)
+            lengths = memoryview(JArray._getRegion(jenv, jlengths, "I", 0, 1, size)).cast("i")
+            total = int(jenv.GetArrayLength(jchars))
+            chars = JArray._getRegion(jenv, jchars, "C", 0, 1, total)
+            text = chars.decode("utf-16-le", "surrogatepass")
+            if len(text) != total:  # surrogate pairs, so decode one by one
+                text = None
+            strings = []
+            pos = 0
+            for length in lengths:
+                if length < 0:
+                    strings.append(None)
+                else:
+                    strings.append(text[pos:pos + length] if text is not None else
+                                   chars[pos * 2:(pos + length) * 2].decode("utf-16-le",
+                                                                            "surrogatepass"))
+                    pos += length
+            return strings
+
     def getObjectSlice(self, start: int, stop: int, step: int) -> JArray:
         """???."""
         with self.jvm as (jvm, jenv), JFrame(jenv, 1):
             size = JArray.size(start, stop, step)
             jarr = self._jobj
             jarr_ret = jenv.NewObjectArray(size, jvm.Object.Class)
-            with JFrame(jenv) as jfrm:
-                for ix, idx in enumerate(range(start, stop, step)):
-                    if not (ix % 256): jfrm.reset(256)
-                    jobj = jenv.GetObjectArrayElement(jarr, idx)
-                    jenv.SetObjectArrayElement(jarr_ret, ix, jobj)
+            if size:
+                jargs = jni.new_array(jni.jvalue, 4)
+                jargs[0].l = jarr  # noqa: E741
+                jargs[1].i = start
+                jargs[2].i = step
+                jargs[3].l = jarr_ret  # noqa: E741
+                jenv.CallStaticVoidMethod(jvm.jt_lang_ObjectArrays.Class,
+                                          jvm.jt_lang_ObjectArrays.copy, jargs)
             return self.jvm.JArray(jenv, jarr_ret)
 
     def setBooleanSlice(self, start: int, stop: int, step: int, val: Sequence[bool]):
@@ -510,14 +607,8 @@ class JArray(JObjectBase):
                                            jni.cast(val, jni.POINTER(jni.jboolean)))
             else:
                 if is_memview(val): val = val.obj
-                jels = jenv.GetBooleanArrayElements(jarr)
-                try:
-                    for ix, idx in enumerate(range(start, stop, step)):
-                        jels[idx] = val[ix]
-                    jenv.ReleaseBooleanArrayElements(jarr, jels)
-                except Exception as exc:
-                    jenv.ReleaseBooleanArrayElements(jarr, jels, jni.JNI_ABORT)
-                    raise exc
+                jbuf = array.array("B", val[:size])
+                JArray._setRegion(jenv, jarr, "Z", start, step, size, jbuf)
 
     def setCharSlice(self, start: int, stop: int, step: int, val: Sequence[str] | str):
         """???."""
@@ -529,19 +620,9 @@ class JArray(JObjectBase):
                 jenv.SetCharArrayRegion(jarr, start, size, jni.cast(val, jni.POINTER(jni.jchar)))
             else:
                 if is_memview(val): val = val.obj
-                jels = jenv.GetCharArrayElements(jarr)
-                try:
-                    if isinstance(val, str) and step == 1 and JArray._jchar_equiv_unicode:
-                        print("UUUUUUUUUUUUUUUUU")
-                        jni.memmove(jni.byref(jels.contents, start * jni.sizeof(jni.jchar)),
-                                    val,  JArray.size(start, stop) * jni.sizeof(jni.jchar))
-                    else:
-                        for ix, idx in enumerate(range(start, stop, step)):
-                            jels[idx] = val[ix]
-                    jenv.ReleaseCharArrayElements(jarr, jels)
-                except Exception as exc:
-                    jenv.ReleaseCharArrayElements(jarr, jels, jni.JNI_ABORT)
-                    raise exc
+                val = val[:size] if isinstance(val, str) else "".join(val[:size])
+                jbuf = val.encode("utf-16-le", "surrogatepass")
+                JArray._setRegion(jenv, jarr, "C", start, step, size, jbuf)
 
     def setByteSlice(self, start: int, stop: int, step: int,
                      val: Sequence[int | bytes] | bytes | bytearray):
@@ -554,27 +635,12 @@ class JArray(JObjectBase):
                 jenv.SetByteArrayRegion(jarr, start, size, jni.cast(val, jni.POINTER(jni.jbyte)))
             else:
                 if is_memview(val): val = val.obj
-                jels = jenv.GetByteArrayElements(jarr)
-                try:
-                    if isinstance(val, (bytes, bytearray)):
-                        if step == 1 and JArray._jbyte_equiv_byte:
-                            if isinstance(val, bytearray):
-                                val = jni.from_buffer(val)
-                            # print(("RRRRRRRRRRRRRRRRRR",
-                            #        type(jels), type(jels.contents), type(val)))
-                            jni.memmove(jni.byref(jels.contents, start), val,
-                                        JArray.size(start, stop))
-                        else:
-                            for ix, idx in enumerate(range(start, stop, step)):
-                                jels[idx] = val[ix]
-                    else:
-                        for ix, idx in enumerate(range(start, stop, step)):
-                            v = val[ix]
-                            jels[idx] = v[0] if isinstance(v, bytes) else v
-                    jenv.ReleaseByteArrayElements(jarr, jels)
-                except Exception as exc:
-                    jenv.ReleaseByteArrayElements(jarr, jels, jni.JNI_ABORT)
-                    raise exc
+                if isinstance(val, (bytes, bytearray)):
+                    jbuf = bytes(val[:size])
+                else:
+                    jbuf = bytes((v[0] if isinstance(v, bytes) else v) & 0xFF
+                                 for v in val[:size])
+                JArray._setRegion(jenv, jarr, "B", start, step, size, jbuf)
 
     def setShortSlice(self, start: int, stop: int, step: int, val: Sequence[int]):
         """???."""
@@ -586,14 +652,8 @@ class JArray(JObjectBase):
                 jenv.SetShortArrayRegion(jarr, start, size, jni.cast(val, jni.POINTER(jni.jshort)))
             else:
                 if is_memview(val): val = val.obj
-                jels = jenv.GetShortArrayElements(jarr)
-                try:
-                    for ix, idx in enumerate(range(start, stop, step)):
-                        jels[idx] = val[ix]
-                    jenv.ReleaseShortArrayElements(jarr, jels)
-                except Exception as exc:
-                    jenv.ReleaseShortArrayElements(jarr, jels, jni.JNI_ABORT)
-                    raise exc
+                jbuf = array.array("h", val[:size])
+                JArray._setRegion(jenv, jarr, "S", start, step, size, jbuf)
 
     def setIntSlice(self, start: int, stop: int, step: int, val: Sequence[int]):
         """???."""
@@ -605,14 +665,8 @@ class JArray(JObjectBase):
                 jenv.SetIntArrayRegion(jarr, start, size, jni.cast(val, jni.POINTER(jni.jint)))
             else:
                 if is_memview(val): val = val.obj
-                jels = jenv.GetIntArrayElements(jarr)
-                try:
-                    for ix, idx in enumerate(range(start, stop, step)):
-                        jels[idx] = val[ix]
-                    jenv.ReleaseIntArrayElements(jarr, jels)
-                except Exception as exc:
-                    jenv.ReleaseIntArrayElements(jarr, jels, jni.JNI_ABORT)
-                    raise exc
+                jbuf = array.array("i", val[:size])
+                JArray._setRegion(jenv, jarr, "I", start, step, size, jbuf)
 
     def setLongSlice(self, start: int, stop: int, step: int, val: Sequence[int]):
         """???."""
@@ -624,14 +678,8 @@ class JArray(JObjectBase):
                 jenv.SetLongArrayRegion(jarr, start, size, jni.cast(val, jni.POINTER(jni.jlong)))
             else:
                 if is_memview(val): val = val.obj
-                jels = jenv.GetLongArrayElements(jarr)
-                try:
-                    for ix, idx in enumerate(range(start, stop, step)):
-                        jels[idx] = val[ix]
-                    jenv.ReleaseLongArrayElements(jarr, jels)
-                except Exception as exc:
-                    jenv.ReleaseLongArrayElements(jarr, jels, jni.JNI_ABORT)
-                    raise exc
+                jbuf = array.array("q", val[:size])
+                JArray._setRegion(jenv, jarr, "J", start, step, size, jbuf)
 
     def setFloatSlice(self, start: int, stop: int, step: int, val: Sequence[float]):
         """???."""
@@ -643,14 +691,8 @@ class JArray(JObjectBase):
                 jenv.SetFloatArrayRegion(jarr, start, size, jni.cast(val, jni.POINTER(jni.jfloat)))
             else:
                 if is_memview(val): val = val.obj
-                jels = jenv.GetFloatArrayElements(jarr)
-                try:
-                    for ix, idx in enumerate(range(start, stop, step)):
-                        jels[idx] = val[ix]
-                    jenv.ReleaseFloatArrayElements(jarr, jels)
-                except Exception as exc:
-                    jenv.ReleaseFloatArrayElements(jarr, jels, jni.JNI_ABORT)
-                    raise exc
+                jbuf = array.array("f", val[:size])
+                JArray._setRegion(jenv, jarr, "F", start, step, size, jbuf)
 
     def setDoubleSlice(self, start: int, stop: int, step: int, val: Sequence[float]):
         """???."""
@@ -663,29 +705,37 @@ class JArray(JObjectBase):
                                           jni.cast(val, jni.POINTER(jni.jdouble)))
             else:
                 if is_memview(val): val = val.obj
-                jels = jenv.GetDoubleArrayElements(jarr)
-                try:
-                    for ix, idx in enumerate(range(start, stop, step)):
-                        jels[idx] = val[ix]
-                    jenv.ReleaseDoubleArrayElements(jarr, jels)
-                except Exception as exc:
-                    jenv.ReleaseDoubleArrayElements(jarr, jels, jni.JNI_ABORT)
-                    raise exc
+                jbuf = array.array("d", val[:size])
+                JArray._setRegion(jenv, jarr, "D", start, step, size, jbuf)
 
     def setStringSlice(self, start: int, stop: int, step: int, val: Sequence[str | None]):
         """???."""
-        with self.jvm as (jvm, jenv):
-            jarr = self._jobj
-            with JFrame(jenv) as jfrm:
-                for ix, idx in enumerate(range(start, stop, step)):
-                    if not (ix % 256): jfrm.reset(256)
-                    elem = val[ix]
-                    if elem is None:
-                        jstr = None
-                    else:
-                        jchars, size, jbuf = str2jchars(elem)
-                        jstr = jenv.NewString(jchars, size)
-                    jenv.SetObjectArrayElement(jarr, idx, jstr)
+        with self.jvm as (jvm, jenv), JFrame(jenv, 2):
+            size = JArray.size(start, stop, step)
+            if not size: return
+            # The strings are packed into one char[] (plus their lengths)
+            # and unpacked by a single Java call.
+            strings = [val[ix] for ix in range(size)]
+            lengths = array.array("i", [-1 if elem is None else len(elem) for elem in strings])
+            strings = [elem for elem in strings if elem is not None]
+            chars = "".join(strings).encode("utf-16-le", "surrogatepass")
+            if len(chars) // 2 != sum(len(elem) for elem in strings):
+                # surrogate pairs, so the UTF-16 lengths one by one
+                lengths = array.array("i", [-1 if val[ix] is None else
+                                            len(val[ix].encode("utf-16-le", "surrogatepass")) // 2
+                                            for ix in range(size)])
+            jchars = jenv.NewCharArray(len(chars) // 2)
+            JArray._setRegion(jenv, jchars, "C", 0, 1, len(chars) // 2, chars)
+            jlengths = jenv.NewIntArray(size)
+            JArray._setRegion(jenv, jlengths, "I", 0, 1, size, lengths)
+            jargs = jni.new_array(jni.jvalue, 5)
+            jargs[0].l = jchars  # noqa: E741
+            jargs[1].l = jlengths  # noqa: E741
+            jargs[2].l = self._jobj  # noqa: E741
+            jargs[3].i = start
+            jargs[4].i = step
+            jenv.CallStaticVoidMethod(jvm.jt_lang_ObjectArrays.Class,
+                                      jvm.jt_lang_ObjectArrays.unpackStrings, jargs)
 
     def setObjectSlice(self, start: int, stop: int, step: int, val: Sequence[JObject | None]):
         """???."""
@@ -807,6 +857,167 @@ class JArray(JObjectBase):
                                             0 if mode is None else
                                             jni.JNI_COMMIT if mode else jni.JNI_ABORT)
 
+    def toBuffer(self) -> memoryview:
+        """Copies the elements of a primitive array into a buffer (a memoryview \
+        of the struct format of the elements) by one Get<Type>ArrayRegion."""
+        with self.jvm as (jvm, jenv):
+            code = self._getComponentCode()
+            if code is None:
+                raise TypeError("Only primitive arrays can be converted to buffers")
+            jbuf = JArray._getRegion(jenv, self._jobj, code, 0, 1, len(self))
+            return memoryview(jbuf).cast(JArray._buffer_formats[code])
+
+    def to_numpy(self):
+        """Converts a primitive array (or an array of primitive arrays) to a NumPy array.
+
+        An array of primitive arrays of the same type and length (e.g. double[][])
+        becomes a 2-D ndarray, an array of ragged rows becomes a 1-D ndarray of
+        objects (the rows converted to 1-D ndarrays or None).
+        """
+        import numpy
+        with self.jvm as (jvm, jenv):
+            jarr = self._jobj
+            size = len(self)
+            code = self._getComponentCode()
+            if code is not None:
+                ndarray = numpy.empty(size, dtype=JArray._numpy_dtypes[code])
+                JArray._getRegionInto(jenv, jarr, code, 0, size, ndarray.ctypes.data)
+                return ndarray
+            # An array of primitive arrays: one pass over the rows,
+            # straight into a 2-D ndarray while the rows are uniform.
+            codes = [(code, getattr(jvm.java_array, f"{name}Array1Class"))
+                     for code, (name, _) in JArray._array_types.items()]
+            matrix = None
+            rows = []
+            with JFrame(jenv) as jfrm:
+                for idx in range(size):
+                    if not (idx % 256): jfrm.reset(256)
+                    jrow = jenv.GetObjectArrayElement(jarr, idx)
+                    if not jrow:
+                        if matrix is not None:
+                            rows, matrix = list(matrix[:idx]), None
+                        rows.append(None)
+                        continue
+                    for code, jcls in codes:
+                        if jenv.IsInstanceOf(jrow, jcls):
+                            break
+                    else:
+                        raise TypeError("Only primitive arrays and arrays of primitive "
+                                        "arrays can be converted to NumPy arrays")
+                    dtype = numpy.dtype(JArray._numpy_dtypes[code])
+                    row_size = int(jenv.GetArrayLength(jrow))
+                    if idx == 0:
+                        matrix = numpy.empty((size, row_size), dtype=dtype)
+                    elif matrix is not None and (dtype != matrix.dtype
+                                                 or row_size != matrix.shape[1]):
+                        rows, matrix = list(matrix[:idx]), None
+                    if matrix is not None:
+                        row = matrix[idx]
+                    else:
+                        row = numpy.empty(row_size, dtype=dtype)
+                        rows.append(row)
+                    JArray._getRegionInto(jenv, jrow, code, 0, row_size, row.ctypes.data)
+            if matrix is not None:
+                return matrix
+            ndarray = numpy.empty(len(rows), dtype=object)
+            for idx, row in enumerate(rows):
+                ndarray[idx] = row
+            return ndarray
+
+    @staticmethod
+    def _getRegion(jenv: jni.JNIEnv, jarr: jni.jarray, code: str,
+                   start: int, step: int, size: int) -> bytearray:
+        # The elements start, start+step, ... ('size' of them) of a primitive array.
+        # A strided slice is gathered from bulk region copies of its covering
+        # span (staged in chunks) by strided memoryview copies.
+        name, ctype = JArray._array_types[code]
+        fmt = JArray._buffer_formats[code]
+        itemsize = struct.calcsize(fmt)
+        GetArrayRegion = getattr(jenv, f"Get{name}ArrayRegion")
+        ptype = jni.POINTER(ctype)
+        jbuf = bytearray(size * itemsize)
+        if not size:
+            pass
+        elif step == 1:
+            GetArrayRegion(jarr, start, size, jni.cast(jni.from_buffer(jbuf), ptype))
+        else:
+            dst = memoryview(jbuf).cast(fmt)
+            staging = bytearray(JArray._stagingSpan(step, size) * itemsize)
+            jstaging = jni.cast(jni.from_buffer(staging), ptype)
+            src = memoryview(staging).cast(fmt)
+            for first, count, span, pos in JArray._stagingChunks(start, step, size):
+                GetArrayRegion(jarr, first, span, jstaging)
+                chunk = src[:span:abs(step)]
+                dst[pos:pos + count] = chunk if step > 0 else chunk[::-1]
+        return jbuf
+
+    @staticmethod
+    def _setRegion(jenv: jni.JNIEnv, jarr: jni.jarray, code: str,
+                   start: int, step: int, size: int, jbuf: bytes | bytearray | array.array):
+        # Sets the elements start, start+step, ... ('size' of them) of a primitive
+        # array from the buffer 'jbuf' (of the elements in the buffer format).
+        # A strided slice is scattered into bulk region copies of its covering
+        # span (staged in chunks) by strided memoryview copies.
+        name, ctype = JArray._array_types[code]
+        fmt = JArray._buffer_formats[code]
+        itemsize = struct.calcsize(fmt)
+        src = memoryview(jbuf).cast("B").cast(fmt)
+        if len(src) != size:
+            raise IndexError("Number of values does not match the size of the slice")
+        GetArrayRegion = getattr(jenv, f"Get{name}ArrayRegion")
+        SetArrayRegion = getattr(jenv, f"Set{name}ArrayRegion")
+        ptype = jni.POINTER(ctype)
+        if not size:
+            pass
+        elif step == 1:
+            jels = jni.as_cstr(jbuf) if isinstance(jbuf, bytes) else jni.from_buffer(jbuf)
+            SetArrayRegion(jarr, start, size, jni.cast(jels, ptype))
+        else:
+            staging = bytearray(JArray._stagingSpan(step, size) * itemsize)
+            jstaging = jni.cast(jni.from_buffer(staging), ptype)
+            dst = memoryview(staging).cast(fmt)
+            for first, count, span, pos in JArray._stagingChunks(start, step, size):
+                GetArrayRegion(jarr, first, span, jstaging)
+                chunk = src[pos:pos + count]
+                dst[:span:abs(step)] = chunk if step > 0 else chunk[::-1]
+                SetArrayRegion(jarr, first, span, jstaging)
+
+    # max. number of elements staged at once by the strided slicing
+    _staging_size = 1 << 20
+
+    @staticmethod
+    def _stagingSpan(step: int, size: int) -> int:
+        count = min(size, max(1, JArray._staging_size // abs(step)))
+        return (count - 1) * abs(step) + 1
+
+    @staticmethod
+    def _stagingChunks(start: int, step: int, size: int):
+        # Chunks (first index, number of elements, span, position in the slice)
+        # of a strided slice, in the ascending order of the indices.
+        astep = abs(step)
+        lowest = start if step > 0 else start + (size - 1) * step
+        per_chunk = max(1, JArray._staging_size // astep)
+        for k in range(0, size, per_chunk):
+            count = min(per_chunk, size - k)
+            yield (lowest + k * astep, count, (count - 1) * astep + 1,
+                   k if step > 0 else size - k - count)
+
+    @staticmethod
+    def _getRegionInto(jenv: jni.JNIEnv, jarr: jni.jarray, code: str,
+                       start: int, size: int, addr: int):
+        # Get<Type>ArrayRegion into the memory at the address 'addr'.
+        if not size: return
+        name, ctype = JArray._array_types[code]
+        GetArrayRegion = getattr(jenv, f"Get{name}ArrayRegion")
+        GetArrayRegion(jarr, start, size, jni.cast(addr, jni.POINTER(ctype)))
+
+    def critical(self, readonly: bool = False) -> JArrayCritical:
+        """Critical (zero-copy) access to the elements of a primitive array.
+
+        Usage: with jarr.critical() as buf: ... (buf is a memoryview)
+        """
+        return JArrayCritical(self, readonly)
+
 
 from .jclass  import JClass   # noqa: E402
 from .jobject import JObject  # noqa: E402
@@ -9,6 +9,29 @@ from . import registerClass
 from .jnij import jnij
 
 
+class jt_lang_ObjectArrays(jnij):
+
+    def initialize(self, jenv: jni.JNIEnv):
+        from .org.jt.lang import ObjectArrays
+        registerClass(jenv, "org.jt.lang.ObjectArrays", ObjectArrays)
+        with JFrame(jenv, 1):
+            jcls = jenv.FindClass(b"org/jt/lang/ObjectArrays")
+            self.Class         = jni.cast(jenv.NewGlobalRef(jcls), jni.jclass)
+            self.copy          = jenv.GetStaticMethodID(jcls, b"copy",          b"([Ljava/lang/Object;II[Ljava/lang/Object;)V")
+            self.packStrings   = jenv.GetStaticMethodID(jcls, b"packStrings",   b"([Ljava/lang/Object;II[I)[C")
+            self.unpackStrings = jenv.GetStaticMethodID(jcls, b"unpackStrings", b"([C[I[Ljava/lang/Object;II)V")
+
+class jt_lang_Boxes(jnij):
+
+    def initialize(self, jenv: jni.JNIEnv):
+        from .org.jt.lang import Boxes
+        registerClass(jenv, "org.jt.lang.Boxes", Boxes)
+        with JFrame(jenv, 1):
+            jcls = jenv.FindClass(b"org/jt/lang/Boxes")
+            self.Class = jni.cast(jenv.NewGlobalRef(jcls), jni.jclass)
+            self.box   = jenv.GetStaticMethodID(jcls, b"box",   b"(Ljava/lang/Object;Z)Ljava/lang/Object;")
+            self.unbox = jenv.GetStaticMethodID(jcls, b"unbox", b"(Ljava/lang/Object;C)Ljava/lang/Object;")
+
 class jt_reflect_ProxyHandler(jnij):
 
     def initialize(self, jenv: jni.JNIEnv):
@@ -20,6 +43,28 @@ class jt_reflect_ProxyHandler(jnij):
             self.Constructor = jenv.GetMethodID(jcls, b"<init>",   b"(J)V")
             self.getClass    = jenv.GetMethodID(jcls, b"getClass", b"()Ljava/lang/Class;")
 
+class jt_reflect_ClassInfo(jnij):
+
+    def initialize(self, jenv: jni.JNIEnv):
+        from .org.jt.reflect import ClassInfo
+        registerClass(jenv, "org.jt.reflect.ClassInfo", ClassInfo)
+        with JFrame(jenv, 1):
+            jcls = jenv.FindClass(b"org/jt/reflect/ClassInfo")
+            self.Class    = jni.cast(jenv.NewGlobalRef(jcls), jni.jclass)
+            self.describe = jenv.GetStaticMethodID(jcls, b"describe", b"(Ljava/lang/Class;Z)Ljava/lang/String;")
+
+class jt_reflect_BatchInvoker(jnij):
+
+    def initialize(self, jenv: jni.JNIEnv):
+        from .org.jt.reflect import BatchInvoker
+        registerClass(jenv, "org.jt.reflect.BatchInvoker", BatchInvoker)
+        with JFrame(jenv, 1):
+            jcls = jenv.FindClass(b"org/jt/reflect/BatchInvoker")
+            self.Class   = jni.cast(jenv.NewGlobalRef(jcls), jni.jclass)
+            self.invoke  = jenv.GetStaticMethodID(jcls, b"invoke",  b"(Ljava/lang/Object;Ljava/lang/reflect/Method;[Ljava/lang/Object;)Ljava/lang/Object;")
+            self.get     = jenv.GetStaticMethodID(jcls, b"get",     b"(Ljava/lang/Object;Ljava/lang/reflect/Field;)Ljava/lang/Object;")
+            self.columns = jenv.GetStaticMethodID(jcls, b"columns", b"(Ljava/lang/Object;[Ljava/lang/reflect/Method;)[Ljava/lang/Object;")
+
 class jt_ref_Reference(jnij):
 
     def initialize(self, jenv: jni.JNIEnv):
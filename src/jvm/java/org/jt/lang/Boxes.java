@@ -0,0 +1,138 @@
+// Copyright (c) 2004 Adam Karpierz
+// SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+// Please refer to the accompanying LICENSE file.
+
+package org.jt.lang;
+
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collection;
+
+public final class Boxes
+{
+    private Boxes()
+    {
+    }
+
+    // Boxes the elements of the primitive array into the array of their
+    // wrappers (Integer[] for int[], ...) or into an ArrayList of them.
+    public static Object box(Object array, boolean asList)
+    {
+        Object[] result;
+        if (array instanceof boolean[])
+        {
+            boolean[] values = (boolean[]) array;
+            result = new Boolean[values.length];
+            for (int i = 0; i < values.length; i++) result[i] = Boolean.valueOf(values[i]);
+        }
+        else if (array instanceof char[])
+        {
+            char[] values = (char[]) array;
+            result = new Character[values.length];
+            for (int i = 0; i < values.length; i++) result[i] = Character.valueOf(values[i]);
+        }
+        else if (array instanceof byte[])
+        {
+            byte[] values = (byte[]) array;
+            result = new Byte[values.length];
+            for (int i = 0; i < values.length; i++) result[i] = Byte.valueOf(values[i]);
+        }
+        else if (array instanceof short[])
+        {
+            short[] values = (short[]) array;
+            result = new Short[values.length];
+            for (int i = 0; i < values.length; i++) result[i] = Short.valueOf(values[i]);
+        }
+        else if (array instanceof int[])
+        {
+            int[] values = (int[]) array;
+            result = new Integer[values.length];
+            for (int i = 0; i < values.length; i++) result[i] = Integer.valueOf(values[i]);
+        }
+        else if (array instanceof long[])
+        {
+            long[] values = (long[]) array;
+            result = new Long[values.length];
+            for (int i = 0; i < values.length; i++) result[i] = Long.valueOf(values[i]);
+        }
+        else if (array instanceof float[])
+        {
+            float[] values = (float[]) array;
+            result = new Float[values.length];
+            for (int i = 0; i < values.length; i++) result[i] = Float.valueOf(values[i]);
+        }
+        else if (array instanceof double[])
+        {
+            double[] values = (double[]) array;
+            result = new Double[values.length];
+            for (int i = 0; i < values.length; i++) result[i] = Double.valueOf(values[i]);
+        }
+        else
+        {
+            throw new IllegalArgumentException("Primitive array expected");
+        }
+        return asList ? (Object) new ArrayList(Arrays.asList(result)) : (Object) result;
+    }
+
+    // Unboxes the elements of the array or the collection of wrappers into
+    // a primitive array of the type given by its JNI type code
+    // ('Z', 'C', 'B', 'S', 'I', 'J', 'F' or 'D').
+    public static Object unbox(Object boxes, char code)
+    {
+        Object[] values = (boxes instanceof Collection) ? ((Collection) boxes).toArray()
+                                                        : (Object[]) boxes;
+        switch (code)
+        {
+            case 'Z':
+            {
+                boolean[] result = new boolean[values.length];
+                for (int i = 0; i < values.length; i++) result[i] = ((Boolean) values[i]).booleanValue();
+                return result;
+            }
+            case 'C':
+            {
+                char[] result = new char[values.length];
+                for (int i = 0; i < values.length; i++) result[i] = ((Character) values[i]).charValue();
+                return result;
+            }
+            case 'B':
+            {
+                byte[] result = new byte[values.length];
+                for (int i = 0; i < values.length; i++) result[i] = ((Number) values[i]).byteValue();
+                return result;
+            }
+            case 'S':
+            {
+                short[] result = new short[values.length];
+                for (int i = 0; i < values.length; i++) result[i] = ((Number) values[i]).shortValue();
+                return result;
+            }
+            case 'I':
+            {
+                int[] result = new int[values.length];
+                for (int i = 0; i < values.length; i++) result[i] = ((Number) values[i]).intValue();
+                return result;
+            }
+            case 'J':
+            {
+                long[] result = new long[values.length];
+                for (int i = 0; i < values.length; i++) result[i] = ((Number) values[i]).longValue();
+                return result;
+            }
+            case 'F':
+            {
+                float[] result = new float[values.length];
+                for (int i = 0; i < values.length; i++) result[i] = ((Number) values[i]).floatValue();
+                return result;
+            }
+            case 'D':
+            {
+                double[] result = new double[values.length];
+                for (int i = 0; i < values.length; i++) result[i] = ((Number) values[i]).doubleValue();
+                return result;
+            }
+            default:
+                throw new IllegalArgumentException("Invalid primitive type code: " + code);
+        }
+    }
+}
@@ -0,0 +1,140 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+__javacode__ = bytearray(  # Auto-generated; DO NOT EDIT!
+    b"\xca\xfe\xba\xbe\x00\x00\x00\x34\x00\x93\x07\x00\x02\x01\x00\x11\x6f\x72\x67\x2f"
+    b"\x6a\x74\x2f\x6c\x61\x6e\x67\x2f\x42\x6f\x78\x65\x73\x07\x00\x04\x01\x00\x10\x6a"
+    b"\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x01\x00\x06\x3c\x69"
+    b"\x6e\x69\x74\x3e\x01\x00\x03\x28\x29\x56\x01\x00\x04\x43\x6f\x64\x65\x0a\x00\x03"
+    b"\x00\x09\x0c\x00\x05\x00\x06\x01\x00\x03\x62\x6f\x78\x01\x00\x27\x28\x4c\x6a\x61"
+    b"\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x5a\x29\x4c\x6a\x61"
+    b"\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x07\x00\x0d\x01\x00"
+    b"\x02\x5b\x5a\x07\x00\x0f\x01\x00\x11\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x42"
+    b"\x6f\x6f\x6c\x65\x61\x6e\x0a\x00\x0e\x00\x11\x0c\x00\x12\x00\x13\x01\x00\x07\x76"
+    b"\x61\x6c\x75\x65\x4f\x66\x01\x00\x16\x28\x5a\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61"
+    b"\x6e\x67\x2f\x42\x6f\x6f\x6c\x65\x61\x6e\x3b\x07\x00\x15\x01\x00\x02\x5b\x43\x07"
+    b"\x00\x17\x01\x00\x13\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x43\x68\x61\x72\x61"
+    b"\x63\x74\x65\x72\x0a\x00\x16\x00\x19\x0c\x00\x12\x00\x1a\x01\x00\x18\x28\x43\x29"
+    b"\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x43\x68\x61\x72\x61\x63\x74\x65\x72"
+    b"\x3b\x07\x00\x1c\x01\x00\x02\x5b\x42\x07\x00\x1e\x01\x00\x0e\x6a\x61\x76\x61\x2f"
+    b"\x6c\x61\x6e\x67\x2f\x42\x79\x74\x65\x0a\x00\x1d\x00\x20\x0c\x00\x12\x00\x21\x01"
+    b"\x00\x13\x28\x42\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x42\x79\x74\x65"
+    b"\x3b\x07\x00\x23\x01\x00\x02\x5b\x53\x07\x00\x25\x01\x00\x0f\x6a\x61\x76\x61\x2f"
+    b"\x6c\x61\x6e\x67\x2f\x53\x68\x6f\x72\x74\x0a\x00\x24\x00\x27\x0c\x00\x12\x00\x28"
+    b"\x01\x00\x14\x28\x53\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x68\x6f"
+    b"\x72\x74\x3b\x07\x00\x2a\x01\x00\x02\x5b\x49\x07\x00\x2c\x01\x00\x11\x6a\x61\x76"
+    b"\x61\x2f\x6c\x61\x6e\x67\x2f\x49\x6e\x74\x65\x67\x65\x72\x0a\x00\x2b\x00\x2e\x0c"
+    b"\x00\x12\x00\x2f\x01\x00\x16\x28\x49\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67"
+    b"\x2f\x49\x6e\x74\x65\x67\x65\x72\x3b\x07\x00\x31\x01\x00\x02\x5b\x4a\x07\x00\x33"
+    b"\x01\x00\x0e\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4c\x6f\x6e\x67\x0a\x00\x32"
+    b"\x00\x35\x0c\x00\x12\x00\x36\x01\x00\x13\x28\x4a\x29\x4c\x6a\x61\x76\x61\x2f\x6c"
+    b"\x61\x6e\x67\x2f\x4c\x6f\x6e\x67\x3b\x07\x00\x38\x01\x00\x02\x5b\x46\x07\x00\x3a"
+    b"\x01\x00\x0f\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x46\x6c\x6f\x61\x74\x0a\x00"
+    b"\x39\x00\x3c\x0c\x00\x12\x00\x3d\x01\x00\x14\x28\x46\x29\x4c\x6a\x61\x76\x61\x2f"
+    b"\x6c\x61\x6e\x67\x2f\x46\x6c\x6f\x61\x74\x3b\x07\x00\x3f\x01\x00\x02\x5b\x44\x07"
+    b"\x00\x41\x01\x00\x10\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x44\x6f\x75\x62\x6c"
+    b"\x65\x0a\x00\x40\x00\x43\x0c\x00\x12\x00\x44\x01\x00\x15\x28\x44\x29\x4c\x6a\x61"
+    b"\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x44\x6f\x75\x62\x6c\x65\x3b\x07\x00\x46\x01\x00"
+    b"\x22\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x49\x6c\x6c\x65\x67\x61\x6c\x41\x72"
+    b"\x67\x75\x6d\x65\x6e\x74\x45\x78\x63\x65\x70\x74\x69\x6f\x6e\x08\x00\x48\x01\x00"
+    b"\x18\x50\x72\x69\x6d\x69\x74\x69\x76\x65\x20\x61\x72\x72\x61\x79\x20\x65\x78\x70"
+    b"\x65\x63\x74\x65\x64\x0a\x00\x45\x00\x4a\x0c\x00\x05\x00\x4b\x01\x00\x15\x28\x4c"
+    b"\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x3b\x29\x56\x07"
+    b"\x00\x4d\x01\x00\x13\x6a\x61\x76\x61\x2f\x75\x74\x69\x6c\x2f\x41\x72\x72\x61\x79"
+    b"\x4c\x69\x73\x74\x0a\x00\x4f\x00\x51\x07\x00\x50\x01\x00\x10\x6a\x61\x76\x61\x2f"
+    b"\x75\x74\x69\x6c\x2f\x41\x72\x72\x61\x79\x73\x0c\x00\x52\x00\x53\x01\x00\x06\x61"
+    b"\x73\x4c\x69\x73\x74\x01\x00\x25\x28\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67"
+    b"\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x29\x4c\x6a\x61\x76\x61\x2f\x75\x74\x69\x6c\x2f"
+    b"\x4c\x69\x73\x74\x3b\x0a\x00\x4c\x00\x55\x0c\x00\x05\x00\x56\x01\x00\x19\x28\x4c"
+    b"\x6a\x61\x76\x61\x2f\x75\x74\x69\x6c\x2f\x43\x6f\x6c\x6c\x65\x63\x74\x69\x6f\x6e"
+    b"\x3b\x29\x56\x01\x00\x0d\x53\x74\x61\x63\x6b\x4d\x61\x70\x54\x61\x62\x6c\x65\x07"
+    b"\x00\x59\x01\x00\x13\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a"
+    b"\x65\x63\x74\x3b\x07\x00\x5b\x01\x00\x13\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f"
+    b"\x43\x6c\x6f\x6e\x65\x61\x62\x6c\x65\x01\x00\x05\x75\x6e\x62\x6f\x78\x01\x00\x27"
+    b"\x28\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x43"
+    b"\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x07"
+    b"\x00\x5f\x01\x00\x14\x6a\x61\x76\x61\x2f\x75\x74\x69\x6c\x2f\x43\x6f\x6c\x6c\x65"
+    b"\x63\x74\x69\x6f\x6e\x0b\x00\x5e\x00\x61\x0c\x00\x62\x00\x63\x01\x00\x07\x74\x6f"
+    b"\x41\x72\x72\x61\x79\x01\x00\x15\x28\x29\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e"
+    b"\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x0a\x00\x0e\x00\x65\x0c\x00\x66\x00\x67\x01"
+    b"\x00\x0c\x62\x6f\x6f\x6c\x65\x61\x6e\x56\x61\x6c\x75\x65\x01\x00\x03\x28\x29\x5a"
+    b"\x0a\x00\x16\x00\x69\x0c\x00\x6a\x00\x6b\x01\x00\x09\x63\x68\x61\x72\x56\x61\x6c"
+    b"\x75\x65\x01\x00\x03\x28\x29\x43\x07\x00\x6d\x01\x00\x10\x6a\x61\x76\x61\x2f\x6c"
+    b"\x61\x6e\x67\x2f\x4e\x75\x6d\x62\x65\x72\x0a\x00\x6c\x00\x6f\x0c\x00\x70\x00\x71"
+    b"\x01\x00\x09\x62\x79\x74\x65\x56\x61\x6c\x75\x65\x01\x00\x03\x28\x29\x42\x0a\x00"
+    b"\x6c\x00\x73\x0c\x00\x74\x00\x75\x01\x00\x0a\x73\x68\x6f\x72\x74\x56\x61\x6c\x75"
+    b"\x65\x01\x00\x03\x28\x29\x53\x0a\x00\x6c\x00\x77\x0c\x00\x78\x00\x79\x01\x00\x08"
+    b"\x69\x6e\x74\x56\x61\x6c\x75\x65\x01\x00\x03\x28\x29\x49\x0a\x00\x6c\x00\x7b\x0c"
+    b"\x00\x7c\x00\x7d\x01\x00\x09\x6c\x6f\x6e\x67\x56\x61\x6c\x75\x65\x01\x00\x03\x28"
+    b"\x29\x4a\x0a\x00\x6c\x00\x7f\x0c\x00\x80\x00\x81\x01\x00\x0a\x66\x6c\x6f\x61\x74"
+    b"\x56\x61\x6c\x75\x65\x01\x00\x03\x28\x29\x46\x0a\x00\x6c\x00\x83\x0c\x00\x84\x00"
+    b"\x85\x01\x00\x0b\x64\x6f\x75\x62\x6c\x65\x56\x61\x6c\x75\x65\x01\x00\x03\x28\x29"
+    b"\x44\x07\x00\x87\x01\x00\x17\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72"
+    b"\x69\x6e\x67\x42\x75\x69\x6c\x64\x65\x72\x08\x00\x89\x01\x00\x1d\x49\x6e\x76\x61"
+    b"\x6c\x69\x64\x20\x70\x72\x69\x6d\x69\x74\x69\x76\x65\x20\x74\x79\x70\x65\x20\x63"
+    b"\x6f\x64\x65\x3a\x20\x0a\x00\x86\x00\x4a\x0a\x00\x86\x00\x8c\x0c\x00\x8d\x00\x8e"
+    b"\x01\x00\x06\x61\x70\x70\x65\x6e\x64\x01\x00\x1c\x28\x43\x29\x4c\x6a\x61\x76\x61"
+    b"\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x42\x75\x69\x6c\x64\x65\x72\x3b"
+    b"\x0a\x00\x86\x00\x90\x0c\x00\x91\x00\x92\x01\x00\x08\x74\x6f\x53\x74\x72\x69\x6e"
+    b"\x67\x01\x00\x14\x28\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72"
+    b"\x69\x6e\x67\x3b\x00\x31\x00\x01\x00\x03\x00\x00\x00\x00\x00\x03\x00\x02\x00\x05"
+    b"\x00\x06\x00\x01\x00\x07\x00\x00\x00\x11\x00\x01\x00\x01\x00\x00\x00\x05\x2a\xb7"
+    b"\x00\x08\xb1\x00\x00\x00\x00\x00\x09\x00\x0a\x00\x0b\x00\x01\x00\x07\x00\x00\x02"
+    b"\x2d\x00\x04\x00\x05\x00\x00\x01\x9e\x2a\xc1\x00\x0c\x99\x00\x2c\x2a\xc0\x00\x0c"
+    b"\x4e\x2d\xbe\xbd\x00\x0e\x4d\x03\x36\x04\xa7\x00\x11\x2c\x15\x04\x2d\x15\x04\x33"
+    b"\xb8\x00\x10\x53\x84\x04\x01\x15\x04\x2d\xbe\xa1\xff\xee\xa7\x01\x5d\x2a\xc1\x00"
+    b"\x14\x99\x00\x2c\x2a\xc0\x00\x14\x4e\x2d\xbe\xbd\x00\x16\x4d\x03\x36\x04\xa7\x00"
+    b"\x11\x2c\x15\x04\x2d\x15\x04\x34\xb8\x00\x18\x53\x84\x04\x01\x15\x04\x2d\xbe\xa1"
+    b"\xff\xee\xa7\x01\x2d\x2a\xc1\x00\x1b\x99\x00\x2c\x2a\xc0\x00\x1b\x4e\x2d\xbe\xbd"
+    b"\x00\x1d\x4d\x03\x36\x04\xa7\x00\x11\x2c\x15\x04\x2d\x15\x04\x33\xb8\x00\x1f\x53"
+    b"\x84\x04\x01\x15\x04\x2d\xbe\xa1\xff\xee\xa7\x00\xfd\x2a\xc1\x00\x22\x99\x00\x2c"
+    b"\x2a\xc0\x00\x22\x4e\x2d\xbe\xbd\x00\x24\x4d\x03\x36\x04\xa7\x00\x11\x2c\x15\x04"
+    b"\x2d\x15\x04\x35\xb8\x00\x26\x53\x84\x04\x01\x15\x04\x2d\xbe\xa1\xff\xee\xa7\x00"
+    b"\xcd\x2a\xc1\x00\x29\x99\x00\x2c\x2a\xc0\x00\x29\x4e\x2d\xbe\xbd\x00\x2b\x4d\x03"
+    b"\x36\x04\xa7\x00\x11\x2c\x15\x04\x2d\x15\x04\x2e\xb8\x00\x2d\x53\x84\x04\x01\x15"
+    b"\x04\x2d\xbe\xa1\xff\xee\xa7\x00\x9d\x2a\xc1\x00\x30\x99\x00\x2c\x2a\xc0\x00\x30"
+    b"\x4e\x2d\xbe\xbd\x00\x32\x4d\x03\x36\x04\xa7\x00\x11\x2c\x15\x04\x2d\x15\x04\x2f"
+    b"\xb8\x00\x34\x53\x84\x04\x01\x15\x04\x2d\xbe\xa1\xff\xee\xa7\x00\x6d\x2a\xc1\x00"
+    b"\x37\x99\x00\x2c\x2a\xc0\x00\x37\x4e\x2d\xbe\xbd\x00\x39\x4d\x03\x36\x04\xa7\x00"
+    b"\x11\x2c\x15\x04\x2d\x15\x04\x30\xb8\x00\x3b\x53\x84\x04\x01\x15\x04\x2d\xbe\xa1"
+    b"\xff\xee\xa7\x00\x3d\x2a\xc1\x00\x3e\x99\x00\x2c\x2a\xc0\x00\x3e\x4e\x2d\xbe\xbd"
+    b"\x00\x40\x4d\x03\x36\x04\xa7\x00\x11\x2c\x15\x04\x2d\x15\x04\x31\xb8\x00\x42\x53"
+    b"\x84\x04\x01\x15\x04\x2d\xbe\xa1\xff\xee\xa7\x00\x0d\xbb\x00\x45\x59\x12\x47\xb7"
+    b"\x00\x49\xbf\x1b\x99\x00\x11\xbb\x00\x4c\x59\x2c\xb8\x00\x4e\xb7\x00\x54\xa7\x00"
+    b"\x04\x2c\xb0\x00\x00\x00\x01\x00\x57\x00\x00\x00\x7d\x00\x1b\xfe\x00\x18\x07\x00"
+    b"\x58\x07\x00\x0c\x01\x0d\xf8\x00\x09\xfe\x00\x17\x07\x00\x58\x07\x00\x14\x01\x0d"
+    b"\xf8\x00\x09\xfe\x00\x17\x07\x00\x58\x07\x00\x1b\x01\x0d\xf8\x00\x09\xfe\x00\x17"
+    b"\x07\x00\x58\x07\x00\x22\x01\x0d\xf8\x00\x09\xfe\x00\x17\x07\x00\x58\x07\x00\x29"
+    b"\x01\x0d\xf8\x00\x09\xfe\x00\x17\x07\x00\x58\x07\x00\x30\x01\x0d\xf8\x00\x09\xfe"
+    b"\x00\x17\x07\x00\x58\x07\x00\x37\x01\x0d\xf8\x00\x09\xfe\x00\x17\x07\x00\x58\x07"
+    b"\x00\x3e\x01\x0d\xf8\x00\x09\xfc\x00\x09\x07\x00\x58\x11\x40\x07\x00\x5a\x00\x09"
+    b"\x00\x5c\x00\x5d\x00\x01\x00\x07\x00\x00\x02\x1b\x00\x05\x00\x05\x00\x00\x01\xa4"
+    b"\x2a\xc1\x00\x5e\x99\x00\x0f\x2a\xc0\x00\x5e\xb9\x00\x60\x01\x00\xa7\x00\x07\x2a"
+    b"\xc0\x00\x58\x4d\x1b\xab\x00\x00\x00\x00\x01\x73\x00\x00\x00\x08\x00\x00\x00\x42"
+    b"\x00\x00\x00\x95\x00\x00\x00\x43\x00\x00\x00\x70\x00\x00\x00\x44\x00\x00\x01\x4e"
+    b"\x00\x00\x00\x46\x00\x00\x01\x29\x00\x00\x00\x49\x00\x00\x00\xdf\x00\x00\x00\x4a"
+    b"\x00\x00\x01\x04\x00\x00\x00\x53\x00\x00\x00\xba\x00\x00\x00\x5a\x00\x00\x00\x4b"
+    b"\x2c\xbe\xbc\x04\x4e\x03\x36\x04\xa7\x00\x14\x2d\x15\x04\x2c\x15\x04\x32\xc0\x00"
+    b"\x0e\xb6\x00\x64\x54\x84\x04\x01\x15\x04\x2c\xbe\xa1\xff\xeb\x2d\xb0\x2c\xbe\xbc"
+    b"\x05\x4e\x03\x36\x04\xa7\x00\x14\x2d\x15\x04\x2c\x15\x04\x32\xc0\x00\x16\xb6\x00"
+    b"\x68\x55\x84\x04\x01\x15\x04\x2c\xbe\xa1\xff\xeb\x2d\xb0\x2c\xbe\xbc\x08\x4e\x03"
+    b"\x36\x04\xa7\x00\x14\x2d\x15\x04\x2c\x15\x04\x32\xc0\x00\x6c\xb6\x00\x6e\x54\x84"
+    b"\x04\x01\x15\x04\x2c\xbe\xa1\xff\xeb\x2d\xb0\x2c\xbe\xbc\x09\x4e\x03\x36\x04\xa7"
+    b"\x00\x14\x2d\x15\x04\x2c\x15\x04\x32\xc0\x00\x6c\xb6\x00\x72\x56\x84\x04\x01\x15"
+    b"\x04\x2c\xbe\xa1\xff\xeb\x2d\xb0\x2c\xbe\xbc\x0a\x4e\x03\x36\x04\xa7\x00\x14\x2d"
+    b"\x15\x04\x2c\x15\x04\x32\xc0\x00\x6c\xb6\x00\x76\x4f\x84\x04\x01\x15\x04\x2c\xbe"
+    b"\xa1\xff\xeb\x2d\xb0\x2c\xbe\xbc\x0b\x4e\x03\x36\x04\xa7\x00\x14\x2d\x15\x04\x2c"
+    b"\x15\x04\x32\xc0\x00\x6c\xb6\x00\x7a\x50\x84\x04\x01\x15\x04\x2c\xbe\xa1\xff\xeb"
+    b"\x2d\xb0\x2c\xbe\xbc\x06\x4e\x03\x36\x04\xa7\x00\x14\x2d\x15\x04\x2c\x15\x04\x32"
+    b"\xc0\x00\x6c\xb6\x00\x7e\x51\x84\x04\x01\x15\x04\x2c\xbe\xa1\xff\xeb\x2d\xb0\x2c"
+    b"\xbe\xbc\x07\x4e\x03\x36\x04\xa7\x00\x14\x2d\x15\x04\x2c\x15\x04\x32\xc0\x00\x6c"
+    b"\xb6\x00\x82\x52\x84\x04\x01\x15\x04\x2c\xbe\xa1\xff\xeb\x2d\xb0\xbb\x00\x45\x59"
+    b"\xbb\x00\x86\x59\x12\x88\xb7\x00\x8a\x1b\xb6\x00\x8b\xb6\x00\x8f\xb7\x00\x49\xbf"
+    b"\x00\x00\x00\x01\x00\x57\x00\x00\x00\x65\x00\x1b\x13\x43\x07\x00\x58\xfc\x00\x4c"
+    b"\x07\x00\x58\xfd\x00\x0a\x07\x00\x0c\x01\x10\xf9\x00\x08\xfd\x00\x0a\x07\x00\x14"
+    b"\x01\x10\xf9\x00\x08\xfd\x00\x0a\x07\x00\x1b\x01\x10\xf9\x00\x08\xfd\x00\x0a\x07"
+    b"\x00\x22\x01\x10\xf9\x00\x08\xfd\x00\x0a\x07\x00\x29\x01\x10\xf9\x00\x08\xfd\x00"
+    b"\x0a\x07\x00\x30\x01\x10\xf9\x00\x08\xfd\x00\x0a\x07\x00\x37\x01\x10\xf9\x00\x08"
+    b"\xfd\x00\x0a\x07\x00\x3e\x01\x10\xf9\x00\x08\x00\x00"
+)
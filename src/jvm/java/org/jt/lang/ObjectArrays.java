@@ -0,0 +1,69 @@
+// Copyright (c) 2004 Adam Karpierz
+// SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+// Please refer to the accompanying LICENSE file.
+
+package org.jt.lang;
+
+public final class ObjectArrays
+{
+    private ObjectArrays()
+    {
+    }
+
+    // Copies the elements array[start], array[start + step], ...
+    // into the whole result array.
+    public static void copy(Object[] array, int start, int step, Object[] result)
+    {
+        for (int i = 0, idx = start; i < result.length; i++, idx += step)
+        {
+            result[i] = array[idx];
+        }
+    }
+
+    // Packs the strings array[start], array[start + step], ... (lengths.length of them)
+    // into one char array. The length of every string (or -1 for null) is stored
+    // into the lengths array.
+    public static char[] packStrings(Object[] array, int start, int step, int[] lengths)
+    {
+        String[] strings = new String[lengths.length];
+        int total = 0;
+        for (int i = 0, idx = start; i < strings.length; i++, idx += step)
+        {
+            String string = (String) array[idx];
+            strings[i] = string;
+            lengths[i] = (string != null) ? string.length() : -1;
+            if (string != null) total += lengths[i];
+        }
+        char[] chars = new char[total];
+        int pos = 0;
+        for (int i = 0; i < strings.length; i++)
+        {
+            if (strings[i] != null)
+            {
+                strings[i].getChars(0, lengths[i], chars, pos);
+                pos += lengths[i];
+            }
+        }
+        return chars;
+    }
+
+    // Unpacks the strings packed in the chars array (of the lengths,
+    // -1 for null) into array[start], array[start + step], ...
+    public static void unpackStrings(char[] chars, int[] lengths,
+                                     Object[] array, int start, int step)
+    {
+        int pos = 0;
+        for (int i = 0, idx = start; i < lengths.length; i++, idx += step)
+        {
+            if (lengths[i] < 0)
+            {
+                array[idx] = null;
+            }
+            else
+            {
+                array[idx] = new String(chars, pos, lengths[i]);
+                pos += lengths[i];
+            }
+        }
+    }
+}
@@ -0,0 +1,54 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+__javacode__ = bytearray(  # Auto-generated; DO NOT EDIT!
+    b"\xca\xfe\xba\xbe\x00\x00\x00\x34\x00\x26\x07\x00\x02\x01\x00\x18\x6f\x72\x67\x2f"
+    b"\x6a\x74\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x41\x72\x72\x61\x79\x73"
+    b"\x07\x00\x04\x01\x00\x10\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65"
+    b"\x63\x74\x01\x00\x06\x3c\x69\x6e\x69\x74\x3e\x01\x00\x03\x28\x29\x56\x01\x00\x04"
+    b"\x43\x6f\x64\x65\x0a\x00\x03\x00\x09\x0c\x00\x05\x00\x06\x01\x00\x04\x63\x6f\x70"
+    b"\x79\x01\x00\x2b\x28\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a"
+    b"\x65\x63\x74\x3b\x49\x49\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62"
+    b"\x6a\x65\x63\x74\x3b\x29\x56\x01\x00\x0d\x53\x74\x61\x63\x6b\x4d\x61\x70\x54\x61"
+    b"\x62\x6c\x65\x01\x00\x0b\x70\x61\x63\x6b\x53\x74\x72\x69\x6e\x67\x73\x01\x00\x1b"
+    b"\x28\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b"
+    b"\x49\x49\x5b\x49\x29\x5b\x43\x07\x00\x10\x01\x00\x10\x6a\x61\x76\x61\x2f\x6c\x61"
+    b"\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x0a\x00\x0f\x00\x12\x0c\x00\x13\x00\x14\x01"
+    b"\x00\x06\x6c\x65\x6e\x67\x74\x68\x01\x00\x03\x28\x29\x49\x0a\x00\x0f\x00\x16\x0c"
+    b"\x00\x17\x00\x18\x01\x00\x08\x67\x65\x74\x43\x68\x61\x72\x73\x01\x00\x08\x28\x49"
+    b"\x49\x5b\x43\x49\x29\x56\x07\x00\x1a\x01\x00\x13\x5b\x4c\x6a\x61\x76\x61\x2f\x6c"
+    b"\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x07\x00\x1c\x01\x00\x02\x5b\x49\x07"
+    b"\x00\x1e\x01\x00\x13\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72"
+    b"\x69\x6e\x67\x3b\x07\x00\x20\x01\x00\x02\x5b\x43\x01\x00\x0d\x75\x6e\x70\x61\x63"
+    b"\x6b\x53\x74\x72\x69\x6e\x67\x73\x01\x00\x1c\x28\x5b\x43\x5b\x49\x5b\x4c\x6a\x61"
+    b"\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x49\x49\x29\x56\x0a"
+    b"\x00\x0f\x00\x24\x0c\x00\x05\x00\x25\x01\x00\x07\x28\x5b\x43\x49\x49\x29\x56\x00"
+    b"\x31\x00\x01\x00\x03\x00\x00\x00\x00\x00\x04\x00\x02\x00\x05\x00\x06\x00\x01\x00"
+    b"\x07\x00\x00\x00\x11\x00\x01\x00\x01\x00\x00\x00\x05\x2a\xb7\x00\x08\xb1\x00\x00"
+    b"\x00\x00\x00\x09\x00\x0a\x00\x0b\x00\x01\x00\x07\x00\x00\x00\x3c\x00\x04\x00\x06"
+    b"\x00\x00\x00\x22\x03\x36\x04\x1b\x36\x05\xa7\x00\x14\x2d\x15\x04\x2a\x15\x05\x32"
+    b"\x53\x84\x04\x01\x15\x05\x1c\x60\x36\x05\x15\x04\x2d\xbe\xa1\xff\xeb\xb1\x00\x00"
+    b"\x00\x01\x00\x0c\x00\x00\x00\x08\x00\x02\xfd\x00\x09\x01\x01\x10\x00\x09\x00\x0d"
+    b"\x00\x0e\x00\x01\x00\x07\x00\x00\x01\x13\x00\x05\x00\x09\x00\x00\x00\x93\x2d\xbe"
+    b"\xbd\x00\x0f\x3a\x04\x03\x36\x05\x03\x36\x06\x1b\x36\x07\xa7\x00\x3c\x2a\x15\x07"
+    b"\x32\xc0\x00\x0f\x3a\x08\x19\x04\x15\x06\x19\x08\x53\x2d\x15\x06\x19\x08\xc6\x00"
+    b"\x0b\x19\x08\xb6\x00\x11\xa7\x00\x04\x02\x4f\x19\x08\xc6\x00\x0c\x15\x05\x2d\x15"
+    b"\x06\x2e\x60\x36\x05\x84\x06\x01\x15\x07\x1c\x60\x36\x07\x15\x06\x19\x04\xbe\xa1"
+    b"\xff\xc2\x15\x05\xbc\x05\x3a\x06\x03\x36\x07\x03\x36\x08\xa7\x00\x28\x19\x04\x15"
+    b"\x08\x32\xc6\x00\x1d\x19\x04\x15\x08\x32\x03\x2d\x15\x08\x2e\x19\x06\x15\x07\xb6"
+    b"\x00\x15\x15\x07\x2d\x15\x08\x2e\x60\x36\x07\x84\x08\x01\x15\x08\x19\x04\xbe\xa1"
+    b"\xff\xd6\x19\x06\xb0\x00\x00\x00\x01\x00\x0c\x00\x00\x00\x6e\x00\x08\xff\x00\x13"
+    b"\x00\x08\x07\x00\x19\x01\x01\x07\x00\x1b\x07\x00\x1d\x01\x01\x01\x00\x00\xff\x00"
+    b"\x1f\x00\x09\x07\x00\x19\x01\x01\x07\x00\x1b\x07\x00\x1d\x01\x01\x01\x07\x00\x0f"
+    b"\x00\x02\x07\x00\x1b\x01\xff\x00\x00\x00\x09\x07\x00\x19\x01\x01\x07\x00\x1b\x07"
+    b"\x00\x1d\x01\x01\x01\x07\x00\x0f\x00\x03\x07\x00\x1b\x01\x01\xfa\x00\x0e\x08\xff"
+    b"\x00\x16\x00\x09\x07\x00\x19\x01\x01\x07\x00\x1b\x07\x00\x1d\x01\x07\x00\x1f\x01"
+    b"\x01\x00\x00\x21\x02\x00\x09\x00\x21\x00\x22\x00\x01\x00\x07\x00\x00\x00\x65\x00"
+    b"\x08\x00\x08\x00\x00\x00\x48\x03\x36\x05\x03\x36\x06\x1d\x36\x07\xa7\x00\x37\x2b"
+    b"\x15\x06\x2e\x9c\x00\x0b\x2c\x15\x07\x01\x53\xa7\x00\x1e\x2c\x15\x07\xbb\x00\x0f"
+    b"\x59\x2a\x15\x05\x2b\x15\x06\x2e\xb7\x00\x23\x53\x15\x05\x2b\x15\x06\x2e\x60\x36"
+    b"\x05\x84\x06\x01\x15\x07\x15\x04\x60\x36\x07\x15\x06\x2b\xbe\xa1\xff\xc8\xb1\x00"
+    b"\x00\x00\x01\x00\x0c\x00\x00\x00\x0b\x00\x04\xfe\x00\x0c\x01\x01\x01\x0e\x1a\x09"
+    b"\x00\x00"
+)
@@ -0,0 +1,175 @@
+// Copyright (c) 2004 Adam Karpierz
+// SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+// Please refer to the accompanying LICENSE file.
+
+package org.jt.reflect;
+
+import java.lang.reflect.Array;
+import java.lang.reflect.Field;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.util.ArrayList;
+import java.util.Iterator;
+
+public final class BatchInvoker
+{
+    private BatchInvoker()
+    {
+    }
+
+    // Invokes the method with the arguments on every receiver (of the Object[]
+    // or the Iterable) and returns the array of the results, typed by the return
+    // type of the method (int[] for int, String[] for String, ...; null for void).
+    public static Object invoke(Object receivers, Method method, Object[] args) throws Throwable
+    {
+        Object[] objects = toArray(receivers);
+        Class type = method.getReturnType();
+        Object result = (type == Void.TYPE) ? null : Array.newInstance(type, objects.length);
+        try
+        {
+            for (int i = 0; i < objects.length; i++)
+            {
+                Object value = method.invoke(objects[i], args);
+                if (result != null) store(result, i, value);
+            }
+        }
+        catch (InvocationTargetException exc)
+        {
+            throw exc.getCause();
+        }
+        return result;
+    }
+
+    // Gets the value of the field of every receiver (of the Object[] or the
+    // Iterable) into an array typed by the type of the field.
+    public static Object get(Object receivers, Field field) throws IllegalAccessException
+    {
+        Object[] objects = toArray(receivers);
+        Object result = Array.newInstance(field.getType(), objects.length);
+        for (int i = 0; i < objects.length; i++)
+        {
+            store(result, i, field.get(objects[i]));
+        }
+        return result;
+    }
+
+    // Reads the properties (by their read methods) of every receiver (of the
+    // Object[] or the Iterable) in one pass, into one column per property:
+    // {values, offsets, validity}. The values of a primitive property are
+    // a primitive array, the ones of a wrapper property (Integer, ...) too
+    // (0 for null), the ones of a String property are packed into one char[]
+    // (the string i is values[offsets[i]:offsets[i + 1]]) and the ones of other
+    // properties are an Object[]. The validity bitmap (null for a primitive
+    // property) has the bit (i % 8) of its byte (i / 8) set if the value i
+    // is not null.
+    public static Object[] columns(Object receivers, Method[] getters) throws Throwable
+    {
+        Object[] objects = toArray(receivers);
+        int count = objects.length;
+        int ncolumns = getters.length;
+        Object[]   values   = new Object[ncolumns];
+        byte[][]   validity = new byte[ncolumns][];
+        boolean[]  strings  = new boolean[ncolumns];
+        for (int col = 0; col < ncolumns; col++)
+        {
+            Class type = getters[col].getReturnType();
+            Class primitive = primitiveOf(type);
+            strings[col] = (type == String.class);
+            if (type.isPrimitive())
+                values[col] = Array.newInstance(type, count);
+            else if (primitive != null)
+                values[col] = Array.newInstance(primitive, count);
+            else if (strings[col])
+                values[col] = new String[count];
+            else
+                values[col] = new Object[count];
+            if (!type.isPrimitive()) validity[col] = new byte[(count + 7) / 8];
+        }
+        try
+        {
+            for (int i = 0; i < count; i++)
+            {
+                Object object = objects[i];
+                for (int col = 0; col < ncolumns; col++)
+                {
+                    Object value = getters[col].invoke(object, (Object[]) null);
+                    if (value == null) continue;
+                    store(values[col], i, value);
+                    if (validity[col] != null) validity[col][i >> 3] |= (byte) (1 << (i & 7));
+                }
+            }
+        }
+        catch (InvocationTargetException exc)
+        {
+            throw exc.getCause();
+        }
+        Object[] columns = new Object[ncolumns];
+        for (int col = 0; col < ncolumns; col++)
+        {
+            Object[] column = new Object[] { values[col], null, validity[col] };
+            if (strings[col])
+            {
+                String[] columnStrings = (String[]) values[col];
+                int[] offsets = new int[count + 1];
+                for (int i = 0; i < count; i++)
+                {
+                    String string = columnStrings[i];
+                    offsets[i + 1] = offsets[i] + ((string != null) ? string.length() : 0);
+                }
+                char[] chars = new char[offsets[count]];
+                for (int i = 0; i < count; i++)
+                {
+                    String string = columnStrings[i];
+                    if (string != null) string.getChars(0, string.length(), chars, offsets[i]);
+                }
+                column[0] = chars;
+                column[1] = offsets;
+            }
+            columns[col] = column;
+        }
+        return columns;
+    }
+
+    // The primitive type of the wrapper type (null if not a wrapper type).
+    static Class primitiveOf(Class type)
+    {
+        if (type == Boolean.class)   return Boolean.TYPE;
+        if (type == Character.class) return Character.TYPE;
+        if (type == Byte.class)      return Byte.TYPE;
+        if (type == Short.class)     return Short.TYPE;
+        if (type == Integer.class)   return Integer.TYPE;
+        if (type == Long.class)      return Long.TYPE;
+        if (type == Float.class)     return Float.TYPE;
+        if (type == Double.class)    return Double.TYPE;
+        return null;
+    }
+
+    // Array.set() without its generic unwrapping for the common types.
+    static void store(Object result, int index, Object value)
+    {
+        if (result instanceof Object[])
+            ((Object[]) result)[index] = value;
+        else if (result instanceof int[])
+            ((int[]) result)[index] = ((Integer) value).intValue();
+        else if (result instanceof long[])
+            ((long[]) result)[index] = ((Long) value).longValue();
+        else if (result instanceof double[])
+            ((double[]) result)[index] = ((Double) value).doubleValue();
+        else if (result instanceof boolean[])
+            ((boolean[]) result)[index] = ((Boolean) value).booleanValue();
+        else
+            Array.set(result, index, value);
+    }
+
+    static Object[] toArray(Object receivers)
+    {
+        if (receivers instanceof Object[])
+            return (Object[]) receivers;
+        ArrayList list = new ArrayList();
+        for (Iterator iter = ((Iterable) receivers).iterator(); iter.hasNext(); )
+        {
+            list.add(iter.next());
+        }
+        return list.toArray();
+    }
+}
@@ -0,0 +1,188 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+__javacode__ = bytearray(  # Auto-generated; DO NOT EDIT!
+    b"\xca\xfe\xba\xbe\x00\x00\x00\x34\x00\xab\x07\x00\x02\x01\x00\x1b\x6f\x72\x67\x2f"
+    b"\x6a\x74\x2f\x72\x65\x66\x6c\x65\x63\x74\x2f\x42\x61\x74\x63\x68\x49\x6e\x76\x6f"
+    b"\x6b\x65\x72\x07\x00\x04\x01\x00\x10\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f"
+    b"\x62\x6a\x65\x63\x74\x01\x00\x06\x3c\x69\x6e\x69\x74\x3e\x01\x00\x03\x28\x29\x56"
+    b"\x01\x00\x04\x43\x6f\x64\x65\x0a\x00\x03\x00\x09\x0c\x00\x05\x00\x06\x01\x00\x06"
+    b"\x69\x6e\x76\x6f\x6b\x65\x01\x00\x53\x28\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67"
+    b"\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x72"
+    b"\x65\x66\x6c\x65\x63\x74\x2f\x4d\x65\x74\x68\x6f\x64\x3b\x5b\x4c\x6a\x61\x76\x61"
+    b"\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x29\x4c\x6a\x61\x76\x61\x2f"
+    b"\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x01\x00\x0a\x45\x78\x63\x65\x70"
+    b"\x74\x69\x6f\x6e\x73\x07\x00\x0e\x01\x00\x13\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67"
+    b"\x2f\x54\x68\x72\x6f\x77\x61\x62\x6c\x65\x0a\x00\x01\x00\x10\x0c\x00\x11\x00\x12"
+    b"\x01\x00\x07\x74\x6f\x41\x72\x72\x61\x79\x01\x00\x27\x28\x4c\x6a\x61\x76\x61\x2f"
+    b"\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x29\x5b\x4c\x6a\x61\x76\x61\x2f"
+    b"\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x0a\x00\x14\x00\x16\x07\x00\x15"
+    b"\x01\x00\x18\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x72\x65\x66\x6c\x65\x63\x74"
+    b"\x2f\x4d\x65\x74\x68\x6f\x64\x0c\x00\x17\x00\x18\x01\x00\x0d\x67\x65\x74\x52\x65"
+    b"\x74\x75\x72\x6e\x54\x79\x70\x65\x01\x00\x13\x28\x29\x4c\x6a\x61\x76\x61\x2f\x6c"
+    b"\x61\x6e\x67\x2f\x43\x6c\x61\x73\x73\x3b\x09\x00\x1a\x00\x1c\x07\x00\x1b\x01\x00"
+    b"\x0e\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x56\x6f\x69\x64\x0c\x00\x1d\x00\x1e"
+    b"\x01\x00\x04\x54\x59\x50\x45\x01\x00\x11\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67"
+    b"\x2f\x43\x6c\x61\x73\x73\x3b\x0a\x00\x20\x00\x22\x07\x00\x21\x01\x00\x17\x6a\x61"
+    b"\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x72\x65\x66\x6c\x65\x63\x74\x2f\x41\x72\x72\x61"
+    b"\x79\x0c\x00\x23\x00\x24\x01\x00\x0b\x6e\x65\x77\x49\x6e\x73\x74\x61\x6e\x63\x65"
+    b"\x01\x00\x26\x28\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x43\x6c\x61\x73\x73"
+    b"\x3b\x49\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74"
+    b"\x3b\x0a\x00\x14\x00\x26\x0c\x00\x0a\x00\x27\x01\x00\x39\x28\x4c\x6a\x61\x76\x61"
+    b"\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x5b\x4c\x6a\x61\x76\x61\x2f"
+    b"\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x29\x4c\x6a\x61\x76\x61\x2f\x6c"
+    b"\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x0a\x00\x01\x00\x29\x0c\x00\x2a\x00"
+    b"\x2b\x01\x00\x05\x73\x74\x6f\x72\x65\x01\x00\x28\x28\x4c\x6a\x61\x76\x61\x2f\x6c"
+    b"\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x49\x4c\x6a\x61\x76\x61\x2f\x6c\x61"
+    b"\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x29\x56\x0a\x00\x2d\x00\x2f\x07\x00\x2e"
+    b"\x01\x00\x2b\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x72\x65\x66\x6c\x65\x63\x74"
+    b"\x2f\x49\x6e\x76\x6f\x63\x61\x74\x69\x6f\x6e\x54\x61\x72\x67\x65\x74\x45\x78\x63"
+    b"\x65\x70\x74\x69\x6f\x6e\x0c\x00\x30\x00\x31\x01\x00\x08\x67\x65\x74\x43\x61\x75"
+    b"\x73\x65\x01\x00\x17\x28\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x54\x68"
+    b"\x72\x6f\x77\x61\x62\x6c\x65\x3b\x01\x00\x0d\x53\x74\x61\x63\x6b\x4d\x61\x70\x54"
+    b"\x61\x62\x6c\x65\x07\x00\x34\x01\x00\x13\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e"
+    b"\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x07\x00\x36\x01\x00\x0f\x6a\x61\x76\x61\x2f"
+    b"\x6c\x61\x6e\x67\x2f\x43\x6c\x61\x73\x73\x01\x00\x03\x67\x65\x74\x01\x00\x3f\x28"
+    b"\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x4c\x6a"
+    b"\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x72\x65\x66\x6c\x65\x63\x74\x2f\x46\x69\x65"
+    b"\x6c\x64\x3b\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63"
+    b"\x74\x3b\x07\x00\x3a\x01\x00\x20\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x49\x6c"
+    b"\x6c\x65\x67\x61\x6c\x41\x63\x63\x65\x73\x73\x45\x78\x63\x65\x70\x74\x69\x6f\x6e"
+    b"\x0a\x00\x3c\x00\x3e\x07\x00\x3d\x01\x00\x17\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67"
+    b"\x2f\x72\x65\x66\x6c\x65\x63\x74\x2f\x46\x69\x65\x6c\x64\x0c\x00\x3f\x00\x18\x01"
+    b"\x00\x07\x67\x65\x74\x54\x79\x70\x65\x0a\x00\x3c\x00\x41\x0c\x00\x37\x00\x42\x01"
+    b"\x00\x26\x28\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74"
+    b"\x3b\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b"
+    b"\x01\x00\x07\x63\x6f\x6c\x75\x6d\x6e\x73\x01\x00\x42\x28\x4c\x6a\x61\x76\x61\x2f"
+    b"\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x5b\x4c\x6a\x61\x76\x61\x2f\x6c"
+    b"\x61\x6e\x67\x2f\x72\x65\x66\x6c\x65\x63\x74\x2f\x4d\x65\x74\x68\x6f\x64\x3b\x29"
+    b"\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x07"
+    b"\x00\x46\x01\x00\x02\x5b\x42\x0a\x00\x01\x00\x48\x0c\x00\x49\x00\x4a\x01\x00\x0b"
+    b"\x70\x72\x69\x6d\x69\x74\x69\x76\x65\x4f\x66\x01\x00\x24\x28\x4c\x6a\x61\x76\x61"
+    b"\x2f\x6c\x61\x6e\x67\x2f\x43\x6c\x61\x73\x73\x3b\x29\x4c\x6a\x61\x76\x61\x2f\x6c"
+    b"\x61\x6e\x67\x2f\x43\x6c\x61\x73\x73\x3b\x07\x00\x4c\x01\x00\x10\x6a\x61\x76\x61"
+    b"\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x0a\x00\x35\x00\x4e\x0c\x00\x4f"
+    b"\x00\x50\x01\x00\x0b\x69\x73\x50\x72\x69\x6d\x69\x74\x69\x76\x65\x01\x00\x03\x28"
+    b"\x29\x5a\x07\x00\x52\x01\x00\x13\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f"
+    b"\x53\x74\x72\x69\x6e\x67\x3b\x0a\x00\x4b\x00\x54\x0c\x00\x55\x00\x56\x01\x00\x06"
+    b"\x6c\x65\x6e\x67\x74\x68\x01\x00\x03\x28\x29\x49\x0a\x00\x4b\x00\x58\x0c\x00\x59"
+    b"\x00\x5a\x01\x00\x08\x67\x65\x74\x43\x68\x61\x72\x73\x01\x00\x08\x28\x49\x49\x5b"
+    b"\x43\x49\x29\x56\x07\x00\x5c\x01\x00\x1b\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e"
+    b"\x67\x2f\x72\x65\x66\x6c\x65\x63\x74\x2f\x4d\x65\x74\x68\x6f\x64\x3b\x07\x00\x5e"
+    b"\x01\x00\x03\x5b\x5b\x42\x07\x00\x60\x01\x00\x02\x5b\x5a\x07\x00\x62\x01\x00\x02"
+    b"\x5b\x49\x07\x00\x64\x01\x00\x02\x5b\x43\x07\x00\x66\x01\x00\x11\x6a\x61\x76\x61"
+    b"\x2f\x6c\x61\x6e\x67\x2f\x42\x6f\x6f\x6c\x65\x61\x6e\x09\x00\x65\x00\x1c\x07\x00"
+    b"\x69\x01\x00\x13\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x43\x68\x61\x72\x61\x63"
+    b"\x74\x65\x72\x09\x00\x68\x00\x1c\x07\x00\x6c\x01\x00\x0e\x6a\x61\x76\x61\x2f\x6c"
+    b"\x61\x6e\x67\x2f\x42\x79\x74\x65\x09\x00\x6b\x00\x1c\x07\x00\x6f\x01\x00\x0f\x6a"
+    b"\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x68\x6f\x72\x74\x09\x00\x6e\x00\x1c\x07"
+    b"\x00\x72\x01\x00\x11\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x49\x6e\x74\x65\x67"
+    b"\x65\x72\x09\x00\x71\x00\x1c\x07\x00\x75\x01\x00\x0e\x6a\x61\x76\x61\x2f\x6c\x61"
+    b"\x6e\x67\x2f\x4c\x6f\x6e\x67\x09\x00\x74\x00\x1c\x07\x00\x78\x01\x00\x0f\x6a\x61"
+    b"\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x46\x6c\x6f\x61\x74\x09\x00\x77\x00\x1c\x07\x00"
+    b"\x7b\x01\x00\x10\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x44\x6f\x75\x62\x6c\x65"
+    b"\x09\x00\x7a\x00\x1c\x0a\x00\x71\x00\x7e\x0c\x00\x7f\x00\x56\x01\x00\x08\x69\x6e"
+    b"\x74\x56\x61\x6c\x75\x65\x07\x00\x81\x01\x00\x02\x5b\x4a\x0a\x00\x74\x00\x83\x0c"
+    b"\x00\x84\x00\x85\x01\x00\x09\x6c\x6f\x6e\x67\x56\x61\x6c\x75\x65\x01\x00\x03\x28"
+    b"\x29\x4a\x07\x00\x87\x01\x00\x02\x5b\x44\x0a\x00\x7a\x00\x89\x0c\x00\x8a\x00\x8b"
+    b"\x01\x00\x0b\x64\x6f\x75\x62\x6c\x65\x56\x61\x6c\x75\x65\x01\x00\x03\x28\x29\x44"
+    b"\x0a\x00\x65\x00\x8d\x0c\x00\x8e\x00\x50\x01\x00\x0c\x62\x6f\x6f\x6c\x65\x61\x6e"
+    b"\x56\x61\x6c\x75\x65\x0a\x00\x20\x00\x90\x0c\x00\x91\x00\x2b\x01\x00\x03\x73\x65"
+    b"\x74\x07\x00\x93\x01\x00\x13\x6a\x61\x76\x61\x2f\x75\x74\x69\x6c\x2f\x41\x72\x72"
+    b"\x61\x79\x4c\x69\x73\x74\x0a\x00\x92\x00\x09\x07\x00\x96\x01\x00\x12\x6a\x61\x76"
+    b"\x61\x2f\x6c\x61\x6e\x67\x2f\x49\x74\x65\x72\x61\x62\x6c\x65\x0b\x00\x95\x00\x98"
+    b"\x0c\x00\x99\x00\x9a\x01\x00\x08\x69\x74\x65\x72\x61\x74\x6f\x72\x01\x00\x16\x28"
+    b"\x29\x4c\x6a\x61\x76\x61\x2f\x75\x74\x69\x6c\x2f\x49\x74\x65\x72\x61\x74\x6f\x72"
+    b"\x3b\x0b\x00\x9c\x00\x9e\x07\x00\x9d\x01\x00\x12\x6a\x61\x76\x61\x2f\x75\x74\x69"
+    b"\x6c\x2f\x49\x74\x65\x72\x61\x74\x6f\x72\x0c\x00\x9f\x00\xa0\x01\x00\x04\x6e\x65"
+    b"\x78\x74\x01\x00\x14\x28\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62"
+    b"\x6a\x65\x63\x74\x3b\x0a\x00\x92\x00\xa2\x0c\x00\xa3\x00\xa4\x01\x00\x03\x61\x64"
+    b"\x64\x01\x00\x15\x28\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65"
+    b"\x63\x74\x3b\x29\x5a\x0b\x00\x9c\x00\xa6\x0c\x00\xa7\x00\x50\x01\x00\x07\x68\x61"
+    b"\x73\x4e\x65\x78\x74\x0a\x00\x92\x00\xa9\x0c\x00\x11\x00\xaa\x01\x00\x15\x28\x29"
+    b"\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65\x63\x74\x3b\x00"
+    b"\x31\x00\x01\x00\x03\x00\x00\x00\x00\x00\x07\x00\x02\x00\x05\x00\x06\x00\x01\x00"
+    b"\x07\x00\x00\x00\x11\x00\x01\x00\x01\x00\x00\x00\x05\x2a\xb7\x00\x08\xb1\x00\x00"
+    b"\x00\x00\x00\x09\x00\x0a\x00\x0b\x00\x02\x00\x0c\x00\x00\x00\x04\x00\x01\x00\x0d"
+    b"\x00\x07\x00\x00\x00\xa6\x00\x03\x00\x08\x00\x00\x00\x57\x2a\xb8\x00\x0f\x4e\x2b"
+    b"\xb6\x00\x13\x3a\x04\x19\x04\xb2\x00\x19\xa6\x00\x07\x01\xa7\x00\x0a\x19\x04\x2d"
+    b"\xbe\xb8\x00\x1f\x3a\x05\x03\x36\x06\xa7\x00\x1f\x2b\x2d\x15\x06\x32\x2c\xb6\x00"
+    b"\x25\x3a\x07\x19\x05\xc6\x00\x0c\x19\x05\x15\x06\x19\x07\xb8\x00\x28\x84\x06\x01"
+    b"\x15\x06\x2d\xbe\xa1\xff\xe0\xa7\x00\x0b\x3a\x06\x19\x06\xb6\x00\x2c\xbf\x19\x05"
+    b"\xb0\x00\x01\x00\x20\x00\x49\x00\x4c\x00\x2d\x00\x01\x00\x32\x00\x00\x00\x35\x00"
+    b"\x07\xfd\x00\x17\x07\x00\x33\x07\x00\x35\x46\x07\x00\x03\xfd\x00\x07\x07\x00\x03"
+    b"\x01\x18\x02\xff\x00\x09\x00\x06\x07\x00\x03\x07\x00\x14\x07\x00\x33\x07\x00\x33"
+    b"\x07\x00\x35\x07\x00\x03\x00\x01\x07\x00\x2d\x07\x00\x09\x00\x37\x00\x38\x00\x02"
+    b"\x00\x0c\x00\x00\x00\x04\x00\x01\x00\x39\x00\x07\x00\x00\x00\x4e\x00\x05\x00\x05"
+    b"\x00\x00\x00\x2f\x2a\xb8\x00\x0f\x4d\x2b\xb6\x00\x3b\x2c\xbe\xb8\x00\x1f\x4e\x03"
+    b"\x36\x04\xa7\x00\x14\x2d\x15\x04\x2b\x2c\x15\x04\x32\xb6\x00\x40\xb8\x00\x28\x84"
+    b"\x04\x01\x15\x04\x2c\xbe\xa1\xff\xeb\x2d\xb0\x00\x00\x00\x01\x00\x32\x00\x00\x00"
+    b"\x0d\x00\x02\xfe\x00\x15\x07\x00\x33\x07\x00\x03\x01\x10\x00\x09\x00\x43\x00\x44"
+    b"\x00\x02\x00\x0c\x00\x00\x00\x04\x00\x01\x00\x0d\x00\x07\x00\x00\x03\x87\x00\x06"
+    b"\x00\x10\x00\x00\x01\xdd\x2a\xb8\x00\x0f\x4d\x2c\xbe\x3e\x2b\xbe\x36\x04\x15\x04"
+    b"\xbd\x00\x03\x3a\x05\x15\x04\xbd\x00\x45\x3a\x06\x15\x04\xbc\x04\x3a\x07\x03\x36"
+    b"\x08\xa7\x00\x83\x2b\x15\x08\x32\xb6\x00\x13\x3a\x09\x19\x09\xb8\x00\x47\x3a\x0a"
+    b"\x19\x07\x15\x08\x19\x09\x12\x4b\xa6\x00\x07\x04\xa7\x00\x04\x03\x54\x19\x09\xb6"
+    b"\x00\x4d\x99\x00\x11\x19\x05\x15\x08\x19\x09\x1d\xb8\x00\x1f\x53\xa7\x00\x33\x19"
+    b"\x0a\xc6\x00\x11\x19\x05\x15\x08\x19\x0a\x1d\xb8\x00\x1f\x53\xa7\x00\x20\x19\x07"
+    b"\x15\x08\x33\x99\x00\x0f\x19\x05\x15\x08\x1d\xbd\x00\x4b\x53\xa7\x00\x0c\x19\x05"
+    b"\x15\x08\x1d\xbd\x00\x03\x53\x19\x09\xb6\x00\x4d\x9a\x00\x11\x19\x06\x15\x08\x1d"
+    b"\x10\x07\x60\x10\x08\x6c\xbc\x08\x53\x84\x08\x01\x15\x08\x15\x04\xa1\xff\x7c\x03"
+    b"\x36\x08\xa7\x00\x5a\x2c\x15\x08\x32\x3a\x09\x03\x36\x0a\xa7\x00\x44\x2b\x15\x0a"
+    b"\x32\x19\x09\x01\xb6\x00\x25\x3a\x0b\x19\x0b\xc7\x00\x06\xa7\x00\x2d\x19\x05\x15"
+    b"\x0a\x32\x15\x08\x19\x0b\xb8\x00\x28\x19\x06\x15\x0a\x32\xc6\x00\x19\x19\x06\x15"
+    b"\x0a\x32\x15\x08\x06\x7a\x5c\x33\x04\x15\x08\x10\x07\x7e\x78\x91\x80\x91\x54\x84"
+    b"\x0a\x01\x15\x0a\x15\x04\xa1\xff\xbb\x84\x08\x01\x15\x08\x1d\xa1\xff\xa6\xa7\x00"
+    b"\x0b\x3a\x08\x19\x08\xb6\x00\x2c\xbf\x15\x04\xbd\x00\x03\x3a\x08\x03\x36\x09\xa7"
+    b"\x00\xae\x06\xbd\x00\x03\x59\x03\x19\x05\x15\x09\x32\x53\x59\x05\x19\x06\x15\x09"
+    b"\x32\x53\x3a\x0a\x19\x07\x15\x09\x33\x99\x00\x86\x19\x05\x15\x09\x32\xc0\x00\x51"
+    b"\x3a\x0b\x1d\x04\x60\xbc\x0a\x3a\x0c\x03\x36\x0d\xa7\x00\x28\x19\x0b\x15\x0d\x32"
+    b"\x3a\x0e\x19\x0c\x15\x0d\x04\x60\x19\x0c\x15\x0d\x2e\x19\x0e\xc6\x00\x0b\x19\x0e"
+    b"\xb6\x00\x53\xa7\x00\x04\x03\x60\x4f\x84\x0d\x01\x15\x0d\x1d\xa1\xff\xd8\x19\x0c"
+    b"\x1d\x2e\xbc\x05\x3a\x0d\x03\x36\x0e\xa7\x00\x24\x19\x0b\x15\x0e\x32\x3a\x0f\x19"
+    b"\x0f\xc6\x00\x15\x19\x0f\x03\x19\x0f\xb6\x00\x53\x19\x0d\x19\x0c\x15\x0e\x2e\xb6"
+    b"\x00\x57\x84\x0e\x01\x15\x0e\x1d\xa1\xff\xdc\x19\x0a\x03\x19\x0d\x53\x19\x0a\x04"
+    b"\x19\x0c\x53\x19\x08\x15\x09\x19\x0a\x53\x84\x09\x01\x15\x09\x15\x04\xa1\xff\x51"
+    b"\x19\x08\xb0\x00\x01\x00\xad\x01\x10\x01\x13\x00\x2d\x00\x01\x00\x32\x00\x00\x01"
+    b"\x90\x00\x1b\xff\x00\x26\x00\x09\x07\x00\x03\x07\x00\x5b\x07\x00\x33\x01\x01\x07"
+    b"\x00\x33\x07\x00\x5d\x07\x00\x5f\x01\x00\x00\xff\x00\x1e\x00\x0b\x07\x00\x03\x07"
+    b"\x00\x5b\x07\x00\x33\x01\x01\x07\x00\x33\x07\x00\x5d\x07\x00\x5f\x01\x07\x00\x35"
+    b"\x07\x00\x35\x00\x02\x07\x00\x5f\x01\xff\x00\x00\x00\x0b\x07\x00\x03\x07\x00\x5b"
+    b"\x07\x00\x33\x01\x01\x07\x00\x33\x07\x00\x5d\x07\x00\x5f\x01\x07\x00\x35\x07\x00"
+    b"\x35\x00\x03\x07\x00\x5f\x01\x01\x16\x12\x13\x08\xf9\x00\x15\x02\x0c\xfd\x00\x0b"
+    b"\x07\x00\x03\x01\xfc\x00\x13\x07\x00\x03\xfa\x00\x29\x02\xf9\x00\x09\xff\x00\x08"
+    b"\x00\x08\x07\x00\x03\x07\x00\x5b\x07\x00\x33\x01\x01\x07\x00\x33\x07\x00\x5d\x07"
+    b"\x00\x5f\x00\x01\x07\x00\x2d\x07\xfd\x00\x0c\x07\x00\x33\x01\xff\x00\x34\x00\x0e"
+    b"\x07\x00\x03\x07\x00\x5b\x07\x00\x33\x01\x01\x07\x00\x33\x07\x00\x5d\x07\x00\x5f"
+    b"\x07\x00\x33\x01\x07\x00\x33\x07\x00\x51\x07\x00\x61\x01\x00\x00\xff\x00\x1e\x00"
+    b"\x0f\x07\x00\x03\x07\x00\x5b\x07\x00\x33\x01\x01\x07\x00\x33\x07\x00\x5d\x07\x00"
+    b"\x5f\x07\x00\x33\x01\x07\x00\x33\x07\x00\x51\x07\x00\x61\x01\x07\x00\x4b\x00\x03"
+    b"\x07\x00\x61\x01\x01\xff\x00\x00\x00\x0f\x07\x00\x03\x07\x00\x5b\x07\x00\x33\x01"
+    b"\x01\x07\x00\x33\x07\x00\x5d\x07\x00\x5f\x07\x00\x33\x01\x07\x00\x33\x07\x00\x51"
+    b"\x07\x00\x61\x01\x07\x00\x4b\x00\x04\x07\x00\x61\x01\x01\x01\xfa\x00\x04\xff\x00"
+    b"\x13\x00\x0f\x07\x00\x03\x07\x00\x5b\x07\x00\x33\x01\x01\x07\x00\x33\x07\x00\x5d"
+    b"\x07\x00\x5f\x07\x00\x33\x01\x07\x00\x33\x07\x00\x51\x07\x00\x61\x07\x00\x63\x01"
+    b"\x00\x00\x1d\x02\xff\x00\x11\x00\x0b\x07\x00\x03\x07\x00\x5b\x07\x00\x33\x01\x01"
+    b"\x07\x00\x33\x07\x00\x5d\x07\x00\x5f\x07\x00\x33\x01\x07\x00\x33\x00\x00\xfa\x00"
+    b"\x09\x00\x08\x00\x49\x00\x4a\x00\x01\x00\x07\x00\x00\x00\x6e\x00\x02\x00\x01\x00"
+    b"\x00\x00\x52\x2a\x12\x65\xa6\x00\x07\xb2\x00\x67\xb0\x2a\x12\x68\xa6\x00\x07\xb2"
+    b"\x00\x6a\xb0\x2a\x12\x6b\xa6\x00\x07\xb2\x00\x6d\xb0\x2a\x12\x6e\xa6\x00\x07\xb2"
+    b"\x00\x70\xb0\x2a\x12\x71\xa6\x00\x07\xb2\x00\x73\xb0\x2a\x12\x74\xa6\x00\x07\xb2"
+    b"\x00\x76\xb0\x2a\x12\x77\xa6\x00\x07\xb2\x00\x79\xb0\x2a\x12\x7a\xa6\x00\x07\xb2"
+    b"\x00\x7c\xb0\x01\xb0\x00\x00\x00\x01\x00\x32\x00\x00\x00\x0a\x00\x08\x0a\x09\x09"
+    b"\x09\x09\x09\x09\x09\x00\x08\x00\x2a\x00\x2b\x00\x01\x00\x07\x00\x00\x00\x8e\x00"
+    b"\x04\x00\x03\x00\x00\x00\x74\x2a\xc1\x00\x33\x99\x00\x0d\x2a\xc0\x00\x33\x1b\x2c"
+    b"\x53\xa7\x00\x65\x2a\xc1\x00\x61\x99\x00\x13\x2a\xc0\x00\x61\x1b\x2c\xc0\x00\x71"
+    b"\xb6\x00\x7d\x4f\xa7\x00\x4e\x2a\xc1\x00\x80\x99\x00\x13\x2a\xc0\x00\x80\x1b\x2c"
+    b"\xc0\x00\x74\xb6\x00\x82\x50\xa7\x00\x37\x2a\xc1\x00\x86\x99\x00\x13\x2a\xc0\x00"
+    b"\x86\x1b\x2c\xc0\x00\x7a\xb6\x00\x88\x52\xa7\x00\x20\x2a\xc1\x00\x5f\x99\x00\x13"
+    b"\x2a\xc0\x00\x5f\x1b\x2c\xc0\x00\x65\xb6\x00\x8c\x54\xa7\x00\x09\x2a\x1b\x2c\xb8"
+    b"\x00\x8f\xb1\x00\x00\x00\x01\x00\x32\x00\x00\x00\x08\x00\x06\x11\x16\x16\x16\x16"
+    b"\x05\x00\x08\x00\x11\x00\x12\x00\x01\x00\x07\x00\x00\x00\x59\x00\x02\x00\x03\x00"
+    b"\x00\x00\x3a\x2a\xc1\x00\x33\x99\x00\x08\x2a\xc0\x00\x33\xb0\xbb\x00\x92\x59\xb7"
+    b"\x00\x94\x4c\x2a\xc0\x00\x95\xb9\x00\x97\x01\x00\x4d\xa7\x00\x0e\x2b\x2c\xb9\x00"
+    b"\x9b\x01\x00\xb6\x00\xa1\x57\x2c\xb9\x00\xa5\x01\x00\x9a\xff\xef\x2b\xb6\x00\xa8"
+    b"\xb0\x00\x00\x00\x01\x00\x32\x00\x00\x00\x0d\x00\x03\x0c\xfd\x00\x14\x07\x00\x92"
+    b"\x07\x00\x9c\x0a\x00\x00"
+)
@@ -0,0 +1,90 @@
+// Copyright (c) 2004 Adam Karpierz
+// SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+// Please refer to the accompanying LICENSE file.
+
+package org.jt.reflect;
+
+import java.lang.reflect.Constructor;
+import java.lang.reflect.Method;
+import java.lang.reflect.Field;
+
+public final class ClassInfo
+{
+    private ClassInfo()
+    {
+    }
+
+    // Describes all the (public or declared) constructors, methods and fields
+    // of the class in one string: one member per line, as the tab separated
+    // kind ('C', 'M' or 'F'), name, descriptor, modifiers and declaring class.
+    public static String describe(Class cls, boolean declared)
+    {
+        Constructor[] constructors = declared ? cls.getDeclaredConstructors() : cls.getConstructors();
+        Method[]      methods      = declared ? cls.getDeclaredMethods()      : cls.getMethods();
+        Field[]       fields       = declared ? cls.getDeclaredFields()       : cls.getFields();
+        StringBuilder result = new StringBuilder(64 * (constructors.length + methods.length + fields.length));
+        for (int i = 0; i < constructors.length; i++)
+        {
+            Constructor member = constructors[i];
+            StringBuilder descriptor = parameters(member.getParameterTypes()).append('V');
+            append(result, 'C', "<init>", descriptor, member.getModifiers(), member.getDeclaringClass());
+        }
+        for (int i = 0; i < methods.length; i++)
+        {
+            Method member = methods[i];
+            StringBuilder descriptor = parameters(member.getParameterTypes());
+            descriptor(descriptor, member.getReturnType());
+            append(result, 'M', member.getName(), descriptor, member.getModifiers(), member.getDeclaringClass());
+        }
+        for (int i = 0; i < fields.length; i++)
+        {
+            Field member = fields[i];
+            StringBuilder descriptor = descriptor(new StringBuilder(), member.getType());
+            append(result, 'F', member.getName(), descriptor, member.getModifiers(), member.getDeclaringClass());
+        }
+        return result.toString();
+    }
+
+    private static void append(StringBuilder result, char kind, String name, StringBuilder descriptor,
+                               int modifiers, Class declaringClass)
+    {
+        result.append(kind).append('\t').append(name).append('\t').append(descriptor).append('\t')
+              .append(modifiers).append('\t').append(declaringClass.getName()).append('\n');
+    }
+
+    private static StringBuilder parameters(Class[] types)
+    {
+        StringBuilder descriptor = new StringBuilder().append('(');
+        for (int i = 0; i < types.length; i++)
+        {
+            descriptor(descriptor, types[i]);
+        }
+        return descriptor.append(')');
+    }
+
+    private static StringBuilder descriptor(StringBuilder descriptor, Class type)
+    {
+        if (type.isArray())
+            return descriptor.append(type.getName().replace('.', '/'));
+        else if (type == Void.TYPE)
+            return descriptor.append('V');
+        else if (type == Boolean.TYPE)
+            return descriptor.append('Z');
+        else if (type == Character.TYPE)
+            return descriptor.append('C');
+        else if (type == Byte.TYPE)
+            return descriptor.append('B');
+        else if (type == Short.TYPE)
+            return descriptor.append('S');
+        else if (type == Integer.TYPE)
+            return descriptor.append('I');
+        else if (type == Long.TYPE)
+            return descriptor.append('J');
+        else if (type == Float.TYPE)
+            return descriptor.append('F');
+        else if (type == Double.TYPE)
+            return descriptor.append('D');
+        else
+            return descriptor.append('L').append(type.getName().replace('.', '/')).append(';');
+    }
+}
@@ -0,0 +1,136 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+__javacode__ = bytearray(  # Auto-generated; DO NOT EDIT!
+    b"\xca\xfe\xba\xbe\x00\x00\x00\x34\x00\x97\x07\x00\x02\x01\x00\x18\x6f\x72\x67\x2f"
+    b"\x6a\x74\x2f\x72\x65\x66\x6c\x65\x63\x74\x2f\x43\x6c\x61\x73\x73\x49\x6e\x66\x6f"
+    b"\x07\x00\x04\x01\x00\x10\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4f\x62\x6a\x65"
+    b"\x63\x74\x01\x00\x06\x3c\x69\x6e\x69\x74\x3e\x01\x00\x03\x28\x29\x56\x01\x00\x04"
+    b"\x43\x6f\x64\x65\x0a\x00\x03\x00\x09\x0c\x00\x05\x00\x06\x01\x00\x08\x64\x65\x73"
+    b"\x63\x72\x69\x62\x65\x01\x00\x26\x28\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f"
+    b"\x43\x6c\x61\x73\x73\x3b\x5a\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53"
+    b"\x74\x72\x69\x6e\x67\x3b\x0a\x00\x0d\x00\x0f\x07\x00\x0e\x01\x00\x0f\x6a\x61\x76"
+    b"\x61\x2f\x6c\x61\x6e\x67\x2f\x43\x6c\x61\x73\x73\x0c\x00\x10\x00\x11\x01\x00\x17"
+    b"\x67\x65\x74\x44\x65\x63\x6c\x61\x72\x65\x64\x43\x6f\x6e\x73\x74\x72\x75\x63\x74"
+    b"\x6f\x72\x73\x01\x00\x22\x28\x29\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f"
+    b"\x72\x65\x66\x6c\x65\x63\x74\x2f\x43\x6f\x6e\x73\x74\x72\x75\x63\x74\x6f\x72\x3b"
+    b"\x0a\x00\x0d\x00\x13\x0c\x00\x14\x00\x11\x01\x00\x0f\x67\x65\x74\x43\x6f\x6e\x73"
+    b"\x74\x72\x75\x63\x74\x6f\x72\x73\x0a\x00\x0d\x00\x16\x0c\x00\x17\x00\x18\x01\x00"
+    b"\x12\x67\x65\x74\x44\x65\x63\x6c\x61\x72\x65\x64\x4d\x65\x74\x68\x6f\x64\x73\x01"
+    b"\x00\x1d\x28\x29\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x72\x65\x66\x6c"
+    b"\x65\x63\x74\x2f\x4d\x65\x74\x68\x6f\x64\x3b\x0a\x00\x0d\x00\x1a\x0c\x00\x1b\x00"
+    b"\x18\x01\x00\x0a\x67\x65\x74\x4d\x65\x74\x68\x6f\x64\x73\x0a\x00\x0d\x00\x1d\x0c"
+    b"\x00\x1e\x00\x1f\x01\x00\x11\x67\x65\x74\x44\x65\x63\x6c\x61\x72\x65\x64\x46\x69"
+    b"\x65\x6c\x64\x73\x01\x00\x1c\x28\x29\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67"
+    b"\x2f\x72\x65\x66\x6c\x65\x63\x74\x2f\x46\x69\x65\x6c\x64\x3b\x0a\x00\x0d\x00\x21"
+    b"\x0c\x00\x22\x00\x1f\x01\x00\x09\x67\x65\x74\x46\x69\x65\x6c\x64\x73\x07\x00\x24"
+    b"\x01\x00\x17\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x42"
+    b"\x75\x69\x6c\x64\x65\x72\x0a\x00\x23\x00\x26\x0c\x00\x05\x00\x27\x01\x00\x04\x28"
+    b"\x49\x29\x56\x0a\x00\x29\x00\x2b\x07\x00\x2a\x01\x00\x1d\x6a\x61\x76\x61\x2f\x6c"
+    b"\x61\x6e\x67\x2f\x72\x65\x66\x6c\x65\x63\x74\x2f\x43\x6f\x6e\x73\x74\x72\x75\x63"
+    b"\x74\x6f\x72\x0c\x00\x2c\x00\x2d\x01\x00\x11\x67\x65\x74\x50\x61\x72\x61\x6d\x65"
+    b"\x74\x65\x72\x54\x79\x70\x65\x73\x01\x00\x14\x28\x29\x5b\x4c\x6a\x61\x76\x61\x2f"
+    b"\x6c\x61\x6e\x67\x2f\x43\x6c\x61\x73\x73\x3b\x0a\x00\x01\x00\x2f\x0c\x00\x30\x00"
+    b"\x31\x01\x00\x0a\x70\x61\x72\x61\x6d\x65\x74\x65\x72\x73\x01\x00\x2d\x28\x5b\x4c"
+    b"\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x43\x6c\x61\x73\x73\x3b\x29\x4c\x6a\x61"
+    b"\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x42\x75\x69\x6c\x64\x65"
+    b"\x72\x3b\x0a\x00\x23\x00\x33\x0c\x00\x34\x00\x35\x01\x00\x06\x61\x70\x70\x65\x6e"
+    b"\x64\x01\x00\x1c\x28\x43\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x74"
+    b"\x72\x69\x6e\x67\x42\x75\x69\x6c\x64\x65\x72\x3b\x08\x00\x05\x0a\x00\x29\x00\x38"
+    b"\x0c\x00\x39\x00\x3a\x01\x00\x0c\x67\x65\x74\x4d\x6f\x64\x69\x66\x69\x65\x72\x73"
+    b"\x01\x00\x03\x28\x29\x49\x0a\x00\x29\x00\x3c\x0c\x00\x3d\x00\x3e\x01\x00\x11\x67"
+    b"\x65\x74\x44\x65\x63\x6c\x61\x72\x69\x6e\x67\x43\x6c\x61\x73\x73\x01\x00\x13\x28"
+    b"\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x43\x6c\x61\x73\x73\x3b\x0a\x00"
+    b"\x01\x00\x40\x0c\x00\x34\x00\x41\x01\x00\x5a\x28\x4c\x6a\x61\x76\x61\x2f\x6c\x61"
+    b"\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x42\x75\x69\x6c\x64\x65\x72\x3b\x43\x4c\x6a"
+    b"\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x3b\x4c\x6a\x61\x76"
+    b"\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x42\x75\x69\x6c\x64\x65\x72"
+    b"\x3b\x49\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x43\x6c\x61\x73\x73\x3b\x29"
+    b"\x56\x0a\x00\x43\x00\x2b\x07\x00\x44\x01\x00\x18\x6a\x61\x76\x61\x2f\x6c\x61\x6e"
+    b"\x67\x2f\x72\x65\x66\x6c\x65\x63\x74\x2f\x4d\x65\x74\x68\x6f\x64\x0a\x00\x43\x00"
+    b"\x46\x0c\x00\x47\x00\x3e\x01\x00\x0d\x67\x65\x74\x52\x65\x74\x75\x72\x6e\x54\x79"
+    b"\x70\x65\x0a\x00\x01\x00\x49\x0c\x00\x4a\x00\x4b\x01\x00\x0a\x64\x65\x73\x63\x72"
+    b"\x69\x70\x74\x6f\x72\x01\x00\x45\x28\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f"
+    b"\x53\x74\x72\x69\x6e\x67\x42\x75\x69\x6c\x64\x65\x72\x3b\x4c\x6a\x61\x76\x61\x2f"
+    b"\x6c\x61\x6e\x67\x2f\x43\x6c\x61\x73\x73\x3b\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61"
+    b"\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x42\x75\x69\x6c\x64\x65\x72\x3b\x0a\x00\x43"
+    b"\x00\x4d\x0c\x00\x4e\x00\x4f\x01\x00\x07\x67\x65\x74\x4e\x61\x6d\x65\x01\x00\x14"
+    b"\x28\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x3b"
+    b"\x0a\x00\x43\x00\x38\x0a\x00\x43\x00\x3c\x0a\x00\x23\x00\x09\x0a\x00\x54\x00\x56"
+    b"\x07\x00\x55\x01\x00\x17\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x72\x65\x66\x6c"
+    b"\x65\x63\x74\x2f\x46\x69\x65\x6c\x64\x0c\x00\x57\x00\x3e\x01\x00\x07\x67\x65\x74"
+    b"\x54\x79\x70\x65\x0a\x00\x54\x00\x4d\x0a\x00\x54\x00\x38\x0a\x00\x54\x00\x3c\x0a"
+    b"\x00\x23\x00\x5c\x0c\x00\x5d\x00\x4f\x01\x00\x08\x74\x6f\x53\x74\x72\x69\x6e\x67"
+    b"\x01\x00\x0d\x53\x74\x61\x63\x6b\x4d\x61\x70\x54\x61\x62\x6c\x65\x07\x00\x60\x01"
+    b"\x00\x20\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x72\x65\x66\x6c\x65\x63"
+    b"\x74\x2f\x43\x6f\x6e\x73\x74\x72\x75\x63\x74\x6f\x72\x3b\x07\x00\x62\x01\x00\x1b"
+    b"\x5b\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x72\x65\x66\x6c\x65\x63\x74\x2f"
+    b"\x4d\x65\x74\x68\x6f\x64\x3b\x07\x00\x64\x01\x00\x1a\x5b\x4c\x6a\x61\x76\x61\x2f"
+    b"\x6c\x61\x6e\x67\x2f\x72\x65\x66\x6c\x65\x63\x74\x2f\x46\x69\x65\x6c\x64\x3b\x0a"
+    b"\x00\x23\x00\x66\x0c\x00\x34\x00\x67\x01\x00\x2d\x28\x4c\x6a\x61\x76\x61\x2f\x6c"
+    b"\x61\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x3b\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61"
+    b"\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x42\x75\x69\x6c\x64\x65\x72\x3b\x0a\x00\x23"
+    b"\x00\x69\x0c\x00\x34\x00\x6a\x01\x00\x33\x28\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e"
+    b"\x67\x2f\x43\x68\x61\x72\x53\x65\x71\x75\x65\x6e\x63\x65\x3b\x29\x4c\x6a\x61\x76"
+    b"\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x42\x75\x69\x6c\x64\x65\x72"
+    b"\x3b\x0a\x00\x23\x00\x6c\x0c\x00\x34\x00\x6d\x01\x00\x1c\x28\x49\x29\x4c\x6a\x61"
+    b"\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x42\x75\x69\x6c\x64\x65"
+    b"\x72\x3b\x0a\x00\x0d\x00\x4d\x0a\x00\x0d\x00\x70\x0c\x00\x71\x00\x72\x01\x00\x07"
+    b"\x69\x73\x41\x72\x72\x61\x79\x01\x00\x03\x28\x29\x5a\x0a\x00\x74\x00\x76\x07\x00"
+    b"\x75\x01\x00\x10\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67"
+    b"\x0c\x00\x77\x00\x78\x01\x00\x07\x72\x65\x70\x6c\x61\x63\x65\x01\x00\x16\x28\x43"
+    b"\x43\x29\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x53\x74\x72\x69\x6e\x67\x3b"
+    b"\x09\x00\x7a\x00\x7c\x07\x00\x7b\x01\x00\x0e\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67"
+    b"\x2f\x56\x6f\x69\x64\x0c\x00\x7d\x00\x7e\x01\x00\x04\x54\x59\x50\x45\x01\x00\x11"
+    b"\x4c\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x43\x6c\x61\x73\x73\x3b\x09\x00\x80"
+    b"\x00\x7c\x07\x00\x81\x01\x00\x11\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x42\x6f"
+    b"\x6f\x6c\x65\x61\x6e\x09\x00\x83\x00\x7c\x07\x00\x84\x01\x00\x13\x6a\x61\x76\x61"
+    b"\x2f\x6c\x61\x6e\x67\x2f\x43\x68\x61\x72\x61\x63\x74\x65\x72\x09\x00\x86\x00\x7c"
+    b"\x07\x00\x87\x01\x00\x0e\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x42\x79\x74\x65"
+    b"\x09\x00\x89\x00\x7c\x07\x00\x8a\x01\x00\x0f\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67"
+    b"\x2f\x53\x68\x6f\x72\x74\x09\x00\x8c\x00\x7c\x07\x00\x8d\x01\x00\x11\x6a\x61\x76"
+    b"\x61\x2f\x6c\x61\x6e\x67\x2f\x49\x6e\x74\x65\x67\x65\x72\x09\x00\x8f\x00\x7c\x07"
+    b"\x00\x90\x01\x00\x0e\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f\x4c\x6f\x6e\x67\x09"
+    b"\x00\x92\x00\x7c\x07\x00\x93\x01\x00\x0f\x6a\x61\x76\x61\x2f\x6c\x61\x6e\x67\x2f"
+    b"\x46\x6c\x6f\x61\x74\x09\x00\x95\x00\x7c\x07\x00\x96\x01\x00\x10\x6a\x61\x76\x61"
+    b"\x2f\x6c\x61\x6e\x67\x2f\x44\x6f\x75\x62\x6c\x65\x00\x31\x00\x01\x00\x03\x00\x00"
+    b"\x00\x00\x00\x05\x00\x02\x00\x05\x00\x06\x00\x01\x00\x07\x00\x00\x00\x11\x00\x01"
+    b"\x00\x01\x00\x00\x00\x05\x2a\xb7\x00\x08\xb1\x00\x00\x00\x00\x00\x09\x00\x0a\x00"
+    b"\x0b\x00\x01\x00\x07\x00\x00\x01\x46\x00\x06\x00\x09\x00\x00\x01\x0a\x1b\x99\x00"
+    b"\x0a\x2a\xb6\x00\x0c\xa7\x00\x07\x2a\xb6\x00\x12\x4d\x1b\x99\x00\x0a\x2a\xb6\x00"
+    b"\x15\xa7\x00\x07\x2a\xb6\x00\x19\x4e\x1b\x99\x00\x0a\x2a\xb6\x00\x1c\xa7\x00\x07"
+    b"\x2a\xb6\x00\x20\x3a\x04\xbb\x00\x23\x59\x10\x40\x2c\xbe\x2d\xbe\x60\x19\x04\xbe"
+    b"\x60\x68\xb7\x00\x25\x3a\x05\x03\x36\x06\xa7\x00\x30\x2c\x15\x06\x32\x3a\x07\x19"
+    b"\x07\xb6\x00\x28\xb8\x00\x2e\x10\x56\xb6\x00\x32\x3a\x08\x19\x05\x10\x43\x12\x36"
+    b"\x19\x08\x19\x07\xb6\x00\x37\x19\x07\xb6\x00\x3b\xb8\x00\x3f\x84\x06\x01\x15\x06"
+    b"\x2c\xbe\xa1\xff\xcf\x03\x36\x06\xa7\x00\x39\x2d\x15\x06\x32\x3a\x07\x19\x07\xb6"
+    b"\x00\x42\xb8\x00\x2e\x3a\x08\x19\x08\x19\x07\xb6\x00\x45\xb8\x00\x48\x57\x19\x05"
+    b"\x10\x4d\x19\x07\xb6\x00\x4c\x19\x08\x19\x07\xb6\x00\x50\x19\x07\xb6\x00\x51\xb8"
+    b"\x00\x3f\x84\x06\x01\x15\x06\x2d\xbe\xa1\xff\xc6\x03\x36\x06\xa7\x00\x36\x19\x04"
+    b"\x15\x06\x32\x3a\x07\xbb\x00\x23\x59\xb7\x00\x52\x19\x07\xb6\x00\x53\xb8\x00\x48"
+    b"\x3a\x08\x19\x05\x10\x46\x19\x07\xb6\x00\x58\x19\x08\x19\x07\xb6\x00\x59\x19\x07"
+    b"\xb6\x00\x5a\xb8\x00\x3f\x84\x06\x01\x15\x06\x19\x04\xbe\xa1\xff\xc8\x19\x05\xb6"
+    b"\x00\x5b\xb0\x00\x00\x00\x01\x00\x5e\x00\x00\x00\x2a\x00\x0c\x0b\x43\x07\x00\x5f"
+    b"\xfc\x00\x0b\x07\x00\x5f\x43\x07\x00\x61\xfc\x00\x0b\x07\x00\x61\x43\x07\x00\x63"
+    b"\xfe\x00\x1c\x07\x00\x63\x07\x00\x23\x01\x2c\x0c\x35\x0c\x32\x00\x0a\x00\x34\x00"
+    b"\x41\x00\x01\x00\x07\x00\x00\x00\x41\x00\x02\x00\x06\x00\x00\x00\x35\x2a\x1b\xb6"
+    b"\x00\x32\x10\x09\xb6\x00\x32\x2c\xb6\x00\x65\x10\x09\xb6\x00\x32\x2d\xb6\x00\x68"
+    b"\x10\x09\xb6\x00\x32\x15\x04\xb6\x00\x6b\x10\x09\xb6\x00\x32\x19\x05\xb6\x00\x6e"
+    b"\xb6\x00\x65\x10\x0a\xb6\x00\x32\x57\xb1\x00\x00\x00\x00\x00\x0a\x00\x30\x00\x31"
+    b"\x00\x01\x00\x07\x00\x00\x00\x46\x00\x03\x00\x03\x00\x00\x00\x2a\xbb\x00\x23\x59"
+    b"\xb7\x00\x52\x10\x28\xb6\x00\x32\x4c\x03\x3d\xa7\x00\x0e\x2b\x2a\x1c\x32\xb8\x00"
+    b"\x48\x57\x84\x02\x01\x1c\x2a\xbe\xa1\xff\xf2\x2b\x10\x29\xb6\x00\x32\xb0\x00\x00"
+    b"\x00\x01\x00\x5e\x00\x00\x00\x0a\x00\x02\xfd\x00\x12\x07\x00\x23\x01\x0a\x00\x0a"
+    b"\x00\x4a\x00\x4b\x00\x01\x00\x07\x00\x00\x00\xcd\x00\x04\x00\x02\x00\x00\x00\xaf"
+    b"\x2b\xb6\x00\x6f\x99\x00\x13\x2a\x2b\xb6\x00\x6e\x10\x2e\x10\x2f\xb6\x00\x73\xb6"
+    b"\x00\x65\xb0\x2b\xb2\x00\x79\xa6\x00\x0a\x2a\x10\x56\xb6\x00\x32\xb0\x2b\xb2\x00"
+    b"\x7f\xa6\x00\x0a\x2a\x10\x5a\xb6\x00\x32\xb0\x2b\xb2\x00\x82\xa6\x00\x0a\x2a\x10"
+    b"\x43\xb6\x00\x32\xb0\x2b\xb2\x00\x85\xa6\x00\x0a\x2a\x10\x42\xb6\x00\x32\xb0\x2b"
+    b"\xb2\x00\x88\xa6\x00\x0a\x2a\x10\x53\xb6\x00\x32\xb0\x2b\xb2\x00\x8b\xa6\x00\x0a"
+    b"\x2a\x10\x49\xb6\x00\x32\xb0\x2b\xb2\x00\x8e\xa6\x00\x0a\x2a\x10\x4a\xb6\x00\x32"
+    b"\xb0\x2b\xb2\x00\x91\xa6\x00\x0a\x2a\x10\x46\xb6\x00\x32\xb0\x2b\xb2\x00\x94\xa6"
+    b"\x00\x0a\x2a\x10\x44\xb6\x00\x32\xb0\x2a\x10\x4c\xb6\x00\x32\x2b\xb6\x00\x6e\x10"
+    b"\x2e\x10\x2f\xb6\x00\x73\xb6\x00\x65\x10\x3b\xb6\x00\x32\xb0\x00\x00\x00\x01\x00"
+    b"\x5e\x00\x00\x00\x0c\x00\x0a\x17\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x00\x00"
+)
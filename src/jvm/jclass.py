@@ -4,19 +4,20 @@
 
 from __future__ import annotations
 
-from typing import Tuple, FrozenSet
+from typing import Tuple, FrozenSet, Callable, Sequence, Dict
 
 import jni
 from .lib import public
 from .lib import cached
 
-from .jconstants  import EJavaModifiers
 from .jmodifiers  import JModifiers
 from .jframe      import JFrame
 from .jstring     import JString
 from .jobjectbase import JObjectBase
 from .jannotated  import JAnnotatedElement
-from ._util       import str2jchars
+from .jstub       import make_stub, JBoundField
+from .jmemberinfo import JMemberInfo
+from .jmetacache  import isCacheableClassLoader
 
 
 @public
@@ -25,6 +26,8 @@ class JClass(JObjectBase, JAnnotatedElement):
 
     __slots__ = ()
 
+    _interning = "identity"  # see JInternTable
+
     name_trans  = bytes.maketrans(b"/.", b"./")
     name_utrans = bytes.maketrans(b"./", b"/.")
 
@@ -32,10 +35,19 @@ class JClass(JObjectBase, JAnnotatedElement):
     def forName(cls, name: str) -> JClass:
         """Returns the Class object associated with the class or interface \
         with the given string name."""
-        with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
-            name = name.encode("utf-8").translate(JClass.name_utrans)
-            jcls = jenv.FindClass(name)
-            return cls.jvm.JClass(jenv, jcls)
+        return cls._findClass(name.encode("utf-8").translate(JClass.name_utrans))
+
+    @classmethod
+    def _findClass(cls, name: bytes) -> JClass:
+        # FindClass, cached per JVM.
+        with cls.jvm as (jvm, jenv):
+            key = (name, None)
+            jclass = jvm.classes.get(key)
+            if jclass is None:
+                with JFrame(jenv, 1):
+                    jcls = jenv.FindClass(name)
+                    jclass = jvm.classes.add(key, cls.jvm.JClass(jenv, jcls))
+            return jclass
 
     @classmethod
     def getVoidClass(cls) -> JClass:
@@ -154,74 +166,54 @@ class JClass(JObjectBase, JAnnotatedElement):
     @classmethod
     def getBooleanArrayClass(cls, ndims: int) -> JClass:
         """Returns the Class object of array of the primitive boolean type."""
-        with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
-            jcls = jenv.FindClass(b"[" * ndims + b"Z")
-            return cls.jvm.JClass(jenv, jcls)
+        return cls._findClass(b"[" * ndims + b"Z")
 
     @classmethod
     def getCharArrayClass(cls, ndims: int) -> JClass:
         """Returns the Class object of array of the primitive char type."""
-        with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
-            jcls = jenv.FindClass(b"[" * ndims + b"C")
-            return cls.jvm.JClass(jenv, jcls)
+        return cls._findClass(b"[" * ndims + b"C")
 
     @classmethod
     def getByteArrayClass(cls, ndims: int) -> JClass:
         """Returns the Class object of array of the primitive byte type."""
-        with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
-            jcls = jenv.FindClass(b"[" * ndims + b"B")
-            return cls.jvm.JClass(jenv, jcls)
+        return cls._findClass(b"[" * ndims + b"B")
 
     @classmethod
     def getShortArrayClass(cls, ndims: int) -> JClass:
         """Returns the Class object of array of the primitive short type."""
-        with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
-            jcls = jenv.FindClass(b"[" * ndims + b"S")
-            return cls.jvm.JClass(jenv, jcls)
+        return cls._findClass(b"[" * ndims + b"S")
 
     @classmethod
     def getIntArrayClass(cls, ndims: int) -> JClass:
         """Returns the Class object of array of the primitive int type."""
-        with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
-            jcls = jenv.FindClass(b"[" * ndims + b"I")
-            return cls.jvm.JClass(jenv, jcls)
+        return cls._findClass(b"[" * ndims + b"I")
 
     @classmethod
     def getLongArrayClass(cls, ndims: int) -> JClass:
         """Returns the Class object of array of the primitive long type."""
-        with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
-            jcls = jenv.FindClass(b"[" * ndims + b"J")
-            return cls.jvm.JClass(jenv, jcls)
+        return cls._findClass(b"[" * ndims + b"J")
 
     @classmethod
     def getFloatArrayClass(cls, ndims: int) -> JClass:
         """Returns the Class object of array of the primitive float type."""
-        with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
-            jcls = jenv.FindClass(b"[" * ndims + b"F")
-            return cls.jvm.JClass(jenv, jcls)
+        return cls._findClass(b"[" * ndims + b"F")
 
     @classmethod
     def getDoubleArrayClass(cls, ndims: int) -> JClass:
         """Returns the Class object of array of the primitive double type."""
-        with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
-            jcls = jenv.FindClass(b"[" * ndims + b"D")
-            return cls.jvm.JClass(jenv, jcls)
+        return cls._findClass(b"[" * ndims + b"D")
 
     @classmethod
     def getStringArrayClass(cls, ndims: int) -> JClass:
         """Returns the Class object of array of java.lang.String type."""
-        with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
-            jcls = jenv.FindClass(b"[" * ndims + b"Ljava/lang/String;")
-            return cls.jvm.JClass(jenv, jcls)
+        return cls._findClass(b"[" * ndims + b"Ljava/lang/String;")
 
     @classmethod
     def getObjectArrayClass(cls, cname: str, ndims: int) -> JClass:
         """Returns the Class object associated with the array of class \
         or interface with the given string name."""
-        with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
-            cname = cname.encode("utf-8").translate(JClass.name_utrans)
-            jcls = jenv.FindClass(b"[" * ndims + b"L" + cname + b";")
-            return cls.jvm.JClass(jenv, jcls)
+        cname = cname.encode("utf-8").translate(JClass.name_utrans)
+        return cls._findClass(b"[" * ndims + b"L" + cname + b";")
 
     def __init__(self, jenv: jni.JNIEnv, jcls: jni.jclass, own: bool = True):
         """Initializer"""
@@ -232,7 +224,7 @@ class JClass(JObjectBase, JAnnotatedElement):
         return super().__hash__()
 
     def __eq__(self, other):
-        """???"""
+        """Indicates whether the other class is the same class."""
 
         if self is other:
             return True
@@ -240,13 +232,7 @@ class JClass(JObjectBase, JAnnotatedElement):
         if not isinstance(other, self.jvm.JClass):
             return NotImplemented
 
-        if self._jobj == other.handle:
-            return True  # pragma: no cover
-
-        if self.hashCode() != other.hashCode():
-            return False
-
-        return True  # and self.getName() == other.getName()
+        return super().__eq__(other)
 
     def asObject(self, own: bool = True) -> JObject:
 
@@ -294,20 +280,11 @@ class JClass(JObjectBase, JAnnotatedElement):
 
         The JModifier class should be used to decode the modifiers in the integer.
         """
-        with self.jvm as (jvm, jenv):
-            jmodif = jenv.CallIntMethod(self._jobj, jvm.Class.getModifiers)
-            modif  = JModifiers(jvm, jenv, jmodif)
-            return JClass.convertModifiers(modif)
+        return JModifiers.of(self.getModifiers()).getModifiersSet()
 
     @staticmethod
     def convertModifiers(modif: JModifiers) -> FrozenSet[int]:
-        res = set()
-        if modif.isPublic:    res.add(EJavaModifiers.PUBLIC)
-        if modif.isProtected: res.add(EJavaModifiers.PROTECTED)
-        if modif.isFinal:     res.add(EJavaModifiers.FINAL)
-        if modif.isStatic:    res.add(EJavaModifiers.STATIC)
-        if modif.isAbstract:  res.add(EJavaModifiers.ABSTRACT)
-        return frozenset(res)
+        return modif.getModifiersSet()
 
     @cached
     def getName(self) -> str:
@@ -472,8 +449,7 @@ class JClass(JObjectBase, JAnnotatedElement):
         """Returns a Field object that reflects the specified declared field of the class \
         or interface represented by this Class object."""
         with self.jvm as (jvm, jenv), JFrame(jenv, 2):
-            jchars, size, jbuf = str2jchars(name)
-            jname = jenv.NewString(jchars, size)
+            jname = jvm.strings.get(jenv, name)
             jargs = jni.new_array(jni.jvalue, 1)
             jargs[0].l = jname  # noqa: E741
             jfld = jenv.CallObjectMethod(self._jobj, jvm.Class.getDeclaredField, jargs)
@@ -496,8 +472,7 @@ class JClass(JObjectBase, JAnnotatedElement):
         """Returns a Field object that reflects the specified public member field \
         of the class or interface represented by this Class object."""
         with self.jvm as (jvm, jenv), JFrame(jenv, 2):
-            jchars, size, jbuf = str2jchars(name)
-            jname = jenv.NewString(jchars, size)
+            jname = jvm.strings.get(jenv, name)
             jargs = jni.new_array(jni.jvalue, 1)
             jargs[0].l = jname  # noqa: E741
             jfld = jenv.CallObjectMethod(self._jobj, jvm.Class.getField, jargs)
@@ -546,6 +521,49 @@ class JClass(JObjectBase, JAnnotatedElement):
                 return tuple(self.jvm.JMethod(jenv, jenv.GetObjectArrayElement(jarr, idx))
                              for idx in range(jlen))
 
+    @cached
+    def getMemberInfos(self) -> Tuple[JMemberInfo, ...]:
+        """Returns the metadata records of all the public constructors, methods \
+        and fields (as getConstructors(), getMethods() and getFields()) of the \
+        class, fetched in one call of org.jt.reflect.ClassInfo."""
+        return self.__describe(False)
+
+    @cached
+    def getDeclaredMemberInfos(self) -> Tuple[JMemberInfo, ...]:
+        """Returns the metadata records of all the constructors, methods and \
+        fields declared by the class (as getDeclaredConstructors(), \
+        getDeclaredMethods() and getDeclaredFields()), fetched in one call \
+        of org.jt.reflect.ClassInfo."""
+        return self.__describe(True)
+
+    def getMemberModifiers(self, declared: bool = False) -> Dict[JMemberInfo, JModifiers]:
+        """Returns the decoded modifiers of all the public (or all the declared) \
+        constructors, methods and fields of the class, fetched in one pass \
+        (see getMemberInfos() and getDeclaredMemberInfos())."""
+        infos = self.getDeclaredMemberInfos() if declared else self.getMemberInfos()
+        return {info: JModifiers.of(info.modifiers) for info in infos}
+
+    def __describe(self, declared: bool) -> Tuple[JMemberInfo, ...]:
+        with self.jvm as (jvm, jenv), JFrame(jenv, 1):
+            cache = jvm.data.get("metadata_cache")
+            if cache is not None:
+                jcld = jenv.CallObjectMethod(self._jobj, jvm.Class.getClassLoader)
+                if not isCacheableClassLoader(jvm, jenv, jcld):
+                    cache = None
+                else:
+                    description = cache.load(jvm, jenv, self.getName(), declared)
+                    if description is not None:
+                        return JMemberInfo.decode(description)
+            jargs = jni.new_array(jni.jvalue, 2)
+            jargs[0].l = self._jobj  # noqa: E741
+            jargs[1].z = declared
+            ClassInfo = jvm.jt_reflect_ClassInfo
+            jstr = jenv.CallStaticObjectMethod(ClassInfo.Class, ClassInfo.describe, jargs)
+            description = JString(jenv, jstr, own=False).str
+            if cache is not None:
+                cache.store(jvm, jenv, self.getName(), declared, description)
+            return JMemberInfo.decode(description)
+
     @cached
     def getPropertyDescriptors(self) -> Tuple[JPropertyDescriptor, ...]:
 
@@ -563,6 +581,44 @@ class JClass(JObjectBase, JAnnotatedElement):
                                                           jenv.GetObjectArrayElement(jarr, idx))
                              for idx in range(jlen))
 
+    def to_columns(self, collection: JObjectBase,
+                   properties: Sequence[str] | None = None) -> Dict[str, JColumn]:
+        """Reads the properties (all the readable ones except 'class' if None) \
+        of every element (instances of this class) of a Collection or an object \
+        array in one pass in Java (by org.jt.reflect.BatchInvoker), into one \
+        JColumn (typed buffer of the values, offsets of strings, validity bitmap) \
+        per property."""
+        descriptors = {descriptor.getName(): descriptor
+                       for descriptor in self.getPropertyDescriptors()}
+        if properties is None:
+            properties = [name for name, descriptor in descriptors.items()
+                          if name != "class" and descriptor.getReadMethod() is not None]
+        getters = []
+        for name in properties:
+            descriptor = descriptors.get(name)
+            getter = descriptor.getReadMethod() if descriptor is not None else None
+            if getter is None:
+                raise ValueError(f"{self.getName()} has no readable property '{name}'")
+            getters.append(getter)
+        with self.jvm as (jvm, jenv), JFrame(jenv, 2):
+            jgetters = jenv.NewObjectArray(len(getters), jvm.Method.Class, None)
+            for idx, getter in enumerate(getters):
+                jenv.SetObjectArrayElement(jgetters, idx, getter.handle)
+            jargs = jni.new_array(jni.jvalue, 2)
+            jargs[0].l = collection.handle  # noqa: E741
+            jargs[1].l = jgetters  # noqa: E741
+            BatchInvoker = jvm.jt_reflect_BatchInvoker
+            jcolumns = jenv.CallStaticObjectMethod(BatchInvoker.Class, BatchInvoker.columns,
+                                                   jargs)
+            columns = {}
+            for idx, (name, getter) in enumerate(zip(properties, getters)):
+                with JFrame(jenv, 1):
+                    jcolumn = jenv.GetObjectArrayElement(jcolumns, idx)
+                    columns[name] = JColumn._fromJava(self.jvm, jenv, name,
+                                                      getter.getReturnType().getName(),
+                                                      jcolumn)
+            return columns
+
     @cached
     def getEnclosingClass(self) -> JClass | None:
         """Returns the immediately enclosing class of the underlying class."""
@@ -594,6 +650,39 @@ class JClass(JObjectBase, JAnnotatedElement):
             jobj = jenv.CallObjectMethod(self._jobj, jvm.Class.newInstance)
             return self.jvm.JObject(jenv, jobj)
 
+    def bindMethod(self, name: str, signature: str, static: bool = False) -> Callable:
+        """Returns a pre-bound call stub (see JMethod.bind()) of the method \
+        (or the constructor if name is '<init>') with the given name and \
+        descriptor, resolved by GetMethodID/GetStaticMethodID without reflection."""
+        constructor = (name == "<init>")
+        with self.jvm as (jvm, jenv):
+            key = ("M", name, signature, static)
+            jmid = self._memberIDs().get(key)
+            if jmid is None:
+                GetMethodID = jenv.GetStaticMethodID if static else jenv.GetMethodID
+                jmid = GetMethodID(self._jobj, name.encode("utf-8"), signature.encode("utf-8"))
+                self._memberIDs()[key] = jmid
+            return make_stub(self.jvm, name, jmid, signature, static,
+                             self if static or constructor else None,
+                             constructor=constructor)
+
+    def bindField(self, name: str, signature: str, static: bool = False) -> JBoundField:
+        """Returns a pre-bound accessor of the field with the given name and \
+        descriptor, resolved by GetFieldID/GetStaticFieldID without reflection."""
+        with self.jvm as (jvm, jenv):
+            key = ("F", name, signature, static)
+            jfid = self._memberIDs().get(key)
+            if jfid is None:
+                GetFieldID = jenv.GetStaticFieldID if static else jenv.GetFieldID
+                jfid = GetFieldID(self._jobj, name.encode("utf-8"), signature.encode("utf-8"))
+                self._memberIDs()[key] = jfid
+            return JBoundField(self.jvm, self, name, signature, jfid, static)
+
+    @cached
+    def _memberIDs(self) -> dict:
+        # Cache of the jmethodIDs/jfieldIDs resolved by bindMethod()/bindField().
+        return {}
+
     @cached
     def getSignature(self) -> str:
         """Returns the class signature."""
@@ -626,3 +715,4 @@ from .jconstructor    import JConstructor         # noqa: E402
 from .jmethod         import JMethod              # noqa: E402
 from .jpropdescriptor import JPropertyDescriptor  # noqa: E402
 from .jobject         import JObject              # noqa: E402
+from .jcolumns        import JColumn              # noqa: E402
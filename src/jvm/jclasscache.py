@@ -0,0 +1,70 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+from __future__ import annotations
+
+from typing import Hashable
+import threading
+from collections import OrderedDict
+
+from .lib import public
+from .lib import obj
+
+from .jarena import JArena
+
+
+@public
+class JClassCache(obj):
+    """Bounded LRU cache of the resolved classes
+
+    keyed by (class name, class loader) - one JClass (so one global reference)
+    per class. A loader of None stands for the default (FindClass) one.
+    """
+
+    __slots__ = ('maxsize', '__classes', '__lock')
+
+    def __init__(self, maxsize: int = 1024):
+        """Initializer"""
+        self.maxsize = maxsize
+        self.__classes = OrderedDict()
+        self.__lock    = threading.Lock()
+
+    def __len__(self):
+        """Length of"""
+        return len(self.__classes)
+
+    def __contains__(self, key: tuple[bytes | str, Hashable]):
+        """Membership test"""
+        return key in self.__classes
+
+    def get(self, key: tuple[bytes | str, Hashable]) -> JClass | None:  # noqa: F821
+        """Returns the cached class of key or None."""
+        classes = self.__classes
+        with self.__lock:
+            jclass = classes.get(key)
+            if jclass is not None:
+                classes.move_to_end(key)
+            return jclass
+
+    def add(self, key: tuple[bytes | str, Hashable], jclass: JClass) -> JClass:  # noqa: F821
+        """Caches the class of key and returns the cached one (the first added \
+        if the class has been concurrently resolved)."""
+        if self.maxsize <= 0: return jclass
+        JArena.escape(jclass)  # shared by all the threads
+        classes = self.__classes
+        evicted = []
+        with self.__lock:
+            jclass = classes.setdefault(key, jclass)
+            classes.move_to_end(key)
+            while len(classes) > self.maxsize:
+                evicted.append(classes.popitem(last=False))
+        del evicted  # released (DeleteGlobalRef) outside of the lock
+        return jclass
+
+    def clear(self):
+        """Removes all the classes from the cache."""
+        with self.__lock:
+            classes = list(self.__classes.values())
+            self.__classes.clear()
+        del classes
@@ -45,20 +45,23 @@ class JClassLoader(JObjectBase):
         method. It is invoked by the Java virtual machine to resolve class references.
         Invoking this method is equivalent to invoking loadClass(name, false).
         """
-        with self.jvm as (jvm, jenv), JFrame(jenv, 2):
-            jchars, size, jbuf = str2jchars(name)
-            jname = jenv.NewString(jchars, size)
-            jargs = jni.new_array(jni.jvalue, 1)
-            jargs[0].l = jname  # noqa: E741
-            jcls = jenv.CallObjectMethod(self._jobj, jvm.ClassLoader.loadClass, jargs)
-            return self.jvm.JClass(jenv, jcls)
+        with self.jvm as (jvm, jenv):
+            key = (name, self)
+            jclass = jvm.classes.get(key)
+            if jclass is None:
+                with JFrame(jenv, 2):
+                    jname = jvm.strings.get(jenv, name)
+                    jargs = jni.new_array(jni.jvalue, 1)
+                    jargs[0].l = jname  # noqa: E741
+                    jcls = jenv.CallObjectMethod(self._jobj, jvm.ClassLoader.loadClass, jargs)
+                    jclass = jvm.classes.add(key, self.jvm.JClass(jenv, jcls))
+            return jclass
 
     def getPackage(self, name: str) -> JPackage | None:
         """Returns a Package that has been defined by this class loader or any of \
         its ancestors."""
         with self.jvm as (jvm, jenv), JFrame(jenv, 2):
-            jchars, size, jbuf = str2jchars(name)
-            jname = jenv.NewString(jchars, size)
+            jname = jvm.strings.get(jenv, name)
             jargs = jni.new_array(jni.jvalue, 1)
             jargs[0].l = jname  # noqa: E741
             jpkg = jenv.CallObjectMethod(self._jobj, jvm.ClassLoader.getPackage, jargs)
@@ -78,8 +81,7 @@ class JClassLoader(JObjectBase):
     def findClass(self, name: str) -> JClass:
         """Finds the class with the specified binary name."""
         with self.jvm as (jvm, jenv), JFrame(jenv, 2):
-            jchars, size, jbuf = str2jchars(name)
-            jname = jenv.NewString(jchars, size)
+            jname = jvm.strings.get(jenv, name)
             jargs = jni.new_array(jni.jvalue, 1)
             jargs[0].l = jname  # noqa: E741
             jcls = jenv.CallObjectMethod(self._jobj, jvm.ClassLoader.findClass, jargs)
@@ -88,8 +90,7 @@ class JClassLoader(JObjectBase):
     def findSystemClass(self, name: str) -> JClass:
         """Finds a class with the specified binary name, loading it if necessary."""
         with self.jvm as (jvm, jenv), JFrame(jenv, 2):
-            jchars, size, jbuf = str2jchars(name)
-            jname = jenv.NewString(jchars, size)
+            jname = jvm.strings.get(jenv, name)
             jargs = jni.new_array(jni.jvalue, 1)
             jargs[0].l = jname  # noqa: E741
             jcls = jenv.CallObjectMethod(self._jobj, jvm.ClassLoader.findSystemClass, jargs)
@@ -99,8 +100,7 @@ class JClassLoader(JObjectBase):
         """Returns the class with the given binary name if this loader has been recorded by the \
         Java virtual machine as an initiating loader of a class with that binary name."""
         with self.jvm as (jvm, jenv), JFrame(jenv, 2):
-            jchars, size, jbuf = str2jchars(name)
-            jname = jenv.NewString(jchars, size)
+            jname = jvm.strings.get(jenv, name)
             jargs = jni.new_array(jni.jvalue, 1)
             jargs[0].l = jname  # noqa: E741
             jcls = jenv.CallObjectMethod(self._jobj, jvm.ClassLoader.findLoadedClass, jargs)
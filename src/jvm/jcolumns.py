@@ -0,0 +1,141 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import jni
+from .lib import public
+from .lib import obj
+
+from .jframe import JFrame
+
+# Primitive and wrapper type names -> JNI type codes of the value buffers.
+_TYPE_CODES = {
+    "boolean": "Z", "java.lang.Boolean":   "Z",
+    "char":    "C", "java.lang.Character": "C",
+    "byte":    "B", "java.lang.Byte":      "B",
+    "short":   "S", "java.lang.Short":     "S",
+    "int":     "I", "java.lang.Integer":   "I",
+    "long":    "J", "java.lang.Long":      "J",
+    "float":   "F", "java.lang.Float":     "F",
+    "double":  "D", "java.lang.Double":    "D",
+}
+
+
+@public
+class JColumn(obj):
+    """Column of the values of a property of a collection of beans
+
+    (see JClass.to_columns()).
+
+    code: JNI type code of the values ('Z', 'C', 'B', 'S', 'I', 'J', 'F', 'D'
+    for primitive and wrapper properties, 'T' for String properties and 'L'
+    for other properties).
+    values: buffer (memoryview) of the values of a primitive or wrapper
+    property (0 for null), of the UTF-16 code units (format 'H') of all the
+    strings of a String property, or a tuple of JObjects (or None) of other
+    properties.
+    offsets: for a String property, the buffer (format 'i') of the offsets
+    of the strings in values (the string i is values[offsets[i]:offsets[i+1]]),
+    else None.
+    validity: bitmap (format 'B') of the non-null values (bit i % 8 of the
+    byte i // 8), None if the property is primitive (never null).
+
+    The buffers are NumPy-compatible (numpy.frombuffer()).
+    """
+
+    __slots__ = ('name', 'typeName', 'code', 'values', 'offsets', 'validity')
+
+    def __init__(self, name: str, typeName: str, code: str, values: memoryview | tuple,
+                 offsets: memoryview | None = None, validity: memoryview | None = None):
+        """Initializer"""
+        self.name     = name
+        self.typeName = typeName
+        self.code     = code
+        self.values   = values
+        self.offsets  = offsets
+        self.validity = validity
+
+    def __len__(self):
+        """Length of"""
+        return len(self.offsets) - 1 if self.offsets is not None else len(self.values)
+
+    def isNull(self, idx: int) -> bool:
+        """Returns True if the value idx is null."""
+        validity = self.validity
+        return validity is not None and not (validity[idx >> 3] >> (idx & 7)) & 1
+
+    def tolist(self) -> list:
+        """Returns the values as a list (with None for null values)."""
+        if self.code == "T":
+            text = self.values.tobytes().decode("utf-16-le", "surrogatepass")
+            offsets = self.offsets
+            if len(text) != offsets[-1]:  # surrogate pairs, so decode one by one
+                text = None
+            values = []
+            for idx in range(len(self)):
+                start, stop = offsets[idx], offsets[idx + 1]
+                values.append(text[start:stop] if text is not None else
+                              self.values[start:stop].tobytes().decode("utf-16-le",
+                                                                       "surrogatepass"))
+        elif self.code == "L":
+            values = list(self.values)
+        elif self.code == "C":
+            values = list(self.values.tobytes().decode("utf-16-le", "surrogatepass"))
+        elif self.code == "Z":
+            values = [bool(val) for val in self.values]
+        else:
+            values = self.values.tolist()
+        if self.validity is not None:
+            values = [None if self.isNull(idx) else val for idx, val in enumerate(values)]
+        return values
+
+    @staticmethod
+    def _fromJava(jvm, jenv: jni.JNIEnv, name: str, typeName: str,
+                  jcolumn: jni.jobjectArray) -> JColumn:
+        # The column from its {values, offsets, validity} of
+        # org.jt.reflect.BatchInvoker.columns().
+        with JFrame(jenv, 4):
+            jvalues   = jenv.GetObjectArrayElement(jcolumn, 0)
+            joffsets  = jenv.GetObjectArrayElement(jcolumn, 1)
+            jvalidity = jenv.GetObjectArrayElement(jcolumn, 2)
+            size = int(jenv.GetArrayLength(jvalues))
+            if joffsets:
+                code = "T"
+                values  = JColumn.__buffer(jenv, jvalues, "C", size)
+                offsets = JColumn.__buffer(jenv, joffsets, "I",
+                                           int(jenv.GetArrayLength(joffsets)))
+            elif typeName in _TYPE_CODES:
+                code = _TYPE_CODES[typeName]
+                values  = JColumn.__buffer(jenv, jvalues, code, size)
+                offsets = None
+            else:
+                code = "L"
+                values  = JColumn.__objects(jvm, jenv, jvalues, size)
+                offsets = None
+            validity = (memoryview(JArray._getRegion(jenv, jvalidity, "B", 0, 1,
+                                                     int(jenv.GetArrayLength(jvalidity))))
+                        if jvalidity else None)
+            return JColumn(name, typeName, code, values, offsets, validity)
+
+    @staticmethod
+    def __buffer(jenv: jni.JNIEnv, jarr: jni.jarray, code: str, size: int) -> memoryview:
+        jbuf = JArray._getRegion(jenv, jarr, code, 0, 1, size)
+        return memoryview(jbuf).cast(JArray._buffer_formats[code])
+
+    @staticmethod
+    def __objects(jvm, jenv: jni.JNIEnv, jarr: jni.jobjectArray,
+                  size: int) -> Tuple[JObject | None, ...]:  # noqa: F821
+        objects = []
+        with JFrame(jenv) as jfrm:
+            for idx in range(size):
+                if not (idx % 256): jfrm.reset(256)
+                jobj = jenv.GetObjectArrayElement(jarr, idx)
+                objects.append(jvm.JObject(jenv, jobj) if jobj else None)
+        return tuple(objects)
+
+
+from .jarray import JArray  # noqa: E402
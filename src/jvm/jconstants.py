@@ -31,6 +31,13 @@ class EJavaModifiers(enum.IntEnum):
     FINAL     = 3
     ABSTRACT  = 4
 
+@public
+class EMatch(enum.IntEnum):
+    NONE     =   0
+    EXPLICIT =   1
+    IMPLICIT =  10
+    PERFECT  = 100
+
 @public
 class EStatusCode(enum.IntEnum):
     SUCCESS   = 1000
@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Tuple, Callable
 
 import jni
 from .lib import public
@@ -13,6 +13,7 @@ from .lib import cached
 from .jframe     import JFrame
 from .jmember    import JMember
 from .jannotated import JAnnotatedElement
+from .jstub      import make_stub
 
 
 @public
@@ -67,6 +68,18 @@ class JConstructor(JMember, JAnnotatedElement):
             jobj = jenv.NewObject(jcls, self._jcid(jenv), jargs.arguments)
             return self.jvm.JObject(jenv, jobj) if jobj else None
 
+    def bind(self) -> Callable:
+        """Returns a pre-bound call stub of this constructor.
+
+        The stub is called with the Python values of the arguments and holds
+        the jmethodID and a reusable argument array. It is bound to the current
+        thread.
+        """
+        with self.jvm as (jvm, jenv):
+            return make_stub(self.jvm, self.getName(), self._jcid(jenv),
+                             self.getSignature(), False, self.getDeclaringClass(),
+                             constructor=True)
+
     @cached
     def getSignature(self) -> str:
         """Returns the constructor signature."""
@@ -0,0 +1,296 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+from __future__ import annotations
+
+from typing import Callable, Tuple
+import threading
+from collections import OrderedDict
+
+import jni
+from .lib import public
+from .lib import obj
+
+from .jconstants      import EJavaModifiers, EMatch
+from .jframe          import JFrame
+from .jobjectbase     import JObjectBase
+from .jtypehandlerabc import TypeHandlerABC
+
+# Python type -> {primitive Java type: (match, JArguments setter)}
+_PRIMITIVE_MATCHES = {
+    bool:  {"boolean": (EMatch.PERFECT,  "setBoolean")},
+    int:   {"long":    (EMatch.PERFECT,  "setLong"),
+            "int":     (EMatch.IMPLICIT, "setInt"),
+            "short":   (EMatch.IMPLICIT, "setShort"),
+            "byte":    (EMatch.IMPLICIT, "setByte"),
+            "double":  (EMatch.IMPLICIT, "setDouble"),
+            "float":   (EMatch.IMPLICIT, "setFloat")},
+    float: {"double":  (EMatch.PERFECT,  "setDouble"),
+            "float":   (EMatch.IMPLICIT, "setFloat")},
+    str:   {"char":    (EMatch.EXPLICIT, "setChar")},
+}
+
+# Python type -> ((box class name, _JVM entry, jvalue field), ...),
+# the first one is the default box.
+_BOXES = {
+    bool:  (("java.lang.Boolean", "Boolean", "z"),),
+    int:   (("java.lang.Long",    "Long",    "j"),
+            ("java.lang.Integer", "Integer", "i"),
+            ("java.lang.Short",   "Short",   "s"),
+            ("java.lang.Byte",    "Byte",    "b")),
+    float: (("java.lang.Double",  "Double",  "d"),
+            ("java.lang.Float",   "Float",   "f")),
+}
+
+# Primitive widening conversions (JLS 5.1.2).
+_WIDENING = {
+    "byte":  frozenset(("short", "int", "long", "float", "double")),
+    "short": frozenset(("int", "long", "float", "double")),
+    "char":  frozenset(("int", "long", "float", "double")),
+    "int":   frozenset(("long", "float", "double")),
+    "long":  frozenset(("float", "double")),
+    "float": frozenset(("double",)),
+}
+
+# Return type -> suffix of the JMethod.call{Static|Instance}<Type> method.
+_RESULT_KINDS = {
+    "void": "Void", "boolean": "Boolean", "char": "Char", "byte": "Byte",
+    "short": "Short", "int": "Int", "long": "Long", "float": "Float",
+    "double": "Double", "java.lang.String": "String",
+}
+
+
+@public
+class JDispatcher(obj):
+    """Overload resolution of Java methods and constructors
+
+    The overloads applicable to the Python arguments are ranked by EMatch
+    levels (the sum over the arguments); ties are broken by the most
+    specific overload (JLS 15.12.2.5). The chosen member and its argument
+    converters are cached by (class, name, types of the arguments), so a
+    call with the same argument types skips the resolution. The types of
+    the arguments are the Python types (for str also whether it is a single
+    character), and for Java objects also their Java classes.
+
+    handler: optional callable returning a TypeHandlerABC (or None) for
+    a parameter type (JClass); its match() and setArgument() then take
+    precedence over the built-in matching of the argument. The matches of
+    the handlers depend on the values of the arguments, so the resolutions
+    in which a handler took part are not cached.
+    """
+
+    __slots__ = ('handler', 'maxsize', '__cache', '__lock')
+
+    def __init__(self, handler: Callable[[JClass], TypeHandlerABC | None] | None = None,
+                 maxsize: int = 4096):
+        """Initializer"""
+        self.handler = handler
+        self.maxsize = maxsize
+        self.__cache = OrderedDict()
+        self.__lock  = threading.Lock()
+
+    def __len__(self):
+        """Length of"""
+        return len(self.__cache)
+
+    def clear(self):
+        """Removes all the resolved overloads from the cache."""
+        with self.__lock:
+            self.__cache.clear()
+
+    def callStatic(self, jcls: JClass, name: str, *args) -> object:
+        """Calls the static method name of jcls best matching the arguments."""
+        member, converters, invoke, _ = self.resolve(jcls, name, args, static=True)
+        with self.jvm.JArguments(len(args), local=True) as jargs:
+            self.__setArguments(jargs, converters, args)
+            return invoke(member, member.getDeclaringClass(), jargs)
+
+    def callInstance(self, this: JObject, name: str, *args) -> object:
+        """Calls the (instance or static) method name of this best matching \
+        the arguments."""
+        member, converters, invoke, static = self.resolve(this.getClass(), name, args)
+        target = member.getDeclaringClass() if static else this
+        with self.jvm.JArguments(len(args), local=True) as jargs:
+            self.__setArguments(jargs, converters, args)
+            return invoke(member, target, jargs)
+
+    def newInstance(self, jcls: JClass, *args) -> JObject | None:
+        """Creates a new instance of jcls by the constructor best matching \
+        the arguments."""
+        member, converters, invoke, _ = self.resolve(jcls, None, args)
+        with self.jvm.JArguments(len(args), local=True) as jargs:
+            self.__setArguments(jargs, converters, args)
+            return invoke(member, jargs)
+
+    def resolve(self, jcls: JClass, name: str | None, args: tuple,
+                static: bool = False) -> Tuple[object, tuple, Callable, bool]:
+        """Returns (member, argument converters, invoker, whether it is static) \
+        of the overload of the method name (constructor if None) of jcls best \
+        matching args."""
+        key = (jcls, name, static, tuple(map(_argkey, args)))
+        cache = self.__cache
+        with self.__lock:
+            resolved = cache.get(key)
+            if resolved is not None:
+                cache.move_to_end(key)
+                return resolved
+        resolved, cacheable = self.__resolve(jcls, name, args, static)
+        if cacheable and self.maxsize > 0:
+            with self.__lock:
+                cache[key] = resolved
+                while len(cache) > self.maxsize:
+                    cache.popitem(last=False)
+        return resolved
+
+    @staticmethod
+    def __setArguments(jargs: JArguments, converters: tuple, args: tuple):
+        for pos, (convert, val) in enumerate(zip(converters, args)):
+            convert(jargs, pos, val)
+
+    def __resolve(self, jcls: JClass, name: str | None, args: tuple, static: bool):
+
+        if name is None:
+            members = jcls.getConstructors()
+        else:
+            members = [meth for meth in jcls.getMethods()
+                       if meth.getName() == name
+                       and (not static or EJavaModifiers.STATIC in meth.getModifiersSet())]
+            # The synthetic bridge methods (of covariant overrides) duplicate
+            # the parameter types of the methods they bridge to.
+            bridged = {meth.getSignature().partition(")")[0]
+                       for meth in members if not meth.isSynthetic()}
+            members = [meth for meth in members if not meth.isSynthetic()
+                       or meth.getSignature().partition(")")[0] not in bridged]
+        candidates = []
+        handled = False  # whether a handler took part in the resolution
+        for member in members:
+            ptypes = member.getParameterTypes()
+            if len(ptypes) != len(args): continue
+            matches = [self.__match(ptype, val) for ptype, val in zip(ptypes, args)]
+            handled = handled or any(by_handler for _, _, by_handler in matches)
+            if all(match > EMatch.NONE for match, _, _ in matches):
+                candidates.append((sum(match for match, _, _ in matches), member, ptypes,
+                                   tuple(convert for _, convert, _ in matches)))
+
+        what = "constructor" if name is None else f"method '{name}'"
+        if not candidates:
+            raise TypeError(f"No {what} of {jcls.getName()} matches the arguments "
+                            f"({', '.join(type(val).__name__ for val in args)})")
+        best_score = max(candidate[0] for candidate in candidates)
+        best = [candidate for candidate in candidates if candidate[0] == best_score]
+        most_specific = [candidate for candidate in best
+                         if all(_isMoreSpecific(candidate[2], other[2])
+                                for other in best if other is not candidate)]
+        if len(most_specific) != 1:
+            raise TypeError(f"Ambiguous {what} of {jcls.getName()} for the arguments "
+                            f"({', '.join(type(val).__name__ for val in args)})")
+        _, member, ptypes, converters = most_specific[0]
+
+        if name is None:
+            static = False
+            invoke = type(member).newInstance
+        else:
+            kind = _RESULT_KINDS.get(member.getReturnType().getName(), "Object")
+            static = EJavaModifiers.STATIC in member.getModifiersSet()
+            mode = "Static" if static else "Instance"
+            invoke = getattr(type(member), f"call{mode}{kind}")
+        return ((member, converters, invoke, static), not handled)
+
+    def __match(self, ptype: JClass, val: object) -> Tuple[EMatch, Callable, bool]:
+        # The match level of the argument val for the parameter type ptype,
+        # the converter setting it into the JArguments and whether it has
+        # been matched by a handler.
+        if self.handler is not None:
+            handler = self.handler(ptype)
+            if handler is not None:
+                return (handler.match(val),
+                        lambda jargs, pos, val: handler.setArgument(ptype, jargs, pos, val),
+                        True)
+        return self.__matchBuiltin(ptype, val) + (False,)
+
+    def __matchBuiltin(self, ptype: JClass, val: object) -> Tuple[EMatch, Callable]:
+        # The built-in match level and converter of the argument.
+
+        pname = ptype.getName()
+        vtype = type(val)
+
+        if ptype.isPrimitive():
+            if vtype is str and len(val) != 1:
+                return (EMatch.NONE, None)  # a char is a single character
+            match, setter = _PRIMITIVE_MATCHES.get(vtype, {}).get(pname, (EMatch.NONE, None))
+            return (match, getattr(self.jvm.JArguments, setter) if setter else None)
+
+        if val is None:
+            return (EMatch.IMPLICIT, self.jvm.JArguments.setObject)
+
+        if vtype is str:
+            if pname == "java.lang.String":
+                return (EMatch.PERFECT, self.jvm.JArguments.setString)
+            with self.jvm as (jvm, jenv):
+                if jenv.IsAssignableFrom(jvm.String.Class, ptype.handle):
+                    return (EMatch.IMPLICIT, self.jvm.JArguments.setString)
+            return (EMatch.NONE, None)
+
+        if vtype in _BOXES:
+            boxes = _BOXES[vtype]
+            box = next((box for box in boxes if box[0] == pname), None)
+            if box is not None:
+                return (EMatch.IMPLICIT, self.__boxer(box))
+            with self.jvm as (jvm, jenv):
+                if jenv.IsAssignableFrom(getattr(jvm, boxes[0][1]).Class, ptype.handle):
+                    return (EMatch.EXPLICIT, self.__boxer(boxes[0]))
+            return (EMatch.NONE, None)
+
+        if isinstance(val, JObjectBase):
+            vclass = val.getClass()
+            if ptype.isAssignableFrom(vclass):
+                match = EMatch.PERFECT if ptype == vclass else EMatch.IMPLICIT
+                if isinstance(val, self.jvm.JClass):
+                    return (match, self.jvm.JArguments.setClass)
+                if isinstance(val, self.jvm.JArray):
+                    return (match, self.jvm.JArguments.setArray)
+                return (match, self.jvm.JArguments.setObject)
+
+        return (EMatch.NONE, None)
+
+    def __boxer(self, box: tuple) -> Callable:
+        # Converter of a Python bool/int/float to the box Java object.
+        _, entry, field = box
+
+        def convert(jargs, pos, val, self=self):
+            with self.jvm as (jvm, jenv), JFrame(jenv, 1):
+                Box = getattr(jvm, entry)
+                jval = jni.new_array(jni.jvalue, 1)
+                setattr(jval[0], field, val)
+                jobj = jenv.CallStaticObjectMethod(Box.Class, Box.valueOf, jval)
+                jargs.setObject(pos, self.jvm.JObject(jenv, jobj))
+
+        return convert
+
+
+def _argkey(val: object) -> object:
+    # Key of an argument in the dispatch cache.
+    if isinstance(val, JObjectBase):
+        return (type(val), val.getClass())
+    if isinstance(val, str):
+        return (str, len(val) == 1)  # (matches a char)
+    return type(val)
+
+
+def _isSubtype(ptype: JClass, other: JClass) -> bool:
+    # ptype <: other (JLS 4.10) for the most specific overload.
+    if ptype.isPrimitive() or other.isPrimitive():
+        if not (ptype.isPrimitive() and other.isPrimitive()): return False
+        pname, oname = ptype.getName(), other.getName()
+        return pname == oname or oname in _WIDENING.get(pname, ())
+    return other.isAssignableFrom(ptype)
+
+
+def _isMoreSpecific(ptypes: tuple, other: tuple) -> bool:
+    return all(_isSubtype(ptype, optype) for ptype, optype in zip(ptypes, other))
+
+
+from .jclass     import JClass      # noqa: E402
+from .jobject    import JObject     # noqa: E402
+from .jarguments import JArguments  # noqa: E402
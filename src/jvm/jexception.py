@@ -29,12 +29,14 @@ class JException(JObjectBase):
         """Initializer"""
         self._jobj   = jni.obj(jni.jthrowable)
         self.__jinfo = jni.obj(jni.jstring)
+        self._ihash  = None
         _, jenv = self.jvm
         # try:
         jthr  = thr.getCause()
         jinfo = thr.getInfo()
         self._jobj   = jni.cast(jenv.NewGlobalRef(jthr)  if jthr  else 0, jni.jthrowable)
         self.__jinfo = jni.cast(jenv.NewGlobalRef(jinfo) if jinfo else 0, jni.jstring)
+        if jthr: self._track(jenv)
         # except jni.Throwable as exc:
         #     JException.__handle_unexpected(exc)
         # except Exception as exc:
@@ -42,11 +44,8 @@ class JException(JObjectBase):
 
     def __del__(self):
         """Finalizer"""
-        try: jvm, jenv = self.jvm
-        except Exception: return  # pragma: no cover
-        if jvm.jnijvm:
-            jenv.DeleteGlobalRef(self._jobj)
-            jenv.DeleteGlobalRef(self.__jinfo)
+        if not self.jvm: return
+        self.jvm._release(self._jobj, self.__jinfo)
 
     @classmethod
     def __handle_unexpected(cls, thr: jni.Throwable):
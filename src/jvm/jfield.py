@@ -226,6 +226,18 @@ class JField(JMember, JAnnotatedElement):
             jobj = jenv.GetObjectField(this.handle, self._jfid(jenv))
             return self.jvm.JObject(jenv, jobj) if jobj else None
 
+    def getAll(self, receivers: JObjectBase) -> JArray:
+        """Returns the values of this instance field of every element of \
+        receivers (an Object[] or an Iterable) in one call (by \
+        org.jt.reflect.BatchInvoker), as an array typed by the type of the field."""
+        with self.jvm as (jvm, jenv), JFrame(jenv, 1):
+            jargs = jni.new_array(jni.jvalue, 2)
+            jargs[0].l = receivers.handle  # noqa: E741
+            jargs[1].l = self._jobj  # noqa: E741
+            jarr = jenv.CallStaticObjectMethod(jvm.jt_reflect_BatchInvoker.Class,
+                                               jvm.jt_reflect_BatchInvoker.get, jargs)
+            return self.jvm.JArray(jenv, jarr)
+
     def setBoolean(self, this: JObject, val: bool):
         """Sets the value of an instance field as a boolean on the specified \
         object."""
@@ -300,5 +312,7 @@ class JField(JMember, JAnnotatedElement):
         return self.getType().getSignature()
 
 
-from .jclass  import JClass   # noqa: E402
-from .jobject import JObject  # noqa: E402
+from .jobjectbase import JObjectBase  # noqa: E402
+from .jclass      import JClass       # noqa: E402
+from .jobject     import JObject      # noqa: E402
+from .jarray      import JArray       # noqa: E402
@@ -8,6 +8,8 @@ import jni
 from .lib import public
 from .lib import obj
 
+from .jarena import _local
+
 # A default number of local references to reserve when using the
 # PushLocalFrame JNI method. Most native jvm methods need a few local java
 # references that are deleted before the method returns. Rather than trying
@@ -25,25 +27,48 @@ JLOCAL_REFS = 0  # 16
 @public
 class JFrame(obj):
 
-    __slots__ = ('__jenv', '__size')
+    __slots__ = ('__jenv', '__size', '__arena', '__absorbed')
 
     def __init__(self, jenv: jni.JNIEnv, size: int = 0):
         """Initializer"""
         self.__jenv = jenv
         self.__size = max(size, JLOCAL_REFS) if size else 0
+        self.__arena    = None
+        self.__absorbed = False
 
     def __enter__(self):
         """Enter context"""
-        if self.__size: self.__jenv.PushLocalFrame(self.__size)
+        if self.__size: self.__push()
         return self
 
     def __exit__(self, *exc_info):
         """Exit context"""
         del exc_info
         if not self.__jenv: return
-        if self.__size: self.__jenv.PopLocalFrame(jni.NULL)
+        if self.__size: self.__pop()
 
     def reset(self, size: int | None = None):
-        if self.__size: self.__jenv.PopLocalFrame(jni.NULL)
+        # A frame which is reset (e.g. every n iterations of a loop) releases
+        # its local references, so it is never absorbed by an arena.
+        if self.__size: self.__pop()
         if size is not None: self.__size = size
-        if self.__size: self.__jenv.PushLocalFrame(self.__size)
+        if self.__size: self.__push(absorb=False)
+
+    def __push(self, absorb: bool = True):
+        # Inside an arena (see JArena) the local references are reserved
+        # in the arena frame if possible.
+        arena = _local.arena
+        if absorb and arena is not None and arena._absorb(self.__size):
+            self.__absorbed = True
+            return
+        self.__jenv.PushLocalFrame(self.__size)
+        if arena is not None: arena._pushed(+1)
+        self.__arena = arena
+
+    def __pop(self):
+        if self.__absorbed:
+            self.__absorbed = False
+            return
+        self.__jenv.PopLocalFrame(jni.NULL)
+        if self.__arena is not None: self.__arena._pushed(-1)
+        self.__arena = None
@@ -11,6 +11,7 @@ from .lib import public
 from .lib import platform
 
 from .jhostabc import JHostABC
+from .jarena   import JArena
 
 PyEval_SaveThread    = lambda *args, **kwargs: None  # !!! Py_UNBLOCK_THREADS
 PyEval_RestoreThread = lambda *args, **kwargs: None  # !!! Py_BLOCK_THREADS
@@ -57,17 +58,19 @@ class JHost(JHostABC):
     class CallbackState(JHostABC.CallbackState):
         """???"""
 
-        __slots__ = ('ctx', '_state')
+        __slots__ = ('ctx', '_state', '_arena')
 
         def __init__(self, ctx=None):
             """Initializer"""
             self.ctx    = ctx
             self._state = None
+            self._arena = None
 
         def __enter__(self):
             """Enter context"""
             try:
                 self._state = None  # PyGILState_Ensure()
+                self._arena = JArena._suspend()
                 # make sure the thread-local is initialized
                 try:
                     jvm, jenv = self.ctx
@@ -85,6 +88,7 @@ class JHost(JHostABC):
         def __exit__(self, *exc_info):
             """Exit context"""
             del exc_info
+            JArena._resume(self._arena)
             # PyGILState_Release(self._state)
 
     @classmethod
@@ -0,0 +1,116 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import deque
+
+import jni
+from .lib import public
+from .lib import obj
+from .lib import adict
+
+
+@public
+class JInternTable(obj):
+    """Table of the canonical wrappers of the reflection objects
+
+    (JClass, JField, JMethod, JConstructor): a new owning wrapper of a Java
+    object which is already wrapped by a live canonical wrapper is not created,
+    the canonical one is returned instead (so all the equal reflection objects
+    share one wrapper, one global reference and the @cached metadata).
+
+    The classes are keyed by their identity hash code and matched by
+    IsSameObject. The members are keyed by hashCode() and matched by equals(),
+    as the reflection API returns a new copy of a Field/Method/Constructor
+    on every call. The table holds the wrappers weakly.
+    """
+
+    __slots__ = ('__lock', '__wrappers', '__dead', '__hits', '__misses')
+
+    def __init__(self):
+        """Initializer"""
+        self.__lock     = threading.Lock()
+        self.__wrappers = {}       # (wrapper type, hash) -> [weakref(wrapper), ...]
+        # The weakref callbacks (run by the garbage collector, possibly while
+        # the lock is held) only append the keys of the dead wrappers (atomic).
+        self.__dead     = deque()
+        self.__hits     = 0
+        self.__misses   = 0
+
+    def __len__(self):
+        """Length of"""
+        with self.__lock:
+            return sum(len(refs) for refs in self.__wrappers.values())
+
+    def get(self, cls: type, jenv: jni.JNIEnv,
+            jobj: jni.jobject) -> JObjectBase | None:  # noqa: F821
+        """Returns the canonical wrapper of type cls of the Java object (or None)."""
+        jvm = cls.jvm._jvm
+        key = (cls, _hash(jvm, jenv, jobj, cls._interning))
+        with self.__lock:
+            refs = self.__wrappers.get(key)
+            refs = tuple(refs) if refs else ()
+        for ref in refs:
+            wrapper = ref()
+            if wrapper is not None and _same(jvm, jenv, wrapper.handle, jobj, cls._interning):
+                self.__hits += 1
+                return wrapper
+        self.__misses += 1
+        return None
+
+    def add(self, jenv: jni.JNIEnv, wrapper: JObjectBase):  # noqa: F821
+        """Adds the new canonical wrapper (with its own global reference)."""
+        cls = type(wrapper)
+        key = (cls, wrapper.identityHashCode() if cls._interning == "identity" else
+                    _hash(cls.jvm._jvm, jenv, wrapper.handle, cls._interning))
+        dead = self.__dead
+        with self.__lock:
+            wrappers = self.__wrappers
+            while dead:
+                dead_key = dead.popleft()
+                refs = wrappers.get(dead_key)
+                if refs is None: continue
+                refs[:] = [ref for ref in refs if ref() is not None]
+                if not refs: del wrappers[dead_key]
+            wrappers.setdefault(key, []).append(weakref.ref(wrapper,
+                                                            lambda ref: dead.append(key)))
+
+    def clear(self):
+        """Removes all the wrappers from the table."""
+        with self.__lock:
+            self.__wrappers.clear()
+            self.__dead.clear()
+
+    def stats(self) -> adict:
+        """Returns the metrics of the table:
+
+        size: number of the (live or not yet purged) canonical wrappers,
+        hits: number of the wrappers not created (the canonical one returned),
+        misses: number of the canonical wrappers created.
+        """
+        return adict(size=len(self), hits=self.__hits, misses=self.__misses)
+
+
+def _hash(jvm, jenv: jni.JNIEnv, jobj: jni.jobject, interning: str) -> int:
+    if interning == "identity":
+        jargs = jni.new_array(jni.jvalue, 1)
+        jargs[0].l = jobj  # noqa: E741
+        return int(jenv.CallStaticIntMethod(jvm.System.Class, jvm.System.identityHashCode,
+                                            jargs))
+    else:
+        return int(jenv.CallIntMethod(jobj, jvm.Object.hashCode))
+
+
+def _same(jvm, jenv: jni.JNIEnv, jobj1: jni.jobject, jobj2: jni.jobject,
+          interning: str) -> bool:
+    if jenv.IsSameObject(jobj1, jobj2):
+        return True
+    if interning == "identity":
+        return False
+    jargs = jni.new_array(jni.jvalue, 1)
+    jargs[0].l = jobj2  # noqa: E741
+    return bool(jenv.CallBooleanMethod(jobj1, jvm.Object.equals, jargs))
@@ -21,6 +21,8 @@ class JMember(JObjectBase):
 
     __slots__ = ()
 
+    _interning = "value"  # see JInternTable
+
     @cached
     def getDeclaringClass(self) -> JClass:  # noqa: F821 # !!!
         """Returns the Class object representing the class or interface \
@@ -55,10 +57,7 @@ class JMember(JObjectBase):
 
         The JModifier class should be used to decode the modifiers in the integer.
         """
-        with self.jvm as (jvm, jenv):
-            jmodif = jenv.CallIntMethod(self._jobj, jvm.Member.getModifiers)
-            modif  = JModifiers(jvm, jenv, jmodif)
-            return self.jvm.JClass.convertModifiers(modif)
+        return JModifiers.of(self.getModifiers()).getModifiersSet()
 
     @cached
     def isSynthetic(self) -> bool:
@@ -0,0 +1,127 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+from __future__ import annotations
+
+from typing import FrozenSet, Tuple
+
+from .lib import public
+from .lib import obj
+
+from .jmodifiers import JModifiers
+from .jmodifiers import (PUBLIC, PRIVATE, PROTECTED, STATIC, FINAL,  # noqa: F401
+                         SYNCHRONIZED, VOLATILE, TRANSIENT, NATIVE,
+                         INTERFACE, ABSTRACT, STRICT, SYNTHETIC)
+
+
+@public
+class JMemberInfo(obj):
+    """Metadata record of a constructor, method or field
+
+    kind: 'C' (constructor), 'M' (method) or 'F' (field).
+    name: name of the member ('<init>' for a constructor).
+    signature: JNI descriptor of the member (usable by JClass.bindMethod()
+    and JClass.bindField()).
+    modifiers: Java language modifiers, decoded locally.
+    declaringClass: name of the declaring class.
+    """
+
+    __slots__ = ('kind', 'name', 'signature', 'modifiers', 'declaringClass')
+
+    def __init__(self, kind: str, name: str, signature: str, modifiers: int,
+                 declaringClass: str):
+        """Initializer"""
+        self.kind           = kind
+        self.name           = name
+        self.signature      = signature
+        self.modifiers      = modifiers
+        self.declaringClass = declaringClass
+
+    def __repr__(self):
+        """Representation of"""
+        return (f"{type(self).__name__}({self.kind!r}, {self.name!r}, {self.signature!r}, "
+                f"{self.modifiers!r}, {self.declaringClass!r})")
+
+    def __eq__(self, other):
+        """Equality of the records"""
+        if not isinstance(other, JMemberInfo): return NotImplemented
+        return self.__key() == other.__key()
+
+    def __hash__(self):
+        """Hash value"""
+        return hash(self.__key())
+
+    def __key(self):
+        return (self.kind, self.name, self.signature, self.modifiers, self.declaringClass)
+
+    @property
+    def isConstructor(self) -> bool:
+        """Whether the member is a constructor."""
+        return self.kind == "C"
+
+    @property
+    def isMethod(self) -> bool:
+        """Whether the member is a method."""
+        return self.kind == "M"
+
+    @property
+    def isField(self) -> bool:
+        """Whether the member is a field."""
+        return self.kind == "F"
+
+    @property
+    def isPublic(self) -> bool:
+        """Whether the member is public."""
+        return bool(self.modifiers & PUBLIC)
+
+    @property
+    def isProtected(self) -> bool:
+        """Whether the member is protected."""
+        return bool(self.modifiers & PROTECTED)
+
+    @property
+    def isPrivate(self) -> bool:
+        """Whether the member is private."""
+        return bool(self.modifiers & PRIVATE)
+
+    @property
+    def isFinal(self) -> bool:
+        """Whether the member is final."""
+        return bool(self.modifiers & FINAL)
+
+    @property
+    def isStatic(self) -> bool:
+        """Whether the member is static."""
+        return bool(self.modifiers & STATIC)
+
+    @property
+    def isAbstract(self) -> bool:
+        """Whether the member is abstract."""
+        return bool(self.modifiers & ABSTRACT)
+
+    @property
+    def isNative(self) -> bool:
+        """Whether the member is native."""
+        return bool(self.modifiers & NATIVE)
+
+    @property
+    def isSynthetic(self) -> bool:
+        """Whether the member is synthetic."""
+        return bool(self.modifiers & SYNTHETIC)
+
+    def getModifiersSet(self) -> FrozenSet[int]:
+        """Returns the modifiers as a set of EJavaModifiers \
+        (the same as of the corresponding JMember)."""
+        return JModifiers.of(self.modifiers).getModifiersSet()
+
+    @staticmethod
+    def decode(description: str) -> Tuple[JMemberInfo, ...]:
+        """Decodes the members described by org.jt.reflect.ClassInfo.describe()."""
+        names = {}  # one str object per name of a declaring class
+        infos = []
+        for line in description.splitlines():
+            kind, name, signature, modifiers, declaringClass = line.split("\t")
+            declaringClass = names.setdefault(declaringClass, declaringClass)
+            infos.append(JMemberInfo(kind, name, signature, int(modifiers), declaringClass))
+        return tuple(infos)
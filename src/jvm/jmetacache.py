@@ -0,0 +1,155 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+from __future__ import annotations
+
+from pathlib import Path
+import os
+import threading
+import hashlib
+import tempfile
+import zlib
+
+import jni
+from .lib import public
+from .lib import obj
+
+from .jframe  import JFrame
+from .jstring import JString
+
+# Magic of the files of the cache (bumped on any change of their format).
+_MAGIC = b"JTMI\x02"
+
+
+@public
+class JMetadataCache(obj):
+    """Persistent on-disk cache of the class metadata
+
+    (the descriptions of the members of classes by org.jt.reflect.ClassInfo,
+    see JClass.getMemberInfos()), stored in the directory under a subdirectory
+    named by the fingerprint of the class path (path, size and modification
+    time of its entries, and of the class files under its directory entries)
+    and of the JVM version. Every class is stored in its own file (named by
+    a hash of the class name, holding the class name and the zlib-compressed
+    description), so it is loaded lazily on the first request of its
+    metadata. Only the classes of the bootstrap, platform and system class
+    loaders are cached. Enabled by JVM.start() or JVM.attach() with
+    metadata_cache=directory.
+    """
+
+    __slots__ = ('directory', '__fingerprint', '__lock')
+
+    def __init__(self, directory: str | os.PathLike):
+        """Initializer"""
+        self.directory = Path(directory)
+        self.__fingerprint = None
+        self.__lock = threading.Lock()
+
+    def fingerprint(self, jvm, jenv: jni.JNIEnv) -> str:
+        """Returns the fingerprint of the class path and the JVM version."""
+        if self.__fingerprint is None:
+            digest = hashlib.sha256()
+            for name in ("java.vm.name", "java.vm.version", "java.version"):
+                digest.update(f"{name}={_getProperty(jvm, jenv, name)}\n".encode("utf-8"))
+            class_path = _getProperty(jvm, jenv, "java.class.path") or ""
+            for stamp in _classPathStamps(class_path):
+                digest.update(stamp.encode("utf-8", "surrogatepass"))
+            with self.__lock:
+                self.__fingerprint = digest.hexdigest()[:32]
+        return self.__fingerprint
+
+    def load(self, jvm, jenv: jni.JNIEnv, class_name: str, declared: bool) -> str | None:
+        """Returns the cached description of the members of the class \
+        (or None if not cached)."""
+        try:
+            data = self.__path(jvm, jenv, class_name, declared).read_bytes()
+        except OSError:
+            return None
+        # The class name is verified (the file names are hashes).
+        header = _MAGIC + class_name.encode("utf-8", "surrogatepass") + b"\0"
+        if not data.startswith(header): return None
+        try:
+            return zlib.decompress(data[len(header):]).decode("utf-8", "surrogatepass")
+        except (zlib.error, UnicodeDecodeError):
+            return None
+
+    def store(self, jvm, jenv: jni.JNIEnv, class_name: str, declared: bool, description: str):
+        """Stores the description of the members of the class into the cache \
+        (silently skipped if the directory is not writable)."""
+        path = self.__path(jvm, jenv, class_name, declared)
+        data = (_MAGIC + class_name.encode("utf-8", "surrogatepass") + b"\0"
+                + zlib.compress(description.encode("utf-8", "surrogatepass")))
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Written into a temporary file and renamed, so concurrent
+            # processes never see a partially written file.
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    file.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    def clear(self):
+        """Removes the metadata cached for the current fingerprint."""
+        if self.__fingerprint is None: return
+        directory = self.directory/self.__fingerprint
+        for path in directory.glob("*.jmi"):
+            try: path.unlink()
+            except OSError: pass
+
+    def __path(self, jvm, jenv: jni.JNIEnv, class_name: str, declared: bool) -> Path:
+        # Named by a hash of the class name (the class names differing only
+        # in case would collide on case-insensitive file systems).
+        name = hashlib.sha256(class_name.encode("utf-8", "surrogatepass")).hexdigest()[:32]
+        suffix = ".declared.jmi" if declared else ".jmi"
+        return self.directory/self.fingerprint(jvm, jenv)/(name + suffix)
+
+
+def isCacheableClassLoader(jvm, jenv: jni.JNIEnv, jcld: jni.jobject) -> bool:
+    """Checks if the class loader is the bootstrap (NULL), system class loader \
+    or one of its ancestors (platform class loader)."""
+    if not jcld: return True
+    ClassLoader = jvm.ClassLoader
+    with JFrame(jenv, 4):
+        jloader = jenv.CallStaticObjectMethod(ClassLoader.Class, ClassLoader.getSystemClassLoader)
+        while jloader:
+            if jenv.IsSameObject(jloader, jcld): return True
+            jloader = jenv.CallObjectMethod(jloader, ClassLoader.getParent)
+    return False
+
+
+def _classPathStamps(class_path: str):
+    # The path, size and modification time of the entries of the class path
+    # and of the class files under its directory entries (a directory's own
+    # modification time changes only with its direct entries).
+    for entry in class_path.split(os.pathsep):
+        yield _stamp(entry)
+        if os.path.isdir(entry):
+            for root, dirs, files in os.walk(entry):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(".class"):
+                        yield _stamp(os.path.join(root, name))
+
+
+def _stamp(path: str) -> str:
+    try:
+        stat = os.stat(path)
+        size, mtime = stat.st_size, stat.st_mtime_ns
+    except OSError:
+        size, mtime = -1, -1
+    return f"{path}\0{size}\0{mtime}\n"
+
+
+def _getProperty(jvm, jenv: jni.JNIEnv, name: str) -> str | None:
+    with JFrame(jenv, 2):
+        jargs = jni.new_array(jni.jvalue, 1)
+        jargs[0].l = jvm.strings.get(jenv, name)  # noqa: E741
+        jstr = jenv.CallStaticObjectMethod(jvm.System.Class, jvm.System.getProperty, jargs)
+        return JString(jenv, jstr, own=False).str if jstr else None
@@ -4,16 +4,18 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Tuple, Callable
 
 import jni
 from .lib import public
 from .lib import cached
 
+from .jconstants import EJavaModifiers
 from .jframe     import JFrame
 from .jmember    import JMember
 from .jannotated import JAnnotatedElement
 from .jstring    import JString
+from .jstub      import make_stub
 
 
 @public
@@ -70,6 +72,20 @@ class JMethod(JMember, JAnnotatedElement):
         return ("(" + "".join(jcls.getSignature() for jcls in self.getParameterTypes()) + ")"
                 + self.getReturnType().getSignature())
 
+    def bind(self, target: JObject | JClass | None = None) -> Callable:
+        """Returns a pre-bound call stub of this method.
+
+        The stub is called with the Python values of the arguments (preceded
+        by the instance if target is None for an instance method) and holds
+        the jmethodID, the result converter and a reusable argument array.
+        It is bound to the current thread.
+        """
+        with self.jvm as (jvm, jenv):
+            static = EJavaModifiers.STATIC in self.getModifiersSet()
+            if static and target is None: target = self.getDeclaringClass()
+            return make_stub(self.jvm, self.getName(), self._jmid(jenv),
+                             self.getSignature(), static, target)
+
     def callStaticVoid(self, jcls: JClass, jargs: JArguments) -> None:
         """???."""
         with self.jvm as (jvm, jenv):
@@ -186,7 +202,28 @@ class JMethod(JMember, JAnnotatedElement):
             jobj = jenv.CallObjectMethod(this.handle, self._jmid(jenv), jargs.arguments)
             return self.jvm.JObject(jenv, jobj) if jobj else None
 
+    def callInstanceAll(self, receivers: JObjectBase,
+                        args: JArray | None = None) -> JArray | None:
+        """Calls this method on every element of receivers (an Object[] \
+        or an Iterable) in one call (by org.jt.reflect.BatchInvoker).
+
+        args: the (boxed) arguments as an Object[] (None if no arguments).
+        Returns the array of the results typed by the return type of the method \
+        (int[] for int, String[] for String, ...; None for void), convertible \
+        in bulk by JArray.toBuffer(), JArray.to_numpy() or JArray.getStringList().
+        """
+        with self.jvm as (jvm, jenv), JFrame(jenv, 1):
+            jargs = jni.new_array(jni.jvalue, 3)
+            jargs[0].l = receivers.handle  # noqa: E741
+            jargs[1].l = self._jobj  # noqa: E741
+            jargs[2].l = args.handle if args is not None else jni.NULL  # noqa: E741
+            jarr = jenv.CallStaticObjectMethod(jvm.jt_reflect_BatchInvoker.Class,
+                                               jvm.jt_reflect_BatchInvoker.invoke, jargs)
+            return self.jvm.JArray(jenv, jarr) if jarr else None
+
 
+from .jobjectbase import JObjectBase  # noqa: E402
 from .jclass     import JClass      # noqa: E402
 from .jarguments import JArguments  # noqa: E402
+from .jarray     import JArray      # noqa: E402
 from .jobject    import JObject     # noqa: E402
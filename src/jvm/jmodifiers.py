@@ -4,27 +4,150 @@
 
 from __future__ import annotations
 
-import jni
+from typing import FrozenSet
+import functools
+
 from .lib import public
 from .lib import obj
 
+from .jconstants import EJavaModifiers
+
+# Bits of the modifiers (java.lang.reflect.Modifier).
+PUBLIC       = 0x0001
+PRIVATE      = 0x0002
+PROTECTED    = 0x0004
+STATIC       = 0x0008
+FINAL        = 0x0010
+SYNCHRONIZED = 0x0020
+VOLATILE     = 0x0040
+TRANSIENT    = 0x0080
+NATIVE       = 0x0100
+INTERFACE    = 0x0200
+ABSTRACT     = 0x0400
+STRICT       = 0x0800
+SYNTHETIC    = 0x1000
+
+_MODIFIERS_SET_BITS = (
+    (PUBLIC,    EJavaModifiers.PUBLIC),
+    (PROTECTED, EJavaModifiers.PROTECTED),
+    (FINAL,     EJavaModifiers.FINAL),
+    (STATIC,    EJavaModifiers.STATIC),
+    (ABSTRACT,  EJavaModifiers.ABSTRACT),
+)
+
 
 @public
 class JModifiers(obj):
+    """Decoded Java language modifiers
+
+    (decoded locally by bit tests, as java.lang.reflect.Modifier does).
+    """
+
+    __slots__ = ('modif',)
+
+    def __init__(self, *args):
+        """Initializer
+
+        JModifiers(modif), or JModifiers(jvm, jenv, modif) as before
+        (jvm and jenv are not used anymore).
+        """
+        if len(args) not in (1, 3):
+            raise TypeError(f"JModifiers() takes 1 or 3 arguments ({len(args)} given)")
+        self.modif = int(args[-1])
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def of(modif: int) -> JModifiers:
+        """Returns the shared (immutable) decoded modifiers of the integer."""
+        return JModifiers(modif)
+
+    def __repr__(self):
+        """Representation of"""
+        return f"{type(self).__name__}(0x{self.modif:04X})"
+
+    def __eq__(self, other):
+        """Equality of the modifiers"""
+        if not isinstance(other, JModifiers): return NotImplemented
+        return self.modif == other.modif
+
+    def __hash__(self):
+        """Hash value"""
+        return hash(self.modif)
+
+    @property
+    def isPublic(self) -> bool:
+        """Whether the public modifier is set."""
+        return bool(self.modif & PUBLIC)
+
+    @property
+    def isPrivate(self) -> bool:
+        """Whether the private modifier is set."""
+        return bool(self.modif & PRIVATE)
+
+    @property
+    def isProtected(self) -> bool:
+        """Whether the protected modifier is set."""
+        return bool(self.modif & PROTECTED)
+
+    @property
+    def isStatic(self) -> bool:
+        """Whether the static modifier is set."""
+        return bool(self.modif & STATIC)
+
+    @property
+    def isFinal(self) -> bool:
+        """Whether the final modifier is set."""
+        return bool(self.modif & FINAL)
+
+    @property
+    def isSynchronized(self) -> bool:
+        """Whether the synchronized modifier is set."""
+        return bool(self.modif & SYNCHRONIZED)
+
+    @property
+    def isVolatile(self) -> bool:
+        """Whether the volatile modifier is set."""
+        return bool(self.modif & VOLATILE)
+
+    @property
+    def isTransient(self) -> bool:
+        """Whether the transient modifier is set."""
+        return bool(self.modif & TRANSIENT)
+
+    @property
+    def isNative(self) -> bool:
+        """Whether the native modifier is set."""
+        return bool(self.modif & NATIVE)
+
+    @property
+    def isInterface(self) -> bool:
+        """Whether the interface modifier is set."""
+        return bool(self.modif & INTERFACE)
+
+    @property
+    def isAbstract(self) -> bool:
+        """Whether the abstract modifier is set."""
+        return bool(self.modif & ABSTRACT)
+
+    @property
+    def isStrict(self) -> bool:
+        """Whether the strict modifier is set."""
+        return bool(self.modif & STRICT)
+
+    @property
+    def isSynthetic(self) -> bool:
+        """Whether the synthetic modifier is set."""
+        return bool(self.modif & SYNTHETIC)
+
+    def getModifiersSet(self) -> FrozenSet[int]:
+        """Returns the modifiers as a set of EJavaModifiers \
+        (the same as of the corresponding JMember)."""
+        return _modifiersSet(self.modif & _MODIFIERS_SET_MASK)
+
+
+_MODIFIERS_SET_MASK = PUBLIC | PROTECTED | FINAL | STATIC | ABSTRACT
+
 
-    __slots__ = ('isPublic', 'isProtected', 'isPrivate', 'isFinal', 'isStatic', 'isAbstract',
-                 'modif')
-
-    def __init__(self, jvm, jenv: jni.JNIEnv, modif: int):
-        """Initializer"""
-        Modif = jvm.Modifier
-        jcls = Modif.Class
-        jmod = jni.new_array(jni.jvalue, 1)
-        jmod[0].i = modif
-        self.isPublic    = jenv.CallStaticBooleanMethod(jcls, Modif.isPublic,    jmod)
-        self.isProtected = jenv.CallStaticBooleanMethod(jcls, Modif.isProtected, jmod)
-        self.isPrivate   = jenv.CallStaticBooleanMethod(jcls, Modif.isPrivate,   jmod)
-        self.isFinal     = jenv.CallStaticBooleanMethod(jcls, Modif.isFinal,     jmod)
-        self.isStatic    = jenv.CallStaticBooleanMethod(jcls, Modif.isStatic,    jmod)
-        self.isAbstract  = jenv.CallStaticBooleanMethod(jcls, Modif.isAbstract,  jmod)
-        self.modif       = modif
+@functools.lru_cache(maxsize=None)
+def _modifiersSet(modif: int) -> FrozenSet[int]:
+    return frozenset(emodif for bit, emodif in _MODIFIERS_SET_BITS if modif & bit)
@@ -4,7 +4,8 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Tuple, List, Sequence
+import array
 
 import jni
 from .lib import public
@@ -12,6 +13,7 @@ from .lib import memoryview as memview
 
 from .jconstants  import EJavaType
 from .jframe      import JFrame
+from .jarena      import JArena
 from .jobjectbase import JObjectBase
 from ._util       import str2jchars
 
@@ -32,61 +34,91 @@ class JObject(JObjectBase):
     def newBoolean(cls, val: bool) -> JObject | None:
 
         with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
+            key = ("Z", bool(val))
+            box = jvm.boxes.get(key)
+            if box is not None: return box
             jval = jni.new_array(jni.jvalue, 1)
             jval[0].z = val
             jobj = jenv.CallStaticObjectMethod(jvm.Boolean.Class,
                                                jvm.Boolean.valueOf, jval)
-            return cls.jvm.JObject(jenv, jobj) if jobj else None
+            if not jobj: return None
+            box = cls.jvm.JObject(jenv, jobj)
+            return jvm.boxes.setdefault(key, JArena.escape(box))
 
     @classmethod
     def newCharacter(cls, val: str) -> JObject | None:
 
         with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
+            key = ("C", val[0])
+            box = jvm.boxes.get(key)
+            if box is not None: return box
             jval = jni.new_array(jni.jvalue, 1)
             jval[0].c = val[0]
             jobj = jenv.CallStaticObjectMethod(jvm.Character.Class,
                                                jvm.Character.valueOf, jval)
-            return cls.jvm.JObject(jenv, jobj) if jobj else None
+            if not jobj: return None
+            box = cls.jvm.JObject(jenv, jobj)
+            return jvm.boxes.setdefault(key, JArena.escape(box)) if ord(val[0]) < 128 else box
 
     @classmethod
     def newByte(cls, val: int) -> JObject | None:
 
         with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
+            key = ("B", val)
+            box = jvm.boxes.get(key)
+            if box is not None: return box
             jval = jni.new_array(jni.jvalue, 1)
             jval[0].b = val
             jobj = jenv.CallStaticObjectMethod(jvm.Byte.Class,
                                                jvm.Byte.valueOf, jval)
-            return cls.jvm.JObject(jenv, jobj) if jobj else None
+            if not jobj: return None
+            box = cls.jvm.JObject(jenv, jobj)
+            return jvm.boxes.setdefault(key, JArena.escape(box))
 
     @classmethod
     def newShort(cls, val: int) -> JObject | None:
 
         with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
+            key = ("S", val)
+            box = jvm.boxes.get(key)
+            if box is not None: return box
             jval = jni.new_array(jni.jvalue, 1)
             jval[0].s = val
             jobj = jenv.CallStaticObjectMethod(jvm.Short.Class,
                                                jvm.Short.valueOf, jval)
-            return cls.jvm.JObject(jenv, jobj) if jobj else None
+            if not jobj: return None
+            box = cls.jvm.JObject(jenv, jobj)
+            return jvm.boxes.setdefault(key, JArena.escape(box)) if -128 <= val <= 127 else box
 
     @classmethod
     def newInteger(cls, val: int) -> JObject | None:
 
         with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
+            key = ("I", val)
+            box = jvm.boxes.get(key)
+            if box is not None: return box
             jval = jni.new_array(jni.jvalue, 1)
             jval[0].i = val
             jobj = jenv.CallStaticObjectMethod(jvm.Integer.Class,
                                                jvm.Integer.valueOf, jval)
-            return cls.jvm.JObject(jenv, jobj) if jobj else None
+            if not jobj: return None
+            box = cls.jvm.JObject(jenv, jobj)
+            return jvm.boxes.setdefault(key, JArena.escape(box)) if -128 <= val <= 127 else box
 
     @classmethod
     def newLong(cls, val: int) -> JObject | None:
 
         with cls.jvm as (jvm, jenv), JFrame(jenv, 1):
+            key = ("J", val)
+            box = jvm.boxes.get(key)
+            if box is not None: return box
             jval = jni.new_array(jni.jvalue, 1)
             jval[0].j = val
             jobj = jenv.CallStaticObjectMethod(jvm.Long.Class,
                                                jvm.Long.valueOf, jval)
-            return cls.jvm.JObject(jenv, jobj) if jobj else None
+            if not jobj: return None
+            box = cls.jvm.JObject(jenv, jobj)
+            return jvm.boxes.setdefault(key, JArena.escape(box)) if -128 <= val <= 127 else box
 
     @classmethod
     def newFloat(cls, val: float) -> JObject | None:
@@ -108,6 +140,79 @@ class JObject(JObjectBase):
                                                jvm.Double.valueOf, jval)
             return cls.jvm.JObject(jenv, jobj) if jobj else None
 
+    @classmethod
+    def boxBooleans(cls, vals: Sequence[bool], asList: bool = False) -> JArray | JObject:
+        """Boxes the values into a Boolean[] (or an ArrayList<Boolean> if asList) \
+        in one call."""
+        return cls._box("Z", vals, asList)
+
+    @classmethod
+    def boxCharacters(cls, vals: Sequence[str] | str, asList: bool = False) -> JArray | JObject:
+        """Boxes the values into a Character[] (or an ArrayList<Character> if asList) \
+        in one call (ValueError for the supplementary characters, which are not \
+        representable by one Character)."""
+        return cls._box("C", vals, asList)
+
+    @classmethod
+    def boxBytes(cls, vals: Sequence[int], asList: bool = False) -> JArray | JObject:
+        """Boxes the values into a Byte[] (or an ArrayList<Byte> if asList) \
+        in one call."""
+        return cls._box("B", vals, asList)
+
+    @classmethod
+    def boxShorts(cls, vals: Sequence[int], asList: bool = False) -> JArray | JObject:
+        """Boxes the values into a Short[] (or an ArrayList<Short> if asList) \
+        in one call."""
+        return cls._box("S", vals, asList)
+
+    @classmethod
+    def boxIntegers(cls, vals: Sequence[int], asList: bool = False) -> JArray | JObject:
+        """Boxes the values into an Integer[] (or an ArrayList<Integer> if asList) \
+        in one call."""
+        return cls._box("I", vals, asList)
+
+    @classmethod
+    def boxLongs(cls, vals: Sequence[int], asList: bool = False) -> JArray | JObject:
+        """Boxes the values into a Long[] (or an ArrayList<Long> if asList) \
+        in one call."""
+        return cls._box("J", vals, asList)
+
+    @classmethod
+    def boxFloats(cls, vals: Sequence[float], asList: bool = False) -> JArray | JObject:
+        """Boxes the values into a Float[] (or an ArrayList<Float> if asList) \
+        in one call."""
+        return cls._box("F", vals, asList)
+
+    @classmethod
+    def boxDoubles(cls, vals: Sequence[float], asList: bool = False) -> JArray | JObject:
+        """Boxes the values into a Double[] (or an ArrayList<Double> if asList) \
+        in one call."""
+        return cls._box("D", vals, asList)
+
+    @classmethod
+    def _box(cls, code: str, vals: Sequence, asList: bool) -> JArray | JObject:
+        # The values are copied into a primitive array by one Set<Type>ArrayRegion
+        # and boxed by org.jt.lang.Boxes.box() in one call.
+        with cls.jvm as (jvm, jenv), JFrame(jenv, 2):
+            if code == "C":
+                jbuf = "".join(vals).encode("utf-16-le", "surrogatepass")
+                size = len(jbuf) // 2
+                if size != len(vals):
+                    raise ValueError("Characters have to be single UTF-16 code units "
+                                     "(no supplementary characters)")
+            else:
+                jbuf = array.array(JArray._buffer_formats[code], vals)
+                size = len(jbuf)
+            name, _ = JArray._array_types[code]
+            jarr = getattr(jenv, f"New{name}Array")(size)
+            JArray._setRegion(jenv, jarr, code, 0, 1, size, jbuf)
+            jargs = jni.new_array(jni.jvalue, 2)
+            jargs[0].l = jarr  # noqa: E741
+            jargs[1].z = asList
+            jobj = jenv.CallStaticObjectMethod(jvm.jt_lang_Boxes.Class,
+                                               jvm.jt_lang_Boxes.box, jargs)
+            return cls.jvm.JObject(jenv, jobj) if asList else cls.jvm.JArray(jenv, jobj)
+
     @classmethod
     def newString(cls, val: str) -> JObject | None:
 
@@ -138,6 +243,53 @@ class JObject(JObjectBase):
         with self.jvm as (jvm, jenv):
             return self.jvm.JArray(jenv, self._jobj, own=own)
 
+    def unboxBooleans(self) -> List[bool]:
+        """Unboxes the elements of this Boolean[] (or Collection<Boolean>) in one call."""
+        return [bool(val) for val in self._unbox("Z")]
+
+    def unboxCharacters(self) -> List[str]:
+        """Unboxes the elements of this Character[] (or Collection<Character>) in one call."""
+        return self._unbox("C")
+
+    def unboxBytes(self) -> List[int]:
+        """Unboxes the elements of this Byte[] (or Collection of Numbers) in one call."""
+        return self._unbox("B")
+
+    def unboxShorts(self) -> List[int]:
+        """Unboxes the elements of this Short[] (or Collection of Numbers) in one call."""
+        return self._unbox("S")
+
+    def unboxIntegers(self) -> List[int]:
+        """Unboxes the elements of this Integer[] (or Collection of Numbers) in one call."""
+        return self._unbox("I")
+
+    def unboxLongs(self) -> List[int]:
+        """Unboxes the elements of this Long[] (or Collection of Numbers) in one call."""
+        return self._unbox("J")
+
+    def unboxFloats(self) -> List[float]:
+        """Unboxes the elements of this Float[] (or Collection of Numbers) in one call."""
+        return self._unbox("F")
+
+    def unboxDoubles(self) -> List[float]:
+        """Unboxes the elements of this Double[] (or Collection of Numbers) in one call."""
+        return self._unbox("D")
+
+    def _unbox(self, code: str) -> list:
+        # Unboxed by org.jt.lang.Boxes.unbox() into a primitive array in one call
+        # and copied from it by one Get<Type>ArrayRegion.
+        with self.jvm as (jvm, jenv), JFrame(jenv, 1):
+            jargs = jni.new_array(jni.jvalue, 2)
+            jargs[0].l = self._jobj  # noqa: E741
+            jargs[1].c = code
+            jarr = jenv.CallStaticObjectMethod(jvm.jt_lang_Boxes.Class,
+                                               jvm.jt_lang_Boxes.unbox, jargs)
+            size = int(jenv.GetArrayLength(jarr))
+            jbuf = JArray._getRegion(jenv, jarr, code, 0, 1, size)
+            if code == "C":
+                return list(jbuf.decode("utf-16-le", "surrogatepass"))
+            return memoryview(jbuf).cast(JArray._buffer_formats[code]).tolist()
+
     def booleanValue(self) -> bool:
 
         with self.jvm as (jvm, jenv):
@@ -10,43 +10,80 @@ from .lib import obj
 from .lib import cached
 
 from .jframe  import JFrame
+from .jarena  import _local
 from .jstring import JString
+from ._util   import address
 
 
 @public
 class JObjectBase(obj):
     """Object Base"""
 
-    __slots__ = ('_jobj', '_own')
+    __slots__ = ('_jobj', '_own', '_ihash', '__weakref__')
 
-    # self._jobj: jni.jobject
+    # self._jobj:  jni.jobject
+    # self._ihash: the identity hash code (fetched once)
+
+    # The key of the interned wrappers (see JInternTable): "identity"
+    # (JClass) or "value" (JField, JMethod, JConstructor), None if not interned.
+    _interning = None
+
+    def __new__(cls, jenv=None, jobj=None, own=True, *args, **kwargs):
+        """Constructor"""
+        if cls._interning is not None and own and jobj:
+            # The canonical wrapper of the Java object (if any) for an owning wrapper.
+            wrapper = cls.jvm._jvm.interned.get(cls, jenv, jobj)
+            if wrapper is not None: return wrapper
+        return super().__new__(cls)
 
     def __init__(self, jenv: jni.JNIEnv, jobj: jni.jobject, own: bool = True):
         """Initializer"""
-        self._jobj = jni.NULL
-        self._own  = own
+        if self._interning is not None and getattr(self, "_jobj", None):
+            return  # the canonical wrapper (see __new__)
+        self._jobj  = jni.NULL
+        self._own   = own
+        self._ihash = None
         if not jobj:
             from .jconstants import EStatusCode
             from .jvm        import JVMError
             raise JVMError(EStatusCode.UNKNOWN, "Allocating null Object")
+        # Inside an arena (see JArena) the wrapper is backed by a local reference
+        # (the interned ones are shared, so they are always global).
+        arena = _local.arena if own and self._interning is None else None
+        if arena is not None and arena._adopt(jenv, self, jobj): return
         self._jobj = jni.cast(jenv.NewGlobalRef(jobj) if own else jobj, jni.jobject)
+        if own: self._track(jenv)
+        if own and self._interning is not None:
+            self.jvm._jvm.interned.add(jenv, self)
+
+    def _track(self, jenv: jni.JNIEnv):
+        # Accounts the global reference of the wrapper (see JRefStats).
+        jvm = self.jvm._jvm
+        if jvm.refstats is not None:
+            jvm.refstats.track(jvm, jenv, self._jobj, type(self).__name__)
 
     def __del__(self):
         """Finalizer"""
         if not self._own or not self.jvm: return
-        try: jvm, jenv = self.jvm
-        except Exception: return  # pragma: no cover
-        if jvm.jnijvm:
-            jenv.DeleteGlobalRef(self._jobj)
+        self.jvm._release(self._jobj)
 
     handle = property(lambda self: self._jobj)
 
+    # The hash and equality of the wrappers follow the identity of their
+    # Java objects (the identity hash code is fetched once, IsSameObject
+    # is called on equal hashes only) or, in the value-equality mode
+    # (JVM.start(equality="value")), hashCode() and equals().
+
     def __hash__(self):
         """Returns a hash code value for the object."""
-        return int(self.hashCode())
+        if self.jvm._jvm.data.get("equality") == "value":
+            return self.hashCode()
+        ihash = self._ihash
+        return ihash if ihash is not None else self.identityHashCode()
 
     def __eq__(self, other):
-        """???"""
+        """Indicates whether the other object is the same Java object \
+        (or in the value-equality mode, whether it is "equal to" this one)."""
 
         if self is other:
             return True
@@ -54,17 +91,32 @@ class JObjectBase(obj):
         if not isinstance(other, JObjectBase):
             return NotImplemented
 
+        if self.jvm._jvm.data.get("equality") == "value":
+            return self.equals(other)
+
         self_handle  = self._jobj
         other_handle = other.handle
 
-        if self_handle == other_handle:
-            return True  # pragma: no cover
+        if address(self_handle) == address(other_handle):
+            return True
 
-        if self.hashCode() != other.hashCode():
+        if self.identityHashCode() != other.identityHashCode():
             return False
 
         with self.jvm as (jvm, jenv):
-            return jenv.IsSameObject(self_handle, other_handle)
+            return bool(jenv.IsSameObject(self_handle, other_handle))
+
+    def identityHashCode(self) -> int:
+        """Returns the identity hash code of the object \
+        (the one of java.lang.System, fetched once)."""
+        ihash = self._ihash
+        if ihash is None:
+            with self.jvm as (jvm, jenv):
+                jargs = jni.new_array(jni.jvalue, 1)
+                jargs[0].l = self._jobj  # noqa: E741
+                ihash = self._ihash = int(jenv.CallStaticIntMethod(
+                                          jvm.System.Class, jvm.System.identityHashCode, jargs))
+        return ihash
 
     def __str__(self):
         """Returns a string representation of the object."""
@@ -77,7 +129,6 @@ class JObjectBase(obj):
             jcls = jenv.GetObjectClass(self._jobj)
             return self.jvm.JClass(jenv, jcls)
 
-    @cached
     def hashCode(self) -> int:
         """Returns a hash code value for the object."""
         with self.jvm as (jvm, jenv):
@@ -14,7 +14,6 @@ from .jframe      import JFrame
 from .jstring     import JString
 from .jobjectbase import JObjectBase
 from .jannotated  import JAnnotatedElement
-from ._util       import str2jchars
 
 
 @public
@@ -27,8 +26,7 @@ class JPackage(JObjectBase, JAnnotatedElement):
     def getPackage(cls, name: str) -> JPackage | None:
         """Find a package by name in the callers ClassLoader instance."""
         with cls.jvm as (jvm, jenv), JFrame(jenv, 2):
-            jchars, size, jbuf = str2jchars(name)
-            jname = jenv.NewString(jchars, size)
+            jname = jvm.strings.get(jenv, name)
             jargs = jni.new_array(jni.jvalue, 1)
             jargs[0].l = jname  # noqa: E741
             jpkg = jenv.CallStaticObjectMethod(jvm.Package.Class,
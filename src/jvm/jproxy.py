@@ -27,13 +27,13 @@ class JProxy(obj):
             for i, jitf in enumerate(self.__interfaces):
                 jenv.SetObjectArrayElement(itf_arr, i, jitf.handle)
             self._jitf_array = jni.cast(jenv.NewGlobalRef(itf_arr), jni.jobjectArray)
+            if jvm.refstats is not None:  # see JRefStats
+                jvm.refstats.track(jvm, jenv, self._jitf_array, type(self).__name__)
 
     def __del__(self):
         """Finalizer"""
-        try: jvm, jenv = self.jvm
-        except Exception: return  # pragma: no cover
-        if jvm.jnijvm:
-            jenv.DeleteGlobalRef(self._jitf_array)
+        if not self.jvm: return
+        self.jvm._release(self._jitf_array)
 
     interfaces = property(lambda self: self.__interfaces)
 
@@ -0,0 +1,135 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+from __future__ import annotations
+
+from typing import Iterable
+import sys
+import os
+import threading
+import traceback
+from collections import Counter
+
+import jni
+from .lib import public
+from .lib import obj
+from .lib import adict
+
+from .jframe  import JFrame
+from .jstring import JString
+from ._util   import address
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+
+@public
+class JRefStats(obj):
+    """Accounting of the global references held by the wrappers
+
+    (JObject, JClass, JArray, JArguments, JProxy, ...): the numbers of the live
+    references per wrapper type and per Java class name, with their high-water
+    marks and, for every stack_sample-th reference (none if 0), the Python
+    stack of its creation. Opt-in (see JVM.enableRefStats()), as it costs
+    a few JNI calls per reference.
+    """
+
+    __slots__ = ('stack_sample', '__lock', '__refs', '__serial',
+                 '__by_type', '__by_class', '__high_by_type', '__high_by_class', '__high')
+
+    def __init__(self, stack_sample: int = 0):
+        """Initializer"""
+        self.stack_sample = stack_sample
+        self.__lock   = threading.Lock()
+        self.__refs   = {}  # address -> (serial, wrapper type, class name, stack)
+        self.__serial = 0
+        self.__by_type  = Counter()
+        self.__by_class = Counter()
+        self.__high_by_type  = Counter()
+        self.__high_by_class = Counter()
+        self.__high = 0
+
+    def track(self, jvm, jenv: jni.JNIEnv, jref: jni.jobject, wrapper_type: str):
+        """Accounts the new global reference held by a wrapper of the type."""
+        addr = address(jref)
+        if not addr: return
+        class_name = _className(jvm, jenv, jref)
+        with self.__lock:
+            self.__serial += 1
+            serial = self.__serial
+            stack = (_creationStack()
+                     if self.stack_sample and not serial % self.stack_sample else None)
+            self.__refs[addr] = (serial, wrapper_type, class_name, stack)
+            by_type, by_class = self.__by_type, self.__by_class
+            by_type[wrapper_type] += 1
+            by_class[class_name]  += 1
+            if by_type[wrapper_type] > self.__high_by_type[wrapper_type]:
+                self.__high_by_type[wrapper_type] = by_type[wrapper_type]
+            if by_class[class_name] > self.__high_by_class[class_name]:
+                self.__high_by_class[class_name] = by_class[class_name]
+            self.__high = max(self.__high, len(self.__refs))
+
+    def untrack(self, jrefs: Iterable[jni.jobject]):
+        """Accounts the release of the global references."""
+        with self.__lock:
+            for jref in jrefs:
+                addr = address(jref)
+                record = self.__refs.pop(addr, None) if addr else None
+                if record is None: continue  # created before the accounting
+                _, wrapper_type, class_name, _ = record
+                self.__by_type[wrapper_type] -= 1
+                self.__by_class[class_name]  -= 1
+
+    def checkpoint(self) -> int:
+        """Returns the checkpoint of the currently live references \
+        (see snapshot())."""
+        with self.__lock:
+            return self.__serial
+
+    def snapshot(self, since: int | None = None) -> adict:
+        """Returns the accounting of the live references:
+
+        total, by_type, by_class: numbers of the live references (all of them,
+        or the ones created since the checkpoint),
+        high_water, high_water_by_type, high_water_by_class: their high-water
+        marks (of all the references),
+        stacks: (wrapper type, class name, creation stack) of the sampled
+        live references (created since the checkpoint),
+        checkpoint: the current checkpoint.
+        """
+        with self.__lock:
+            if since is None:
+                total    = len(self.__refs)
+                by_type  = +self.__by_type
+                by_class = +self.__by_class
+                records  = self.__refs.values()
+            else:
+                records  = [record for record in self.__refs.values() if record[0] > since]
+                total    = len(records)
+                by_type  = Counter(record[1] for record in records)
+                by_class = Counter(record[2] for record in records)
+            stacks = [(wrapper_type, class_name, stack)
+                      for _, wrapper_type, class_name, stack in records if stack is not None]
+            return adict(total=total,
+                         by_type=dict(by_type),
+                         by_class=dict(by_class),
+                         high_water=self.__high,
+                         high_water_by_type=dict(self.__high_by_type),
+                         high_water_by_class=dict(self.__high_by_class),
+                         stacks=stacks,
+                         checkpoint=self.__serial)
+
+
+def _creationStack() -> traceback.StackSummary:
+    # The stack of the calling code (without the frames of this package).
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+        frame = frame.f_back
+    return traceback.extract_stack(frame, limit=16)
+
+
+def _className(jvm, jenv: jni.JNIEnv, jref: jni.jobject) -> str:
+    with JFrame(jenv, 2):
+        jcls  = jenv.GetObjectClass(jref)
+        jname = jenv.CallObjectMethod(jcls, jvm.Class.getName)
+        return sys.intern(JString(jenv, jname, own=False).str)
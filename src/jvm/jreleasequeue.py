@@ -0,0 +1,114 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+
+import jni
+from .lib import public
+from .lib import obj
+from .lib import adict
+
+
+@public
+class JReleaseQueue(obj):
+    """Queue of the global references to be released
+
+    The finalizers of the wrappers only append their global references to
+    the queue (no thread attach and no JNI call during the garbage collection)
+    and the queue is drained in bulk on the next call into the JVM from an
+    attached thread (see JVM.__enter__()) or by the releaser thread
+    (see JVM.start(release_interval=...)).
+    """
+
+    __slots__ = ('pending', '__lock', '__max_depth', '__released', '__drains',
+                 '__last_latency', '__max_latency', '__last_duration',
+                 '__failures', '__last_failure')
+
+    def __init__(self):
+        """Initializer"""
+        # deque.append() and deque.popleft() are atomic, so the finalizers
+        # append without any lock.
+        self.pending = deque()  # (global reference, enqueue time)
+        self.__lock  = threading.Lock()
+        self.__max_depth = 0
+        self.__released  = 0
+        self.__drains    = 0
+        self.__last_latency  = 0.0
+        self.__max_latency   = 0.0
+        self.__last_duration = 0.0
+        self.__failures     = 0
+        self.__last_failure = None
+
+    def __len__(self):
+        """Length of"""
+        return len(self.pending)
+
+    def release(self, *jrefs: jni.jobject):
+        """Enqueues the global references to be released."""
+        now = time.perf_counter()
+        for jref in jrefs:
+            self.pending.append((jref, now))
+
+    def drain(self, jenv: jni.JNIEnv) -> int:
+        """Releases all the enqueued global references and returns their number."""
+        pending = self.pending
+        if not pending: return 0
+        # Only one thread drains at a time, the others just go on.
+        if not self.__lock.acquire(blocking=False): return 0
+        try:
+            depth = len(pending)
+            start = time.perf_counter()
+            oldest = None
+            count = 0
+            try:
+                while True:
+                    jref, enqueued = pending.popleft()
+                    if oldest is None: oldest = enqueued
+                    jenv.DeleteGlobalRef(jref)
+                    count += 1
+            except IndexError:
+                pass
+            stop = time.perf_counter()
+            latency = stop - oldest
+            self.__max_depth = max(self.__max_depth, depth)
+            self.__released += count
+            self.__drains   += 1
+            self.__last_latency  = latency
+            self.__max_latency   = max(self.__max_latency, latency)
+            self.__last_duration = stop - start
+            return count
+        finally:
+            self.__lock.release()
+
+    def failed(self, exc: BaseException):
+        """Records a failure of the releaser thread (see stats())."""
+        self.__failures += 1
+        self.__last_failure = exc
+
+    def stats(self) -> adict:
+        """Returns the metrics of the queue:
+
+        depth: number of the currently enqueued references,
+        max_depth: greatest number of the references released by one drain,
+        released: total number of the released references,
+        drains: number of the (non-empty) drains,
+        last_latency, max_latency: time (in seconds) the oldest reference of
+        the last (of any) drain waited in the queue,
+        last_duration: time (in seconds) of the last drain,
+        failures: number of the failures of the releaser thread,
+        last_failure: the exception of its last failure (or None).
+        """
+        return adict(depth=len(self.pending),
+                     max_depth=self.__max_depth,
+                     released=self.__released,
+                     drains=self.__drains,
+                     last_latency=self.__last_latency,
+                     max_latency=self.__max_latency,
+                     last_duration=self.__last_duration,
+                     failures=self.__failures,
+                     last_failure=self.__last_failure)
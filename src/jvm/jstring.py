@@ -4,38 +4,148 @@
 
 from __future__ import annotations
 
+import threading
+import codecs
+from collections import OrderedDict
+
 import jni
 from .lib import public
 from .lib import obj
 
+from ._util import str2jchars
+
+# Per-thread scratch buffer for the decoding of Java strings.
+_scratch = threading.local()
+# Scratch buffers above this size (in bytes) are not kept between calls.
+_SCRATCH_MAX_SIZE = 1 << 20
+
+
+def _scratch_buffer(size: int) -> bytearray:
+    buf = getattr(_scratch, "buf", None)
+    if buf is None or len(buf) < size:
+        buf = bytearray(max(size, 256, 2 * len(buf) if buf is not None else 0))
+        if len(buf) <= _SCRATCH_MAX_SIZE: _scratch.buf = buf
+    return buf
+
 
 @public
 class JString(obj):
 
-    __slots__ = ('__jstr', '__size', '__jchars')
+    __slots__ = ('__jstr', '__size', '__str', '__jchars')
+
+    # Strings of at least this length are transferred as (modified) UTF-8
+    # by GetStringUTFRegion instead of as UTF-16 (None: never). On HotSpot
+    # the UTF-16 transfer is faster, so this is an opt-in.
+    utf8_min_length: int | None = None
 
     def __init__(self, jenv: jni.JNIEnv | None = None,
                  jstr: jni.jobject = jni.obj(jni.POINTER(jni.jchar)), own: bool = True):
         """Initializer"""
         self.__jstr = jni.cast(jstr, jni.jstring)
         self.__size = 0
-        self.__jchars = jni.obj(jni.POINTER(jni.jchar))
+        self.__str  = ""
+        self.__jchars = None
         if jenv is None or not jstr: return
         length = jenv.GetStringLength(self.__jstr)
-        jchars = jenv.GetStringChars(self.__jstr)
-        try:
-            self.__jchars = jni.new_array(jni.jchar, length + 1)
-            jni.memmove(self.__jchars, jchars, length * jni.sizeof(jni.jchar))
-            self.__jchars[length] = "\0"
-        finally:
-            jenv.ReleaseStringChars(self.__jstr, jchars)
+        if length:
+            # Decoded straight from the chars copied into a scratch buffer.
+            utf8_min_length = JString.utf8_min_length
+            if utf8_min_length is not None and length >= utf8_min_length:
+                self.__str = JString.__decodeUTF(jenv, self.__jstr, length)
+            else:
+                nbytes = 2 * length
+                buf = _scratch_buffer(nbytes)
+                jenv.GetStringRegion(self.__jstr, 0, length,
+                                     jni.cast(jni.from_buffer(buf), jni.POINTER(jni.jchar)))
+                with memoryview(buf) as mbuf:
+                    self.__str = codecs.utf_16_le_decode(mbuf[:nbytes], "surrogatepass")[0]
         self.__size = length
 
+    @staticmethod
+    def __decodeUTF(jenv: jni.JNIEnv, jstr: jni.jstring, length: int) -> str:
+        nbytes = jenv.GetStringUTFLength(jstr)
+        buf = _scratch_buffer(nbytes + 1)  # HotSpot appends a terminating NUL
+        jenv.GetStringUTFRegion(jstr, 0, length, jni.from_buffer(buf))
+        with memoryview(buf) as mbuf:
+            try:
+                return codecs.utf_8_decode(mbuf[:nbytes], "strict", True)[0]
+            except UnicodeDecodeError:
+                # Modified UTF-8 (encoded NUL or surrogate pairs), so as UTF-16.
+                pass
+        nbytes = 2 * length
+        buf = _scratch_buffer(nbytes)
+        jenv.GetStringRegion(jstr, 0, length,
+                             jni.cast(jni.from_buffer(buf), jni.POINTER(jni.jchar)))
+        with memoryview(buf) as mbuf:
+            return codecs.utf_16_le_decode(mbuf[:nbytes], "surrogatepass")[0]
+
     length = property(lambda self: self.__size)
-    value  = property(lambda self: self.__jchars)
+    str    = property(lambda self: self.__str)  # noqa: A003
 
-    str = property(lambda self: jni.to_unicode(self.__jchars, size=self.__size))  # noqa: A003
+    @property
+    def value(self):
+        # The UTF-16 chars of the string (built on demand).
+        if self.__jchars is None:
+            self.__jchars = str2jchars(self.__str)
+        return self.__jchars[0]
 
     def __len__(self):
         """Length of"""
         return len(self.str)
+
+
+@public
+class JStringCache(obj):
+    """Bounded LRU cache of Java Strings of frequently used identifiers
+
+    (names of classes, fields, methods, packages), held as global references.
+    """
+
+    __slots__ = ('maxsize', '__jstrs', '__lock')
+
+    def __init__(self, maxsize: int = 512):
+        """Initializer"""
+        self.maxsize = maxsize
+        self.__jstrs = OrderedDict()
+        self.__lock  = threading.Lock()
+
+    def __len__(self):
+        """Length of"""
+        return len(self.__jstrs)
+
+    def __contains__(self, name: str):
+        """Membership test"""
+        return name in self.__jstrs
+
+    def get(self, jenv: jni.JNIEnv, name: str) -> jni.jstring:
+        """Returns a new local reference to the Java String of name."""
+        jstrs = self.__jstrs
+        with self.__lock:
+            jstr = jstrs.get(name)
+            if jstr is not None:
+                jstrs.move_to_end(name)
+                # Taken under the lock, so an eviction cannot delete it under us.
+                return jenv.NewLocalRef(jstr)
+        jchars, size, jbuf = str2jchars(name)
+        jstr = jenv.NewString(jchars, size)
+        if self.maxsize <= 0: return jstr
+        gstr = jenv.NewGlobalRef(jstr)
+        evicted = []
+        with self.__lock:
+            if name in jstrs:
+                evicted.append(gstr)
+            else:
+                jstrs[name] = gstr
+                while len(jstrs) > self.maxsize:
+                    evicted.append(jstrs.popitem(last=False)[1])
+        for gstr in evicted:
+            jenv.DeleteGlobalRef(gstr)
+        return jstr
+
+    def clear(self, jenv: jni.JNIEnv):
+        """Removes all the Strings from the cache."""
+        with self.__lock:
+            jstrs = list(self.__jstrs.values())
+            self.__jstrs.clear()
+        for jstr in jstrs:
+            jenv.DeleteGlobalRef(jstr)
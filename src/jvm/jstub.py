@@ -0,0 +1,221 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+from __future__ import annotations
+
+from typing import Callable, Tuple
+import threading
+
+import jni
+from .lib import public
+from .lib import obj
+
+from .jstring import JString
+from ._util   import str2jchars
+
+# Primitive type descriptor -> jvalue field.
+_FIELDS = {
+    "Z": "z", "C": "c", "B": "b", "S": "s",
+    "I": "i", "J": "j", "F": "f", "D": "d",
+}
+
+# Type descriptor -> <Type> of JNIEnv.Call[Static]<Type>Method/[Get|Set][Static]<Type>Field.
+_TYPES = {
+    "V": "Void", "Z": "Boolean", "C": "Char", "B": "Byte", "S": "Short",
+    "I": "Int", "J": "Long", "F": "Float", "D": "Double",
+}
+
+
+def parse_signature(signature: str) -> Tuple[Tuple[str, ...], str]:
+    """Splits a method descriptor into the parameter descriptors \
+    and the return descriptor."""
+    params = []
+    end = signature.index(")")
+    pos = 1
+    while pos < end:
+        start = pos
+        while signature[pos] == "[": pos += 1
+        if signature[pos] == "L": pos = signature.index(";", pos)
+        pos += 1
+        params.append(signature[start:pos])
+    return tuple(params), signature[end + 1:]
+
+
+def make_stub(jvm, name: str, jmid: jni.jmethodID, signature: str, static: bool,
+              target: JObjectBase | None, constructor: bool = False) -> Callable:  # noqa: F821
+    """Creates the pre-bound call stub of a method (or constructor).
+
+    The stub is bound to the current thread: it holds its JNIEnv, the jmethodID
+    and one reusable jvalue array for the arguments, which are written into it
+    straight from the Python values (primitives, str, None and Java objects).
+    """
+    with jvm as (_, jenv):
+        pass
+    thread_id = threading.get_ident()
+
+    ptypes, rtype = parse_signature(signature)
+    nargs  = len(ptypes)
+    jvals  = jni.new_array(jni.jvalue, nargs) if nargs else jni.obj(jni.POINTER(jni.jvalue))
+    jitems = tuple(jvals[pos] for pos in range(nargs))  # views of the jvalues
+    fields = tuple(_FIELDS.get(ptype) for ptype in ptypes)
+    prims  = all(fields)
+
+    if constructor:
+        call = jenv.NewObject
+        convert = _objectConverter(jvm, jenv)
+    else:
+        call = getattr(jenv, "Call" + ("Static" if static else "")
+                       + _TYPES.get(rtype, "Object") + "Method")
+        convert = _converter(jvm, jenv, rtype)
+    jtarget = target  # holds the target (and its reference) as long as the stub
+
+    get_ident = threading.get_ident
+
+    def setReferences(args):
+        # Returns the local references created for the arguments.
+        jrefs = []
+        for jval, field, val in zip(jitems, fields, args):
+            if field is not None:
+                setattr(jval, field, val)
+            else:
+                jval.l = _reference(jenv, val, jrefs)  # noqa: E741
+        return jrefs
+
+    def stub(*args):
+        if get_ident() != thread_id:
+            raise RuntimeError(f"Stub of {name}() called from another thread")
+        if jtarget is None:
+            this  = args[0]  # holds the object (and its reference) during the call
+            jthis = this.handle
+            args  = args[1:]
+        else:
+            jthis = jtarget.handle
+        if len(args) != nargs:
+            raise TypeError(f"{name}() takes {nargs} arguments ({len(args)} given)")
+        if prims:
+            for jval, field, val in zip(jitems, fields, args):
+                setattr(jval, field, val)
+            try:
+                result = call(jthis, jmid, jvals)
+            except Exception as exc:
+                jvm.handleException(exc)
+        else:
+            jrefs = setReferences(args)
+            try:
+                result = call(jthis, jmid, jvals)
+            except Exception as exc:
+                jvm.handleException(exc)
+            finally:
+                for jref in jrefs: jenv.DeleteLocalRef(jref)
+        return result if convert is None else convert(result)
+
+    stub.__name__ = stub.__qualname__ = name
+    return stub
+
+
+@public
+class JBoundField(obj):
+    """Pre-bound accessor of a field
+
+    Holds the jfieldID and the JNIEnv of the current thread (so it is bound
+    to the current thread). For an instance field get()/set() take the object
+    as the first argument.
+    """
+
+    __slots__ = ('name', 'signature', 'static',
+                 '__jvm', '__jenv', '__jfid', '__jcls', '__get', '__set', '__convert',
+                 '__thread_id')
+
+    def __init__(self, jvm, jcls: JClass, name: str, signature: str,  # noqa: F821
+                 jfid: jni.jfieldID, static: bool = False):
+        """Initializer"""
+        with jvm as (_, jenv):
+            pass
+        self.name      = name
+        self.signature = signature
+        self.static    = static
+        self.__jvm  = jvm
+        self.__jenv = jenv
+        self.__jfid = jfid
+        self.__jcls = jcls
+        kind = _TYPES.get(signature, "Object")
+        prefix = "Static" if static else ""
+        self.__get = getattr(jenv, f"Get{prefix}{kind}Field")
+        self.__set = getattr(jenv, f"Set{prefix}{kind}Field")
+        self.__convert = _converter(jvm, jenv, signature)
+        self.__thread_id = threading.get_ident()
+
+    def get(self, this: JObjectBase | None = None) -> object:  # noqa: F821
+        """Returns the value of the field (of this if an instance field)."""
+        self.__check()
+        try:
+            jthis = self.__jcls.handle if self.static else this.handle
+            result = self.__get(jthis, self.__jfid)
+        except Exception as exc:
+            self.__jvm.handleException(exc)
+        convert = self.__convert
+        return result if convert is None else convert(result)
+
+    def set(self, *args):  # noqa: A003
+        """Sets the value of the field (the object first for an instance field)."""
+        self.__check()
+        if self.static:
+            jthis = self.__jcls.handle
+            val, = args
+        else:
+            this, val = args
+            jthis = this.handle
+        jenv = self.__jenv
+        jrefs = []
+        try:
+            if self.signature not in _FIELDS:
+                val = _reference(jenv, val, jrefs)
+            self.__set(jthis, self.__jfid, val)
+        except Exception as exc:
+            self.__jvm.handleException(exc)
+        finally:
+            for jref in jrefs: jenv.DeleteLocalRef(jref)
+
+    def __check(self):
+        if threading.get_ident() != self.__thread_id:
+            raise RuntimeError(f"Bound field {self.name} used from another thread")
+
+
+def _reference(jenv: jni.JNIEnv, val: object, jrefs: list) -> jni.jobject:
+    # The Java reference of val (a new local reference is appended to jrefs).
+    if val is None:
+        return jni.NULL
+    if isinstance(val, str):
+        jchars, size, jbuf = str2jchars(val)
+        jstr = jenv.NewString(jchars, size)
+        jrefs.append(jstr)
+        return jstr
+    return val.handle
+
+
+def _converter(jvm, jenv: jni.JNIEnv, rtype: str) -> Callable | None:
+    # Converter of a value of the type descriptor rtype (None if not needed).
+    if rtype in _TYPES: return None
+    if rtype == "Ljava/lang/String;": return _stringConverter(jenv)
+    return _objectConverter(jvm, jenv)
+
+
+def _stringConverter(jenv: jni.JNIEnv) -> Callable:
+    def convert(jstr):
+        if not jstr: return None
+        try:
+            return JString(jenv, jstr, own=False).str
+        finally:
+            jenv.DeleteLocalRef(jstr)
+    return convert
+
+
+def _objectConverter(jvm, jenv: jni.JNIEnv) -> Callable:
+    def convert(jobj):
+        if not jobj: return None
+        try:
+            return jvm.JObject(jenv, jobj)
+        finally:
+            jenv.DeleteLocalRef(jobj)
+    return convert
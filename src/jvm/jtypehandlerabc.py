@@ -9,12 +9,12 @@ import abc
 from .lib import public
 from .lib import obj
 
-# F821 undefined name 'EMatch'
-from .jclass  import JClass
-from .jfield  import JField
-from .jmethod import JMethod
-from .jobject import JObject
-from .jarray  import JArray
+from .jconstants import EMatch
+from .jclass     import JClass
+from .jfield     import JField
+from .jmethod    import JMethod
+from .jobject    import JObject
+from .jarray     import JArray
 
 
 @public
@@ -39,11 +39,11 @@ class TypeHandlerABC(obj, abc.ABC):
         raise NotImplementedError()
 
     @abc.abstractmethod
-    def match(self, val: object) -> EMatch:  # noqa: F821 # !!!
+    def match(self, val: object) -> EMatch:
         raise NotImplementedError()
 
     @abc.abstractmethod
-    def valid(self, val: object) -> EMatch:  # noqa: F821 # !!!
+    def valid(self, val: object) -> EMatch:
         raise NotImplementedError()
 
     @abc.abstractmethod
@@ -7,6 +7,8 @@ from __future__ import annotations
 from typing import Tuple
 from pathlib import Path
 import os
+import threading
+import logging
 
 import jni
 from .lib import public
@@ -14,10 +16,19 @@ from .lib import obj
 from .lib import weakconst
 from .lib import adict
 
-from .jconstants import EStatusCode
+from .jconstants    import EStatusCode
+from .jstring       import JStringCache
+from .jclasscache   import JClassCache
+from .jmetacache    import JMetadataCache
+from .jreleasequeue import JReleaseQueue
+from .jarena        import JArena
+from .jrefstats     import JRefStats
+from .jintern       import JInternTable
 
 INTERNAL_CLASSPATHS = [Path(__file__).resolve().parent/"java"]
 
+log = logging.getLogger(__name__)
+
 
 @public
 class JVM(obj):
@@ -65,6 +76,7 @@ class JVM(obj):
         from .jproxy          import JProxy
         from .jrefqueue       import JReferenceQueue
         from .jexception      import JException
+        from .jdispatch       import JDispatcher
 
         self.JThread             = class_copy(JThread,             jvm=weakconst(self))
         self.JPackage            = class_copy(JPackage,            jvm=weakconst(self))
@@ -82,10 +94,13 @@ class JVM(obj):
         self.JProxy              = class_copy(JProxy,              jvm=weakconst(self))
         self.JReferenceQueue     = class_copy(JReferenceQueue,     jvm=weakconst(self))
         self.JException          = class_copy(JException,          jvm=weakconst(self))
+        self.JDispatcher         = class_copy(JDispatcher,         jvm=weakconst(self))
 
         if_load = dll_path is not None
 
         self._jvm = None  # _JVM
+        self._tenv = threading.local()  # per-thread cached JNIEnv
+        self._tenv_generation = 0
         self.JavaException = None
         self.ExceptionsMap = {}
         try:
@@ -120,12 +135,20 @@ class JVM(obj):
         if self._jvm is None:
             raise JVMError(EStatusCode.EDETACHED,
                            "Unable to use JVM: thread detached from the VM")
-        if self._jvm.jnijvm:
-            penv = jni.obj(jni.POINTER(jni.JNIEnv))
-            self._jvm.jnijvm.AttachCurrentThread(penv)
-            return self._jvm, jni.JEnv(penv)
+        jvm = self._jvm
+        if jvm.jnijvm:
+            tenv = self._tenv
+            if getattr(tenv, "generation", None) == self._tenv_generation:
+                jenv = tenv.jenv
+            else:
+                penv = jni.obj(jni.POINTER(jni.JNIEnv))
+                jvm.jnijvm.AttachCurrentThread(penv)
+                jenv = self._cacheThreadEnv(penv)
+            # The global references queued by the finalizers are released here.
+            if jvm.releases.pending: jvm.releases.drain(jenv)
+            return jvm, jenv
         else:
-            return self._jvm, None
+            return jvm, None
 
     def __exit__(self, exc_type, exc, exc_tb):
         """Exit context"""
@@ -137,6 +160,21 @@ class JVM(obj):
         """Iterator"""
         return iter(self.__enter__())
 
+    def _cacheThreadEnv(self, penv) -> jni.JNIEnv:
+        # The JNIEnv of an attached thread stays valid until the thread
+        # is detached, so it is attached once and reused by the thread.
+        jenv = jni.JEnv(penv)
+        tenv = self._tenv
+        tenv.penv = penv
+        tenv.jenv = jenv
+        tenv.generation = self._tenv_generation
+        return jenv
+
+    def _clearThreadEnv(self, all_threads: bool = False):
+        self._tenv.__dict__.clear()
+        if all_threads:
+            self._tenv_generation += 1
+
     def start(self, *jvmoptions, **jvmargs) -> Tuple[_JVM, jni.JNIEnv]:
         jvmoptions = tuple(["-Djava.class.path=" + os.pathsep.join(
                                [item.partition("=")[2] for item in jvmoptions
@@ -145,6 +183,9 @@ class JVM(obj):
                            + [item for item in jvmoptions
                               if not item.lstrip().startswith("-Djava.class.path=")])
         ignoreUnrecognized = jvmargs.get("ignoreUnrecognized", True)
+        self._jvm.data.lazy = bool(jvmargs.get("lazy", False))
+        self._setMetadataCache(jvmargs.get("metadata_cache"))
+        self._setEquality(jvmargs.get("equality", "identity"))
         try:
             pjvm = jni.obj(jni.POINTER(jni.JavaVM))
             penv = jni.obj(jni.POINTER(jni.JNIEnv))
@@ -166,13 +207,15 @@ class JVM(obj):
                 raise jni.JNIException(err if err != jni.JNI_OK else jni.JNI_ERR,
                                        info="JNI_CreateJavaVM")
             self._jvm.jnijvm = jni.JVM(pjvm)
-            jenv = jni.JEnv(penv)
+            self._clearThreadEnv(all_threads=True)
+            jenv = self._cacheThreadEnv(penv)
             try:
                 self._jvm._initialize(jenv)
             except Exception as exc:
                 try: self._jvm.jnijvm.DestroyJavaVM()
                 except Exception: pass
                 raise exc
+            self._jvm._startReleaser(jvmargs.get("release_interval"))
             return self._jvm, jenv
         except Exception as exc:
             try:
@@ -180,8 +223,15 @@ class JVM(obj):
             finally:
                 self._jvm.jnijvm = None
 
-    def attach(self, pjvm: object | None = None) -> Tuple[_JVM, jni.JNIEnv]:
+    def attach(self, pjvm: object | None = None,
+               lazy: bool = False,
+               metadata_cache: str | os.PathLike | None = None,
+               release_interval: float | None = None,
+               equality: str = "identity") -> Tuple[_JVM, jni.JNIEnv]:
         if_bind = pjvm is not None
+        self._jvm.data.lazy = bool(lazy)
+        self._setMetadataCache(metadata_cache)
+        self._setEquality(equality)
         try:
             if if_bind and not pjvm:
                 raise JVMError(EStatusCode.EINVAL,
@@ -192,8 +242,10 @@ class JVM(obj):
                 self._jvm.jnijvm.AttachCurrentThread(penv)
             else:
                 self._jvm.jnijvm.GetEnv(penv, JVM.JNI_VERSION)
-            jenv = jni.JEnv(penv)
+            self._clearThreadEnv(all_threads=True)
+            jenv = self._cacheThreadEnv(penv)
             self._jvm._initialize(jenv)
+            self._jvm._startReleaser(release_interval)
             return self._jvm, jenv
         except Exception as exc:
             try:
@@ -202,6 +254,68 @@ class JVM(obj):
                 if if_bind:
                     self._jvm.jnijvm = None
 
+    def _setMetadataCache(self, directory: str | os.PathLike | None):
+        # The persistent class metadata cache is opt-in (see JMetadataCache).
+        self._jvm.data.metadata_cache = (JMetadataCache(directory)
+                                         if directory is not None else None)
+
+    def _setEquality(self, equality: str):
+        # The hash and equality of the wrappers follow the identity of their
+        # Java objects or their hashCode()/equals() (see JObjectBase).
+        if equality not in ("identity", "value"):
+            raise ValueError(f"Invalid equality mode: {equality!r} "
+                             "(expected 'identity' or 'value')")
+        self._jvm.data.equality = equality
+
+    def _release(self, *jrefs: jni.jobject):
+        # Used by the finalizers instead of DeleteGlobalRef: the global
+        # references are only queued (see JReleaseQueue).
+        jvm = self._jvm
+        if jvm is not None and jvm.jnijvm:
+            if jvm.refstats is not None: jvm.refstats.untrack(jrefs)
+            jvm.releases.release(*jrefs)
+
+    def arena(self, capacity: int = 256, limit: int = 65536) -> JArena:
+        """Returns a new scope of local references of the wrappers \
+        of the current thread (see JArena), to be used as:
+
+        with jvm.arena() as arena:
+            ...
+        """
+        _, jenv = self
+        return JArena(jenv, capacity, limit)
+
+    def releaseStats(self) -> adict:
+        """Returns the metrics of the queue of the global references \
+        to be released (see JReleaseQueue.stats()) and whether the releaser \
+        thread is running (releaser)."""
+        jvm = self._jvm
+        stats = jvm.releases.stats()
+        stats.releaser = jvm._releaser is not None and jvm._releaser[0].is_alive()
+        return stats
+
+    def internStats(self) -> adict:
+        """Returns the metrics of the table of the canonical wrappers \
+        of the reflection objects (see JInternTable.stats())."""
+        return self._jvm.interned.stats()
+
+    def enableRefStats(self, stack_sample: int = 0):
+        """Enables the accounting of the global references held by the wrappers \
+        (see JRefStats), recording the creation stack of every stack_sample-th \
+        reference (none if 0)."""
+        self._jvm.refstats = JRefStats(stack_sample)
+
+    def disableRefStats(self):
+        """Disables the accounting of the global references."""
+        self._jvm.refstats = None
+
+    def refstats(self, since: int | None = None) -> adict | None:
+        """Returns the snapshot of the accounting of the global references \
+        (all of them or the ones alive since the checkpoint of a previous \
+        snapshot, see JRefStats.snapshot()), None if it is not enabled."""
+        refstats = self._jvm.refstats
+        return refstats.snapshot(since) if refstats is not None else None
+
     def shutdown(self):
         if self._jvm.jnijvm is None: return
         try:
@@ -209,6 +323,7 @@ class JVM(obj):
             self._jvm.jnijvm.AttachCurrentThread(penv)
             jenv = jni.JEnv(penv)
             self._jvm._dispose(jenv)
+            self._clearThreadEnv(all_threads=True)
             self._jvm.jnijvm.DestroyJavaVM()
         except Exception as exc:
             try:
@@ -227,12 +342,13 @@ class JVM(obj):
                 self._jvm.jnijvm.AttachCurrentThread(penv)
             else:
                 self._jvm.jnijvm.AttachCurrentThreadAsDaemon(penv)
-            return self._jvm, jni.JEnv(penv)
+            return self._jvm, self._cacheThreadEnv(penv)
         except Exception as exc:
             self.handleException(exc)
 
     def detachThread(self):
         try:
+            self._clearThreadEnv()
             self._jvm.jnijvm.DetachCurrentThread()
         except Exception as exc:
             self.handleException(exc)
@@ -288,197 +404,194 @@ class JVMError(Exception):
 @public
 class _JVM(obj):
 
-    __slots__ = ('JNI', 'jnijvm', 'data') + \
-                ('java_array', 'java_lang', 'java_io', 'java_nio', 'java_util',
-                 'System', 'Thread', 'Package', 'ClassLoader', 'Class', 'Throwable',
-                 'StackTraceElement', 'AutoCloseable', 'Comparable', 'Iterable', 'Introspector',
-                 'BeanInfo', 'PropertyDescriptor', 'Annotation', 'AnnotatedElement', 'Modifier',
-                 'Member', 'Field', 'Constructor', 'Method', 'Proxy', 'Void', 'Boolean',
-                 'Character', 'Byte', 'Short', 'Integer', 'Long', 'Float', 'Double', 'Number',
-                 'String', 'Object', 'StringWriter', 'PrintWriter') + \
-                ('jt_reflect_ProxyHandler', 'jt_ref_Reference', 'jt_ref_ReferenceQueue') + \
-                ('PyVersion', 'PyException', 'PyObject', 'PyModule', 'PyClass',
-                 'PyClassEnquirer', 'PythonInterpreter', 'PyScriptEngineFactory', 'PyScriptEngine')
+    # The bootstrap class table: (attribute, module of .java, jnij class),
+    # in the order of initialization.
+    _ENTRIES = (
+        ("java_array",              "jnij",  "java_array"),
+        ("java_lang",               "jnij",  "java_lang"),
+        ("java_io",                 "jnij",  "java_io"),
+        ("java_nio",                "jnij",  "java_nio"),
+        ("java_util",               "jnij",  "java_util"),
+        ("System",                  "jnij",  "java_lang_System"),
+        ("Thread",                  "jnij",  "java_lang_Thread"),
+        ("Package",                 "jnij",  "java_lang_Package"),
+        ("ClassLoader",             "jnij",  "java_lang_ClassLoader"),
+        ("Class",                   "jnij",  "java_lang_Class"),
+        ("Throwable",               "jnij",  "java_lang_Throwable"),
+        ("StackTraceElement",       "jnij",  "java_lang_StackTraceElement"),
+        ("AutoCloseable",           "jnij",  "java_lang_AutoCloseable"),
+        ("Comparable",              "jnij",  "java_lang_Comparable"),
+        ("Iterable",                "jnij",  "java_lang_Iterable"),
+        ("Introspector",            "jnij",  "java_beans_Introspector"),
+        ("BeanInfo",                "jnij",  "java_beans_BeanInfo"),
+        ("PropertyDescriptor",      "jnij",  "java_beans_PropertyDescriptor"),
+        ("Annotation",              "jnij",  "java_lang_annotation_Annotation"),
+        ("AnnotatedElement",        "jnij",  "java_lang_reflect_AnnotatedElement"),
+        ("Modifier",                "jnij",  "java_lang_reflect_Modifier"),
+        ("Member",                  "jnij",  "java_lang_reflect_Member"),
+        ("Field",                   "jnij",  "java_lang_reflect_Field"),
+        ("Constructor",             "jnij",  "java_lang_reflect_Constructor"),
+        ("Method",                  "jnij",  "java_lang_reflect_Method"),
+        ("Proxy",                   "jnij",  "java_lang_reflect_Proxy"),
+        ("Void",                    "jnij",  "java_lang_Void"),
+        ("Boolean",                 "jnij",  "java_lang_Boolean"),
+        ("Character",               "jnij",  "java_lang_Character"),
+        ("Byte",                    "jnij",  "java_lang_Byte"),
+        ("Short",                   "jnij",  "java_lang_Short"),
+        ("Integer",                 "jnij",  "java_lang_Integer"),
+        ("Long",                    "jnij",  "java_lang_Long"),
+        ("Float",                   "jnij",  "java_lang_Float"),
+        ("Double",                  "jnij",  "java_lang_Double"),
+        ("Number",                  "jnij",  "java_lang_Number"),
+        ("String",                  "jnij",  "java_lang_String"),
+        ("Object",                  "jnij",  "java_lang_Object"),
+        ("StringWriter",            "jnij",  "java_io_StringWriter"),
+        ("PrintWriter",             "jnij",  "java_io_PrintWriter"),
+
+        ("jt_lang_ObjectArrays",    "jnijt", "jt_lang_ObjectArrays"),
+        ("jt_lang_Boxes",           "jnijt", "jt_lang_Boxes"),
+        ("jt_reflect_ProxyHandler", "jnijt", "jt_reflect_ProxyHandler"),
+        ("jt_reflect_ClassInfo",    "jnijt", "jt_reflect_ClassInfo"),
+        ("jt_reflect_BatchInvoker", "jnijt", "jt_reflect_BatchInvoker"),
+        ("jt_ref_Reference",        "jnijt", "jt_ref_Reference"),
+        ("jt_ref_ReferenceQueue",   "jnijt", "jt_ref_ReferenceQueue"),
+
+        ("PyVersion",               "jnipy", "Version"),
+        ("PyException",             "jnipy", "PyException"),
+        ("PyObject",                "jnipy", "PyObject"),
+        ("PyModule",                "jnipy", "PyModule"),
+        ("PyClass",                 "jnipy", "PyClass"),
+        ("PyClassEnquirer",         "jnipy", "ClassEnquirer"),
+        ("PythonInterpreter",       "jnipy", "PythonInterpreter"),
+        ("PyScriptEngineFactory",   "jnipy", "PyScriptEngineFactory"),
+        ("PyScriptEngine",          "jnipy", "PyScriptEngine"),
+    )
+    _ENTRY_NAMES = frozenset(name for name, *_ in _ENTRIES)
+    # Entries of these modules define their classes (by DefineClass) and these
+    # classes refer to each other, so they have to be initialized in order.
+    _ORDERED_MODULES = frozenset(("jnijt", "jnipy"))
+
+    __slots__ = ('JNI', 'jnijvm', 'data', 'strings', 'classes', 'boxes', 'releases',
+                 'refstats', 'interned', '_entries', '_initialized', '_lock', '_releaser') + \
+                tuple(name for name, *_ in _ENTRIES)
 
     def __init__(self):
         super().__init__()
         self.JNI:    jni.JNI    = None
         self.jnijvm: jni.JavaVM = None
         self.data = adict()
+        self.strings = JStringCache()  # Java Strings of the identifiers
+        self.classes = JClassCache()   # resolved classes
+        self.boxes   = {}              # boxed constants (small integers, booleans)
+        self.releases = JReleaseQueue()  # global references to be released
+        self.refstats = None             # accounting of the global references (JRefStats)
+        self.interned = JInternTable()   # canonical wrappers of the reflection objects
+        self._entries = {}
+        self._initialized = []
+        self._lock = threading.RLock()
+        self._releaser = None  # (thread, stop event)
+
+    def __getattr__(self, name):
+        # In the lazy mode the entries of the bootstrap class table
+        # are initialized on the first access.
+        if (name not in _JVM._ENTRY_NAMES or not self.data.get("lazy")
+           or not self.jnijvm or name not in self._entries):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        with self._lock:
+            if name not in self._initialized:
+                penv = jni.obj(jni.POINTER(jni.JNIEnv))
+                self.jnijvm.AttachCurrentThread(penv)
+                jenv = jni.JEnv(penv)
+                for entry_name in self._requires(name):
+                    if entry_name not in self._initialized:
+                        self._initializeEntry(jenv, entry_name)
+            return object.__getattribute__(self, name)
 
     def _create(self):
 
-        from .java import jnij
-
-        self.java_array         = jnij.java_array()
-        self.java_lang          = jnij.java_lang()
-        self.java_io            = jnij.java_io()
-        self.java_nio           = jnij.java_nio()
-        self.java_util          = jnij.java_util()
-        self.System             = jnij.java_lang_System()
-        self.Thread             = jnij.java_lang_Thread()
-        self.Package            = jnij.java_lang_Package()
-        self.ClassLoader        = jnij.java_lang_ClassLoader()
-        self.Class              = jnij.java_lang_Class()
-        self.Throwable          = jnij.java_lang_Throwable()
-        self.StackTraceElement  = jnij.java_lang_StackTraceElement()
-        self.AutoCloseable      = jnij.java_lang_AutoCloseable()
-        self.Comparable         = jnij.java_lang_Comparable()
-        self.Iterable           = jnij.java_lang_Iterable()
-        self.Introspector       = jnij.java_beans_Introspector()
-        self.BeanInfo           = jnij.java_beans_BeanInfo()
-        self.PropertyDescriptor = jnij.java_beans_PropertyDescriptor()
-        self.Annotation         = jnij.java_lang_annotation_Annotation()
-        self.AnnotatedElement   = jnij.java_lang_reflect_AnnotatedElement()
-        self.Modifier           = jnij.java_lang_reflect_Modifier()
-        self.Member             = jnij.java_lang_reflect_Member()
-        self.Field              = jnij.java_lang_reflect_Field()
-        self.Constructor        = jnij.java_lang_reflect_Constructor()
-        self.Method             = jnij.java_lang_reflect_Method()
-        self.Proxy              = jnij.java_lang_reflect_Proxy()
-        self.Void               = jnij.java_lang_Void()
-        self.Boolean            = jnij.java_lang_Boolean()
-        self.Character          = jnij.java_lang_Character()
-        self.Byte               = jnij.java_lang_Byte()
-        self.Short              = jnij.java_lang_Short()
-        self.Integer            = jnij.java_lang_Integer()
-        self.Long               = jnij.java_lang_Long()
-        self.Float              = jnij.java_lang_Float()
-        self.Double             = jnij.java_lang_Double()
-        self.Number             = jnij.java_lang_Number()
-        self.String             = jnij.java_lang_String()
-        self.Object             = jnij.java_lang_Object()
-        self.StringWriter       = jnij.java_io_StringWriter()
-        self.PrintWriter        = jnij.java_io_PrintWriter()
-
-        from .java import jnijt
-
-        self.jt_reflect_ProxyHandler = jnijt.jt_reflect_ProxyHandler()
-        self.jt_ref_Reference        = jnijt.jt_ref_Reference()
-        self.jt_ref_ReferenceQueue   = jnijt.jt_ref_ReferenceQueue()
-
-        from .java import jnipy
-
-        self.PyVersion             = jnipy.Version()
-        self.PyException           = jnipy.PyException()
-        self.PyObject              = jnipy.PyObject()
-        self.PyModule              = jnipy.PyModule()
-        self.PyClass               = jnipy.PyClass()
-        self.PyClassEnquirer       = jnipy.ClassEnquirer()
-        self.PythonInterpreter     = jnipy.PythonInterpreter()
-        self.PyScriptEngineFactory = jnipy.PyScriptEngineFactory()
-        self.PyScriptEngine        = jnipy.PyScriptEngine()
+        from .java import jnij, jnijt, jnipy
+        modules = dict(jnij=jnij, jnijt=jnijt, jnipy=jnipy)
+
+        self._entries = {name: getattr(modules[module], class_name)()
+                         for name, module, class_name in _JVM._ENTRIES}
 
     def _initialize(self, jenv: jni.JNIEnv):
 
-        self.java_array.initialize(jenv)
-        self.java_lang.initialize(jenv)
-        self.java_io.initialize(jenv)
-        self.java_nio.initialize(jenv)
-        self.java_util.initialize(jenv)
-        self.System.initialize(jenv)
-        self.Thread.initialize(jenv)
-        self.Package.initialize(jenv)
-        self.ClassLoader.initialize(jenv)
-        self.Class.initialize(jenv)
-        self.Throwable.initialize(jenv)
-        self.StackTraceElement.initialize(jenv)
-        self.AutoCloseable.initialize(jenv)
-        self.Comparable.initialize(jenv)
-        self.Iterable.initialize(jenv)
-        self.Introspector.initialize(jenv)
-        self.BeanInfo.initialize(jenv)
-        self.PropertyDescriptor.initialize(jenv)
-        self.Annotation.initialize(jenv)
-        self.AnnotatedElement.initialize(jenv)
-        self.Modifier.initialize(jenv)
-        self.Member.initialize(jenv)
-        self.Field.initialize(jenv)
-        self.Constructor.initialize(jenv)
-        self.Method.initialize(jenv)
-        self.Proxy.initialize(jenv)
-        self.Void.initialize(jenv)
-        self.Boolean.initialize(jenv)
-        self.Character.initialize(jenv)
-        self.Byte.initialize(jenv)
-        self.Short.initialize(jenv)
-        self.Integer.initialize(jenv)
-        self.Long.initialize(jenv)
-        self.Float.initialize(jenv)
-        self.Double.initialize(jenv)
-        self.Number.initialize(jenv)
-        self.String.initialize(jenv)
-        self.Object.initialize(jenv)
-        self.StringWriter.initialize(jenv)
-        self.PrintWriter.initialize(jenv)
-
-        self.jt_reflect_ProxyHandler.initialize(jenv)
-        self.jt_ref_Reference.initialize(jenv)
-        self.jt_ref_ReferenceQueue.initialize(jenv)
-
-        self.PyVersion.initialize(jenv)
-        self.PyException.initialize(jenv)
-        self.PyObject.initialize(jenv)
-        self.PyModule.initialize(jenv)
-        self.PyClass.initialize(jenv)
-        self.PyClassEnquirer.initialize(jenv)
-        self.PythonInterpreter.initialize(jenv)
-        self.PyScriptEngineFactory.initialize(jenv)
-        self.PyScriptEngine.initialize(jenv)
+        if self.data.get("lazy"): return
+
+        for name in self._entries:
+            self._initializeEntry(jenv, name)
 
     def _dispose(self, jenv: jni.JNIEnv):
 
-        self.java_array.dispose(jenv)
-        self.java_lang.dispose(jenv)
-        self.java_io.dispose(jenv)
-        self.java_nio.dispose(jenv)
-        self.java_util.dispose(jenv)
-        self.System.dispose(jenv)
-        self.Thread.dispose(jenv)
-        self.Package.dispose(jenv)
-        self.ClassLoader.dispose(jenv)
-        self.Class.dispose(jenv)
-        self.Throwable.dispose(jenv)
-        self.StackTraceElement.dispose(jenv)
-        self.AutoCloseable.dispose(jenv)
-        self.Comparable.dispose(jenv)
-        self.Iterable.dispose(jenv)
-        self.Introspector.dispose(jenv)
-        self.BeanInfo.dispose(jenv)
-        self.PropertyDescriptor.dispose(jenv)
-        self.Annotation.dispose(jenv)
-        self.AnnotatedElement.dispose(jenv)
-        self.Modifier.dispose(jenv)
-        self.Member.dispose(jenv)
-        self.Field.dispose(jenv)
-        self.Constructor.dispose(jenv)
-        self.Method.dispose(jenv)
-        self.Proxy.dispose(jenv)
-        self.Void.dispose(jenv)
-        self.Boolean.dispose(jenv)
-        self.Character.dispose(jenv)
-        self.Byte.dispose(jenv)
-        self.Short.dispose(jenv)
-        self.Integer.dispose(jenv)
-        self.Long.dispose(jenv)
-        self.Float.dispose(jenv)
-        self.Double.dispose(jenv)
-        self.Number.dispose(jenv)
-        self.String.dispose(jenv)
-        self.Object.dispose(jenv)
-        self.StringWriter.dispose(jenv)
-        self.PrintWriter.dispose(jenv)
-
-        self.jt_reflect_ProxyHandler.dispose(jenv)
-        self.jt_ref_Reference.dispose(jenv)
-        self.jt_ref_ReferenceQueue.dispose(jenv)
-
-        self.PyVersion.dispose(jenv)
-        self.PyException.dispose(jenv)
-        self.PyObject.dispose(jenv)
-        self.PyModule.dispose(jenv)
-        self.PyClass.dispose(jenv)
-        self.PyClassEnquirer.dispose(jenv)
-        self.PythonInterpreter.dispose(jenv)
-        self.PyScriptEngineFactory.dispose(jenv)
-        self.PyScriptEngine.dispose(jenv)
+        self._stopReleaser()
+        self.classes.clear()
+        self.interned.clear()
+        self.strings.clear(jenv)
+        self.boxes.clear()
+        self.releases.drain(jenv)
+        initialized = self._initialized
+        self._initialized = []
+        for name in initialized:
+            entry = object.__getattribute__(self, name)
+            object.__delattr__(self, name)
+            entry.dispose(jenv)
+
+    def _startReleaser(self, interval: float | None):
+        # The optional daemon thread, which drains the queue of the global
+        # references to be released every interval seconds (for the processes
+        # which may not call into the JVM for a long time).
+        self._stopReleaser()
+        if interval is None: return
+        stop = threading.Event()
+
+        def run():
+            jenv = None
+            try:
+                while not stop.wait(interval):
+                    if not self.releases.pending: continue
+                    # A failure is logged and recorded (see releaseStats())
+                    # and the thread goes on (retrying on the next interval).
+                    try:
+                        if jenv is None:
+                            penv = jni.obj(jni.POINTER(jni.JNIEnv))
+                            self.jnijvm.AttachCurrentThreadAsDaemon(penv)
+                            jenv = jni.JEnv(penv)
+                        self.releases.drain(jenv)
+                    except Exception as exc:
+                        log.exception("jvm-releaser: release of the global references failed")
+                        self.releases.failed(exc)
+            finally:
+                if jenv is not None:
+                    self.jnijvm.DetachCurrentThread()
+
+        thread = threading.Thread(target=run, name="jvm-releaser", daemon=True)
+        self._releaser = (thread, stop)
+        thread.start()
+
+    def _stopReleaser(self):
+        if self._releaser is None: return
+        thread, stop = self._releaser
+        self._releaser = None
+        stop.set()
+        thread.join()
+
+    def _initializeEntry(self, jenv: jni.JNIEnv, name: str):
+        entry = self._entries[name]
+        entry.initialize(jenv)
+        object.__setattr__(self, name, entry)
+        self._initialized.append(name)
+
+    def _requires(self, name: str):
+        # Names of the entries which have to be initialized (in order)
+        # to get the entry 'name' initialized.
+        module = next(module for entry_name, module, _ in _JVM._ENTRIES if entry_name == name)
+        if module not in _JVM._ORDERED_MODULES:
+            return [name]
+        requires = []
+        for entry_name, entry_module, _ in _JVM._ENTRIES:
+            if entry_module == module:
+                requires.append(entry_name)
+            if entry_name == name:
+                break
+        return requires
@@ -0,0 +1,8 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+if __name__.rpartition(".")[-1] == "__main__":
+    import sys
+    from .startup import main
+    sys.exit(main())
@@ -0,0 +1,80 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+# Hashing/equality benchmark of the wrappers: set/dict construction and
+# membership over N wrappers of distinct Java objects (java.lang.Integer),
+# in the identity mode (the default) and in the value-equality mode
+# (JVM.start(equality="value")).
+#
+# Usage:
+#   python -m tests.benchmarks.identity [jvm_path] [-n COUNT]
+#
+# 'same' lookups use the wrappers stored in the set/dict, 'other' lookups
+# use second wrappers of the same Java objects (fresh hashes, IsSameObject
+# or equals() on the hit).
+
+from __future__ import annotations
+
+import sys
+import time
+import argparse
+
+
+def run(jvm_path: str, count: int = 1_000_000) -> dict:
+    import jvm
+    jvm_ = jvm.JVM(jvm_path)
+    jvm_.start()
+    try:
+        array = jvm_.JObject.boxIntegers(range(count))
+        results = {}
+        for equality in ("identity", "value"):
+            jvm_._jvm.data.equality = equality
+            # Fresh wrappers per mode (the identity hashes are fetched once).
+            objects = [array.getObject(idx) for idx in range(count)]
+            others  = [array.getObject(idx) for idx in range(count)]
+
+            def measure(key, func):
+                t0 = time.perf_counter()
+                func()
+                results[f"{equality}/{key}"] = time.perf_counter() - t0
+
+            holder = {}
+            measure("set()",        lambda: holder.update(set=set(objects)))
+            measure("dict()",       lambda: holder.update(dict=dict.fromkeys(objects)))
+            measure("in set/same",  lambda: all(obj in holder["set"] for obj in objects))
+            measure("in set/other", lambda: all(obj in holder["set"] for obj in others))
+            measure("dict[]/other", lambda: [holder["dict"][obj] for obj in others])
+            del holder, objects, others
+        return results
+    finally:
+        jvm_._jvm.data.equality = "identity"
+        jvm_.shutdown()
+
+
+def report(results: dict, count: int, file=sys.stdout):
+    print(f"{'phase':<28} {'time [ms]':>10} {'per item [us]':>14}", file=file)
+    for key, elapsed in results.items():
+        print(f"{key:<28} {elapsed * 1000:10.3f} {elapsed / count * 1e6:14.3f}", file=file)
+
+
+def main(argv=sys.argv[1:]):
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks.identity",
+                                     description="Wrapper hashing/equality benchmark.")
+    parser.add_argument("jvm_path", nargs="?", default=None,
+                        help="path of the JVM shared library (default: found by JVMFinder)")
+    parser.add_argument("-n", "--count", type=int, default=1_000_000,
+                        help="number of the wrappers (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    jvm_path = args.jvm_path
+    if jvm_path is None:
+        from jvm.platform import JVMFinder
+        jvm_path = JVMFinder().get_jvm_path()
+
+    report(run(jvm_path, args.count), args.count)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
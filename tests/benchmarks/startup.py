@@ -0,0 +1,188 @@
+# Copyright (c) 2004 Adam Karpierz
+# SPDX-License-Identifier: CC-BY-NC-ND-4.0 OR LicenseRef-Proprietary
+# Please refer to the accompanying LICENSE file.
+
+# Startup-time benchmark of: import jvm, JVM(dll_path), JVM.start()
+# (eager and lazy), with a per-entry breakdown of the _JVM bootstrap
+# class table (jnij.initialize(), including the registerClass byte-code
+# definitions).
+#
+# Usage:
+#   python -m tests.benchmarks [jvm_path] [-n REPEAT] [-o OUTPUT.json]
+#                              [-b BASELINE.json] [-t THRESHOLD]
+#
+# Every measurement runs in a fresh process (there can be only one JVM
+# per process). Times are medians of REPEAT runs; allocations are the
+# Python allocations (tracemalloc) of a separate, traced run.
+# Without a baseline (the default one is per machine, so not committed:
+# store it once with -o tests/benchmarks/startup_baseline.json) the
+# regression comparison is skipped with a notice.
+
+from __future__ import annotations
+
+import sys
+import os
+import json
+import time
+import statistics
+import subprocess
+import argparse
+from pathlib import Path
+
+here = Path(__file__).resolve().parent
+
+DEFAULT_BASELINE  = here/"startup_baseline.json"
+DEFAULT_THRESHOLD = 0.20     # relative
+MIN_TIME_DELTA    = 0.001    # sec
+MIN_ALLOC_DELTA   = 4096     # bytes
+
+
+def _child(mode: str, jvm_path: str, trace: bool) -> dict:
+    # Executed in a fresh process: measures one startup of the JVM.
+
+    if trace:
+        import tracemalloc
+        tracemalloc.start()
+
+    results = {}
+
+    def measure(key, func, *args, **kwargs):
+        if trace:
+            tracemalloc.reset_peak()
+            size0, _ = tracemalloc.get_traced_memory()
+        t0 = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - t0
+        results[key] = {"time": elapsed}
+        if trace:
+            size1, peak = tracemalloc.get_traced_memory()
+            results[key].update(alloc=size1 - size0, peak=peak - size0)
+        return result
+
+    import importlib
+    jvm = measure("import jvm", importlib.import_module, "jvm")
+    from jvm.jvm import _JVM
+
+    # Breakdown of the bootstrap class table.
+    initializeEntry = _JVM._initializeEntry
+    prefix = "start/" if mode == "eager" else "lazy/"
+    def _initializeEntry(self, jenv, name):
+        measure(prefix + name, initializeEntry, self, jenv, name)
+    _JVM._initializeEntry = _initializeEntry
+
+    jvm_ = measure("JVM()", jvm.JVM, jvm_path)
+    if mode == "eager":
+        measure("JVM.start()", jvm_.start)
+    else:
+        measure("JVM.start(lazy=True)", jvm_.start, lazy=True)
+        for name, *_ in _JVM._ENTRIES:
+            getattr(jvm_._jvm, name)
+    jvm_.shutdown()
+
+    return results
+
+
+def _run_child(mode: str, jvm_path: str, trace: bool = False) -> dict:
+    cmd = [sys.executable, str(Path(__file__).resolve()), "--child", mode, jvm_path]
+    if trace: cmd.append("--trace")
+    output = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def run(jvm_path: str, repeat: int = 5) -> dict:
+    results = {}
+    for mode in ("eager", "lazy"):
+        runs = [_run_child(mode, jvm_path) for _ in range(repeat)]
+        traced = _run_child(mode, jvm_path, trace=True)
+        for key in runs[0]:
+            results[key] = {
+                "time":  statistics.median(run_[key]["time"] for run_ in runs),
+                "alloc": traced[key]["alloc"],
+                "peak":  traced[key]["peak"],
+            }
+    return {
+        "python":  sys.version.split()[0],
+        "jvm":     str(jvm_path),
+        "repeat":  repeat,
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict,
+            threshold: float = DEFAULT_THRESHOLD) -> list[tuple[str, str, float, float]]:
+    # Returns the list of regressions: (phase, metric, baseline, current).
+    regressions = []
+    for key, base in baseline["results"].items():
+        cur = current["results"].get(key)
+        if cur is None: continue
+        for metric, min_delta in (("time", MIN_TIME_DELTA), ("alloc", MIN_ALLOC_DELTA)):
+            base_val, cur_val = base.get(metric), cur.get(metric)
+            if base_val is None or cur_val is None: continue
+            if (cur_val - base_val > min_delta
+               and cur_val > base_val * (1.0 + threshold)):
+                regressions.append((key, metric, base_val, cur_val))
+    return regressions
+
+
+def report(current: dict, baseline: dict | None = None, file=sys.stdout):
+    base_results = baseline["results"] if baseline else {}
+    print(f"{'phase':<40} {'time [ms]':>10} {'base [ms]':>10} "
+          f"{'alloc [KiB]':>12} {'peak [KiB]':>11}", file=file)
+    for key, cur in current["results"].items():
+        base = base_results.get(key, {})
+        base_time = (f"{base['time'] * 1000:10.3f}" if "time" in base else f"{'-':>10}")
+        print(f"{key:<40} {cur['time'] * 1000:10.3f} {base_time} "
+              f"{cur['alloc'] / 1024:12.1f} {cur['peak'] / 1024:11.1f}", file=file)
+
+
+def main(argv=sys.argv[1:]):
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks",
+                                     description="JVM startup-time benchmark.")
+    parser.add_argument("jvm_path", nargs="?", default=None,
+                        help="path of the JVM shared library (default: found by JVMFinder)")
+    parser.add_argument("-n", "--repeat", type=int, default=5,
+                        help="number of timed runs per mode (default: %(default)s)")
+    parser.add_argument("-o", "--output", type=Path, default=None,
+                        help="write the results as JSON to this file "
+                             "(e.g. to store a new baseline)")
+    parser.add_argument("-b", "--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help="baseline JSON to compare against (default: %(default)s)")
+    parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown flagged as regression (default: %(default)s)")
+    parser.add_argument("--child", choices=("eager", "lazy"), help=argparse.SUPPRESS)
+    parser.add_argument("--trace", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_child(args.child, args.jvm_path, args.trace)))
+        return 0
+
+    if args.baseline and not args.baseline.is_file():
+        if args.baseline != DEFAULT_BASELINE:
+            parser.error(f"baseline file not found: {args.baseline}")
+        print(f"NOTICE: no baseline ({args.baseline}), the regression comparison "
+              f"is skipped (store one with -o {args.baseline})", file=sys.stderr)
+        args.baseline = None
+
+    jvm_path = args.jvm_path
+    if jvm_path is None:
+        from jvm.platform import JVMFinder
+        jvm_path = JVMFinder().get_jvm_path()
+
+    current = run(jvm_path, repeat=args.repeat)
+    baseline = (json.loads(args.baseline.read_text("utf-8"))
+                if args.baseline else None)
+    report(current, baseline)
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2) + "\n", "utf-8")
+    if baseline is None:
+        return 0
+    regressions = compare(current, baseline, args.threshold)
+    for key, metric, base_val, cur_val in regressions:
+        print(f"REGRESSION: {key}: {metric} {base_val:.6g} -> {cur_val:.6g}",
+              file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,12 +5,23 @@
 from __future__ import annotations
 
 import unittest
+import os
 import sys
+import threading
+import time
+import tempfile
+import array
+import ctypes
+from pathlib import Path
 NoneType = type(None)
 
 import jni
-from jvm.jconstants import EJavaType
-from jvm.jstring    import JString
+from jvm.jconstants import EJavaType, EMatch
+from jvm.jstring    import JString, JStringCache
+from jvm._util      import str2jchars
+from jvm.jmodifiers  import JModifiers
+from jvm.jmemberinfo import JMemberInfo
+from jvm.jmetacache  import JMetadataCache, _classPathStamps
 from jvm.lib        import platform
 
 
@@ -38,6 +49,133 @@ class JVMTestCase(unittest.TestCase):
                                     r"Unable to load DLL \[non_existent_dll\], error = .+"):
             jvm = JVM("non_existent_dll")
 
+        # the JNIEnv of an attached thread is cached and reused
+        _, jenv1 = self.jvm
+        _, jenv2 = self.jvm
+        self.assertIs(jenv1, jenv2)
+
+        thread_jenvs = []
+        def thread_main():
+            _, jenv = self.jvm.attachThread()
+            thread_jenvs.append(jenv)
+            thread_jenvs.append(self.jvm.__enter__()[1])
+            self.jvm.detachThread()
+            thread_jenvs.append(self.jvm.isThreadAttached())
+        thread = threading.Thread(target=thread_main)
+        thread.start()
+        thread.join()
+        self.assertIs(thread_jenvs[0], thread_jenvs[1])
+        self.assertIsNot(thread_jenvs[0], jenv1)
+        self.assertFalse(thread_jenvs[2])
+
+        # the finalizers only queue the global references, which are released
+        # in bulk on the next call into the JVM (or by the releaser thread)
+        releases = self.jvm._jvm.releases
+        _, jenv = self.jvm
+        released = self.jvm.releaseStats().released
+        strings = [self.jvm.JObject.newString(str(i)) for i in range(100)]
+        del strings
+        self.assertGreaterEqual(len(releases), 100)
+        self.assertEqual(self.jvm.JObject.newString("next").toString(), "next")
+        stats = self.jvm.releaseStats()
+        self.assertEqual(stats.depth, len(releases))
+        self.assertGreaterEqual(stats.released, released + 100)
+        self.assertGreaterEqual(stats.max_depth, 100)
+        self.assertGreaterEqual(stats.max_latency, stats.last_latency)
+        self.jvm._jvm._startReleaser(0.01)
+        try:
+            strings = [self.jvm.JObject.newString(str(i)) for i in range(10)]
+            del strings
+            for _ in range(500):
+                if not releases: break
+                time.sleep(0.01)
+            self.assertEqual(len(releases), 0)
+            # a failure does not stop the releaser thread, it is reported
+            class FailingQueue(type(releases)):
+                __slots__ = ()
+                def drain(self, jenv):
+                    if threading.current_thread().name == "jvm-releaser":
+                        raise RuntimeError("drain failed")
+                    return super().drain(jenv)
+            with self.assertLogs("jvm.jvm", level="ERROR") as logs:
+                releases.__class__ = FailingQueue  # (of this queue only)
+                try:
+                    strings = [self.jvm.JObject.newString(str(i)) for i in range(10)]
+                    del strings
+                    for _ in range(500):
+                        if self.jvm.releaseStats().failures: break
+                        time.sleep(0.01)
+                finally:
+                    releases.__class__ = FailingQueue.__base__
+            self.assertIn("drain failed", logs.output[0])
+            stats = self.jvm.releaseStats()
+            self.assertGreaterEqual(stats.failures, 1)
+            self.assertIsInstance(stats.last_failure, RuntimeError)
+            self.assertTrue(stats.releaser)
+            for _ in range(500):
+                if not releases: break
+                time.sleep(0.01)
+            self.assertEqual(len(releases), 0)
+        finally:
+            self.jvm._jvm._stopReleaser()
+        self.assertFalse(self.jvm.releaseStats().releaser)
+
+        # inside an arena the wrappers are backed by local references,
+        # the escaping ones are promoted to global references on exit
+        with self.jvm.arena() as arena:
+            kept = self.jvm.JObject.newString("kept")
+            promoted = arena.promote(self.jvm.JObject.newString("promoted"))
+            self.assertFalse(kept._own)
+            self.assertTrue(promoted._own)
+            for i in range(10):
+                self.assertEqual(self.jvm.JObject.newString(str(i)).toString(), str(i))
+            self.assertGreaterEqual(len(arena), 11)
+            self.assertIs(type(arena).current(), arena)
+        self.assertIsNone(type(arena).current())
+        self.assertTrue(kept._own)
+        self.assertEqual((kept.toString(), promoted.toString()), ("kept", "promoted"))
+        with self.jvm.arena(capacity=4, limit=8) as arena:
+            strings = [self.jvm.JObject.newString(str(i)) for i in range(20)]
+            self.assertLessEqual(len(arena), 8)
+        self.assertEqual([item.toString() for item in strings], [str(i) for i in range(20)])
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover
+            numpy = None
+        if numpy is not None:
+            # the frames reset in a loop are not absorbed by the arena
+            jmatrix = self.jvm.JArray.newFromNumpy(numpy.zeros((1000, 2)))
+            with self.jvm.arena(capacity=16, limit=256) as arena:
+                self.assertEqual(jmatrix.to_numpy().shape, (1000, 2))
+                backed = self.jvm.JObject.newString("backed")
+                self.assertEqual(len(arena), 1)
+            self.assertEqual(backed.toString(), "backed")
+
+        # opt-in accounting of the global references
+        self.assertIsNone(self.jvm.refstats())
+        self.jvm.enableRefStats(stack_sample=5)
+        try:
+            checkpoint = self.jvm.refstats().checkpoint
+            kept = [self.jvm.JObject.newString(str(i)) for i in range(20)]
+            temps = [self.jvm.JObject.newString(str(i)) for i in range(10)]
+            del temps
+            jargs = self.jvm.JArguments(1)
+            jargs.setString(0, "arg")
+            stats = self.jvm.refstats(since=checkpoint)
+            self.assertEqual(stats.total, 21)
+            self.assertEqual(stats.by_type, {"JObject": 20, "JArguments": 1})
+            self.assertEqual(stats.by_class, {"java.lang.String": 21})
+            self.assertGreaterEqual(stats.high_water_by_type["JObject"], 30)
+            self.assertGreaterEqual(stats.high_water, 30)
+            self.assertEqual(len(stats.stacks), 4)
+            wrapper_type, class_name, stack = stats.stacks[0]
+            self.assertEqual((wrapper_type, class_name), ("JObject", "java.lang.String"))
+            self.assertEqual(stack[-1].filename, __file__)
+            del kept, jargs
+            self.assertEqual(self.jvm.refstats(since=checkpoint).total, 0)
+        finally:
+            self.jvm.disableRefStats()
+
         pass  # TODO
 
     def test__JVM(self):
@@ -55,6 +193,34 @@ class JVMTestCase(unittest.TestCase):
         self.assertEqual(self.jvm._jvm.Double.MIN_VALUE,  5e-324)
         self.assertEqual(self.jvm._jvm.Double.MAX_VALUE,  1.7976931348623157e+308)
 
+        # lazy initialization of the bootstrap class table
+        from jvm.jvm import _JVM
+        jvm = _JVM()
+        jvm.JNI    = self.jvm._jvm.JNI
+        jvm.jnijvm = self.jvm._jvm.jnijvm
+        jvm.data.lazy = True
+        jvm._create()
+        _, jenv = self.jvm
+        jvm._initialize(jenv)
+        self.assertEqual(jvm._initialized, [])
+        self.assertEqual(jvm.Integer.MAX_VALUE, 2147483647)
+        self.assertEqual(jvm._initialized, ["Integer"])
+        jvm.jt_ref_ReferenceQueue
+        self.assertEqual(jvm._initialized, ["Integer", "jt_lang_ObjectArrays",
+                                            "jt_lang_Boxes",
+                                            "jt_reflect_ProxyHandler",
+                                            "jt_reflect_ClassInfo",
+                                            "jt_reflect_BatchInvoker",
+                                            "jt_ref_Reference", "jt_ref_ReferenceQueue"])
+        with self.assertRaises(AttributeError):
+            jvm.NonExistent
+        jvm._dispose(jenv)
+        self.assertEqual(jvm._initialized, [])
+        jvm.data.lazy = False
+        with self.assertRaises(AttributeError):
+            jvm.Integer
+        del jvm, _JVM
+
         pass  # TODO
 
     def test_JClassLoader(self):
@@ -151,7 +317,11 @@ class JVMTestCase(unittest.TestCase):
 
         jclass = cloader.findLoadedClass(jclass_name)
         #self.assertIsNone(jclass)
-        #def loadClass(self, name: str) -> JClass | None:
+
+        jclass = cloader.loadClass("java.lang.Integer")
+        self.assertEqual(jclass.getName(), "java.lang.Integer")
+        self.assertIs(cloader.loadClass("java.lang.Integer"), jclass)
+        self.assertIn(("java.lang.Integer", cloader), self.jvm._jvm.classes)
 
     def test_JPackage(self):
 
@@ -172,6 +342,24 @@ class JVMTestCase(unittest.TestCase):
         jclass_name = "org.python.jsr223.PyScriptEngine"
 
         jclass = self.jvm.JClass.forName(jclass_name)
+        self.assertIs(self.jvm.JClass.forName(jclass_name), jclass)
+        self.assertIs(self.jvm.JClass.getIntArrayClass(2),
+                      self.jvm.JClass.getIntArrayClass(2))
+        self.assertIsNot(self.jvm.JClass.getIntArrayClass(1),
+                         self.jvm.JClass.getIntArrayClass(2))
+        classes = self.jvm._jvm.classes
+        maxsize = classes.maxsize
+        classes.maxsize = 1
+        try:
+            jclass1 = self.jvm.JClass.getLongArrayClass(1)
+            self.assertEqual(len(classes), 1)
+            self.assertIn((b"[J", None), classes)
+            self.assertIsNot(self.jvm.JClass.getLongArrayClass(2), jclass1)
+            self.assertEqual(len(classes), 1)
+            self.assertNotIn((b"[J", None), classes)
+            self.assertEqual(self.jvm.JClass.getLongArrayClass(1), jclass1)
+        finally:
+            classes.maxsize = maxsize
         self._check_jclass(jclass,
                            name=jclass_name,
                            canonical_name=jclass_name,
@@ -582,6 +770,65 @@ class JVMTestCase(unittest.TestCase):
         for item in descriptors:
             self.assertIsInstance(item, self.jvm.JPropertyDescriptor)
 
+        infos = jclass.getMemberInfos()
+        self.assertIs(jclass.getMemberInfos(), infos)
+        self.assertEqual({(info.name, info.signature) for info in infos if info.isMethod},
+                         {(item.getName(), item.getSignature()) for item in methods})
+        self.assertEqual(sum(info.isConstructor for info in infos),
+                         len(jclass.getConstructors()))
+        self.assertEqual(sum(info.isField for info in infos), len(jclass.getFields()))
+        for info, item in zip((info for info in infos if info.isMethod), methods):
+            self.assertEqual(info.modifiers, item.getModifiers())
+            self.assertEqual(info.getModifiersSet(), item.getModifiersSet())
+        declared = jclass.getDeclaredMemberInfos()
+        self.assertTrue(all(info.declaringClass == jclass_name for info in declared))
+        modifiers = jclass.getMemberModifiers(declared=True)
+        self.assertEqual(list(modifiers), list(declared))
+        for info, modif in modifiers.items():
+            self.assertIsInstance(modif, JModifiers)
+            self.assertEqual(modif.modif, info.modifiers)
+            self.assertEqual(modif.getModifiersSet(), info.getModifiersSet())
+        modif = JModifiers(0x0001 | 0x0008 | 0x0020 | 0x0100)  # public static synchronized native
+        self.assertEqual((modif.isPublic, modif.isPrivate, modif.isStatic, modif.isSynchronized,
+                          modif.isNative, modif.isVolatile, modif.isTransient, modif.isStrict),
+                         (True, False, True, True, True, False, False, False))
+        self.assertIs(JModifiers.of(modif.modif), JModifiers.of(modif.modif))
+        self.assertEqual(JModifiers.of(modif.modif), modif)
+        with self.jvm as (jvm, jenv):
+            self.assertEqual(JModifiers(jvm, jenv, modif.modif), modif)  # former signature
+        Point = self.jvm.JClass.forName("java.awt.Point")
+        x = next(info for info in Point.getMemberInfos() if info.isField and info.name == "x")
+        self.assertEqual((x.kind, x.signature, x.isPublic, x.isStatic), ("F", "I", True, False))
+        self.assertEqual(Point.bindField(x.name, x.signature, x.isStatic).get(
+                         Point.bindMethod("<init>", "(II)V")(5, 6)), 5)
+
+        with tempfile.TemporaryDirectory() as directory:
+            data = self.jvm._jvm.data
+            data.metadata_cache = cache = JMetadataCache(directory)
+            try:
+                Rectangle = self.jvm.JClass.forName("java.awt.Rectangle")
+                infos = Rectangle.getDeclaredMemberInfos()
+                with self.jvm as (jvm, jenv):
+                    fingerprint = cache.fingerprint(jvm, jenv)
+                    self.assertEqual(len(list((Path(directory)/fingerprint).
+                                              glob("*.declared.jmi"))), 1)
+                    description = cache.load(jvm, jenv, "java.awt.Rectangle", True)
+                    self.assertEqual(JMemberInfo.decode(description), infos)
+                    self.assertIsNone(cache.load(jvm, jenv, "java.awt.Rectangle", False))
+                    self.assertIsNone(cache.load(jvm, jenv, "java.awt.rectangle", True))
+                cache.clear()
+                self.assertEqual(list((Path(directory)/fingerprint).iterdir()), [])
+            finally:
+                data.metadata_cache = None
+            # the class files under a directory entry of the class path
+            # are part of the fingerprint
+            class_file = Path(directory)/"com"/"x"/"Foo.class"
+            class_file.parent.mkdir(parents=True)
+            class_file.write_bytes(b"\xca\xfe\xba\xbe")
+            stamps = list(_classPathStamps(directory))
+            os.utime(class_file, ns=(0, 0))
+            self.assertNotEqual(list(_classPathStamps(directory)), stamps)
+
         enclosing_class = jclass.getEnclosingClass()
         self.assertIsInstance(enclosing_class, (self.jvm.JClass, NoneType))
 
@@ -597,6 +844,19 @@ class JVMTestCase(unittest.TestCase):
         self.assertEqual(jobject.getClass().getName(), jclass_name)
         self.assertEqual(jobject.toString(), "")
 
+        # canonical (interned) wrappers of the reflection objects
+        stats = self.jvm.internStats()
+        strings = [self.jvm.JObject.newString(str(i)) for i in range(10)]
+        classes = [item.getClass() for item in strings]
+        self.assertTrue(all(item is classes[0] for item in classes))
+        self.assertGreaterEqual(self.jvm.internStats().hits - stats.hits, 9)
+        self.assertIsNot(classes[0].asObject(own=False), classes[0])
+        Point = self.jvm.JClass.forName("java.awt.Point")
+        self.assertIs(Point.getField("x"), Point.getField("x"))
+        self.assertIs(Point.getDeclaredField("x"), Point.getField("x"))
+        self.assertIsNot(Point.getField("x"), Point.getField("y"))
+        self.assertIs(Point.getField("x").getDeclaringClass(), Point)
+
     def test_JField(self):
 
         jclass_name = "java.lang.String"
@@ -989,6 +1249,49 @@ class JVMTestCase(unittest.TestCase):
             with self.assertRaises(TypeError):
                 jargs.setObject(9, val_expected)
 
+        # Call-scoped arguments (local references).
+        String = self.jvm.JClass.forName("java.lang.String")
+        concat = next(meth for meth in String.getMethods() if meth.getName() == "concat")
+        value_of = next(meth for meth in String.getMethods()
+                        if meth.getSignature() == "(Ljava/lang/Object;)Ljava/lang/String;")
+        with self.jvm.JArguments(1, local=True) as jargs:
+            jargs.setString(0, "def")
+            jvalues = jargs.arguments
+            self.assertEqual(concat.callInstanceString(self.jvm.JObject.newString("abc"),
+                                                       jargs), "abcdef")
+            jargs.setObject(0, self.jvm.JObject.newInteger(42))
+            self.assertEqual(value_of.callStaticString(String, jargs), "42")
+        # after the with block (the jvalue array is back in the pool)
+        with self.assertRaises(RuntimeError):
+            jargs.setString(0, "def")
+        with self.assertRaises(RuntimeError):
+            jargs.setInt(0, 1)
+        with self.assertRaises(RuntimeError):
+            jargs.arguments
+        with self.assertRaises(RuntimeError):
+            value_of.callStaticString(String, jargs)
+        with self.assertRaises(RuntimeError):
+            jargs.retain()
+        with self.assertRaises(RuntimeError):
+            with jargs: pass
+        self.jvm.enableRefStats()
+        try:
+            checkpoint = self.jvm.refstats().checkpoint
+            with self.jvm.JArguments(1, local=True) as jargs:
+                self.assertEqual(jargs.arguments, jvalues)  # pooled jvalue array
+                jargs.setString(0, "xyz")
+                retained = jargs.retain()
+            self.assertIs(retained, jargs)
+            self.assertNotEqual(jargs.arguments, jvalues)
+            self.assertEqual(jargs.argtypes, [EJavaType.STRING])
+            self.assertEqual(concat.callInstanceString(self.jvm.JObject.newString("abc"),
+                                                       jargs), "abcxyz")
+            self.assertEqual(self.jvm.refstats(since=checkpoint).by_type, {"JArguments": 1})
+            del jargs, retained
+            self.assertEqual(self.jvm.refstats(since=checkpoint).by_type, {})
+        finally:
+            self.jvm.disableRefStats()
+
         # TODO
 
     def test_JConstructor(self):
@@ -1390,6 +1693,81 @@ class JVMTestCase(unittest.TestCase):
         self.assertEqual(this2.getClass().getName(), jclass_name2)
         self.assertEqual(this2.toString(), "123")
 
+        # Pre-bound call stubs.
+        StringBuilder = self.jvm.JClass.forName("java.lang.StringBuilder")
+        new_sb = self._get_constructor(StringBuilder, "(Ljava/lang/String;)V").bind()
+        sb = new_sb("ab")
+        self.assertIsInstance(sb, self.jvm.JObject)
+        self.assertEqual(sb.toString(), "ab")
+        length = self._get_method(StringBuilder, "length", "()I")
+        self.assertEqual(length.bind()(sb), 2)
+        self.assertEqual(length.bind(sb)(), 2)
+        append = self._get_method(StringBuilder, "append",
+                                  "(Ljava/lang/String;)Ljava/lang/StringBuilder;")
+        append = append.bind(sb)
+        self.assertEqual(append("cd").toString(), "abcd")
+        self.assertEqual(append(None).toString(), "abcdnull")
+        char_at = self._get_method(StringBuilder, "charAt", "(I)C").bind(sb)
+        self.assertEqual(char_at(1), "b")
+        with self.assertRaises(Exception):
+            char_at(100)
+        with self.assertRaises(TypeError):
+            char_at()
+        Math = self.jvm.JClass.forName("java.lang.Math")
+        max_ = self._get_method(Math, "max", "(II)I").bind()
+        self.assertEqual(max_(3, 9), 9)
+        String = self.jvm.JClass.forName("java.lang.String")
+        value_of = self._get_method(String, "valueOf", "(D)Ljava/lang/String;").bind()
+        self.assertEqual(value_of(2.5), "2.5")
+        result = []
+        thread = threading.Thread(target=lambda: result.append(
+                                  self.assertRaises(RuntimeError, max_, 1, 2)))
+        thread.start()
+        thread.join()
+        self.assertEqual(len(result), 1)
+
+        # Binding by descriptor (without reflection).
+        max_ = Math.bindMethod("max", "(JJ)J", static=True)
+        self.assertEqual(max_(3, 1 << 40), 1 << 40)
+        new_sb = StringBuilder.bindMethod("<init>", "(Ljava/lang/String;)V")
+        sb = new_sb("xyz")
+        self.assertEqual(StringBuilder.bindMethod("length", "()I")(sb), 3)
+        to_string = StringBuilder.bindMethod("toString", "()Ljava/lang/String;")
+        self.assertEqual(to_string(sb), "xyz")
+        with self.assertRaises(Exception):
+            Math.bindMethod("max", "(Ljava/lang/String;)V", static=True)
+        Integer = self.jvm.JClass.forName("java.lang.Integer")
+        max_value = Integer.bindField("MAX_VALUE", "I", static=True)
+        self.assertEqual(max_value.get(), 2147483647)
+        Point = self.jvm.JClass.forName("java.awt.Point")
+        point = Point.bindMethod("<init>", "(II)V")(1, 2)
+        x = Point.bindField("x", "I")
+        x.set(point, 42)
+        self.assertEqual(x.get(point), 42)
+        self.assertEqual(point.toString(), "java.awt.Point[x=42,y=2]")
+        with self.assertRaises(Exception):
+            Point.bindField("z", "I")
+
+        # Batched invocation over many receivers.
+        points = self.jvm.JArray.newObjectArray(3, Point)
+        points.setObjectSlice(0, 3, 1, [Point.bindMethod("<init>", "(II)V")(idx, -idx)
+                                        for idx in range(3)])
+        get_x = next(meth for meth in Point.getMethods() if meth.getName() == "getX")
+        self.assertEqual(get_x.callInstanceAll(points).toBuffer().tolist(), [0.0, 1.0, 2.0])
+        y = next(field for field in Point.getFields() if field.getName() == "y")
+        self.assertEqual(y.getAll(points).toBuffer().tolist(), [0, -1, -2])
+        Integer = self.jvm.JClass.forName("java.lang.Integer")
+        integers = self.jvm.JObject.boxIntegers([5, 7], asList=True)
+        to_string = next(meth for meth in Integer.getMethods()
+                         if meth.getSignature() == "()Ljava/lang/String;"
+                         and meth.getName() == "toString")
+        strings = to_string.callInstanceAll(integers)
+        self.assertEqual(strings.getStringList(0, len(strings), 1), ["5", "7"])
+        compare_to = next(meth for meth in Integer.getMethods()
+                          if meth.getSignature() == "(Ljava/lang/Integer;)I")
+        self.assertEqual(compare_to.callInstanceAll(integers, self.jvm.JObject.boxIntegers([6]))
+                         .toBuffer().tolist(), [-1, 1])
+
         #jmethod_name = "???"
         #jmethod_signature = "???"
         #jmethod = self._get_method(jclass, jmethod_name, jmethod_signature)
@@ -1599,6 +1977,33 @@ class JVMTestCase(unittest.TestCase):
         self.assertIsNotNone(write_method)
         self.assertEqual(write_method.getName(), "set" + prop_name[0].upper() + prop_name[1:])
 
+        # Struct-of-arrays extraction of the properties.
+        File = self.jvm.JClass.forName("java.io.File")
+        new_file = File.bindMethod("<init>", "(Ljava/lang/String;)V")
+        files = self.jvm.JArray.newObjectArray(3, File)
+        files.setObjectSlice(0, 3, 1, [new_file(path)
+                                       for path in ("/tmp/a.txt", "b", "/ż\U0001F600/c")])
+        columns = File.to_columns(files, ["name", "parent", "absolute", "parentFile"])
+        self.assertEqual(list(columns), ["name", "parent", "absolute", "parentFile"])
+        name = columns["name"]
+        self.assertEqual((name.code, len(name)), ("T", 3))
+        self.assertEqual(name.tolist(), ["a.txt", "b", "c"])
+        self.assertEqual(name.offsets.tolist(), [0, 5, 6, 7])
+        parent = columns["parent"]
+        self.assertEqual(parent.tolist(), ["/tmp", None, "/ż\U0001F600"])
+        self.assertTrue(parent.isNull(1))
+        self.assertEqual(parent.validity.tolist(), [0b101])
+        absolute = columns["absolute"]
+        self.assertEqual((absolute.code, absolute.validity), ("Z", None))
+        self.assertEqual(absolute.tolist(), [True, False, True])
+        parent_file = columns["parentFile"]
+        self.assertEqual(parent_file.code, "L")
+        self.assertEqual([item.toString() if item is not None else None
+                          for item in parent_file.tolist()],
+                         ["/tmp", None, "/ż\U0001F600"])
+        with self.assertRaises(ValueError):
+            File.to_columns(files, ["nonexistent"])
+
     @unittest.skipIf(platform.is_pypy, "jvm: crash on PyPy!!!")
     def test_JObject(self):
 
@@ -1632,7 +2037,19 @@ class JVMTestCase(unittest.TestCase):
         self.assertIsInstance(jclass, self.jvm.JClass)
 
         hash_value = hash(jobj)
-        self.assertEqual(hash_value, jobj.hashCode())
+        self.assertEqual(hash_value, jobj.identityHashCode())
+        self.assertEqual(hash(jobj2), hash_value)
+        self.assertEqual(len({jobj, jobj2, jobj3}), 2)
+        jobj4 = self.jvm.JObject.newString("ABCDEF")
+        self.assertNotEqual(jobj, jobj4)  # the same value, but not the same object
+        data = self.jvm._jvm.data
+        data.equality = "value"
+        try:
+            self.assertEqual(hash(jobj), jobj.hashCode())
+            self.assertEqual(jobj, jobj4)
+            self.assertEqual(len({jobj, jobj2, jobj3, jobj4}), 2)
+        finally:
+            data.equality = "identity"
 
         str_value = str(jobj)
         self.assertIsInstance(str_value, str)
@@ -1724,6 +2141,30 @@ class JVMTestCase(unittest.TestCase):
         self.assertIsInstance(jobj, (self.jvm.JObject, NoneType))
         self.assertIsNotNone(jobj)
 
+        # Cached boxed constants
+        self.assertIs(self.jvm.JObject.newInteger(12), self.jvm.JObject.newInteger(12))
+        self.assertIs(self.jvm.JObject.newBoolean(True), self.jvm.JObject.newBoolean(True))
+        self.assertIsNot(self.jvm.JObject.newInteger(1234), self.jvm.JObject.newInteger(1234))
+        self.assertEqual(self.jvm.JObject.newLong(-5).longValue(), -5)
+
+        # Bulk boxing/unboxing
+        jarr = self.jvm.JObject.boxIntegers(range(5))
+        self.assertIsInstance(jarr, self.jvm.JArray)
+        self.assertEqual(jarr.getClass().getName(), "[Ljava.lang.Integer;")
+        self.assertEqual(jarr.asObject().unboxIntegers(), [0, 1, 2, 3, 4])
+        jlist = self.jvm.JObject.boxDoubles(array.array("d", [1.5, -2.0]), asList=True)
+        self.assertEqual(jlist.getClass().getName(), "java.util.ArrayList")
+        self.assertEqual(jlist.toString(), "[1.5, -2.0]")
+        self.assertEqual(jlist.unboxDoubles(), [1.5, -2.0])
+        self.assertEqual(jlist.unboxLongs(), [1, -2])
+        self.assertEqual(self.jvm.JObject.boxBooleans([True, False], True).unboxBooleans(),
+                         [True, False])
+        self.assertEqual(self.jvm.JObject.boxCharacters("abc", True).unboxCharacters(),
+                         ["a", "b", "c"])
+        with self.assertRaises(ValueError):
+            self.jvm.JObject.boxCharacters("a\U0001F600")
+        self.assertEqual(self.jvm.JObject.boxBytes([]).asObject().unboxBytes(), [])
+
         #val: str
         jobj = self.jvm.JObject.newString("STRING")
         self.assertIsInstance(jobj, (self.jvm.JObject, NoneType))
@@ -1854,6 +2295,139 @@ class JVMTestCase(unittest.TestCase):
         self.assertIsInstance(max_val, float)
 
     def test_JArray(self):
+
+        # critical (zero-copy) access
+        jarray = self.jvm.JArray.newDoubleArray(4)
+        jarray.setDoubleSlice(0, 4, 1, [1.0, 2.0, 3.0, 4.0])
+        with jarray.critical() as buf:
+            self.assertEqual(buf.format, "d")
+            self.assertEqual(buf.shape, (4,))
+            self.assertEqual(buf.tolist(), [1.0, 2.0, 3.0, 4.0])
+            buf[1] = 20.0
+        self.assertEqual(jarray.getDouble(1), 20.0)
+        with self.assertRaises(ValueError):
+            buf[0]
+        jarray = self.jvm.JArray.newByteArray(3)
+        with jarray.critical(readonly=True) as buf:
+            self.assertTrue(buf.readonly)
+            self.assertEqual(bytes(buf), b"\x00\x00\x00")
+        jarray = self.jvm.JArray.newCharArray(2)
+        with jarray.critical() as buf:
+            self.assertEqual((buf.format, buf.itemsize), ("H", 2))
+        with self.assertRaises(BufferError):
+            with jarray.critical() as buf:
+                view = buf[1:]  # still exported at the exit
+                view[0] = ord("x")
+        del view
+        with self.assertRaises(BufferError):
+            with jarray.critical() as buf:
+                export = (ctypes.c_uint16 * 2).from_buffer(buf)  # keeps a view of buf
+        del export
+        # the array has been released nonetheless
+        self.assertEqual(jarray.getChar(0), "\0")
+        with jarray.critical() as buf:
+            self.assertEqual(len(buf), 2)
+        jarray = self.jvm.JArray.newStringArray(2)
+        with self.assertRaises(TypeError):
+            with jarray.critical():
+                pass
+
+        # strided slices (also staged in several chunks)
+        from jvm.jarray import JArray
+        staging_size = JArray._staging_size
+        try:
+            for JArray._staging_size in (staging_size, 4, 1):
+                values = list(range(-10, 10))
+                jarray = self.jvm.JArray.newIntArray(20)
+                jarray.setIntSlice(0, 20, 1, values)
+                for start, stop, step in ((0, 20, 1), (1, 20, 3), (19, -1, -1),
+                                          (18, 2, -4), (5, 6, 7), (3, 3, 2)):
+                    expected = values[start:stop if stop >= 0 else None:step]
+                    jslice = jarray.getIntSlice(start, stop, step)
+                    self.assertEqual(len(jslice), len(expected))
+                    self.assertEqual([jslice.getInt(i) for i in range(len(jslice))], expected)
+                    jdslice = self.jvm.JArray.newDoubleArray(20)
+                    jdslice.setDoubleSlice(start, stop, step, [float(v) for v in expected])
+                    self.assertEqual([jdslice.getDouble(i)
+                                      for i in range(start, stop, step)], expected)
+                jarray.setIntSlice(18, 2, -4, [100, 101, 102, 103])
+                self.assertEqual([jarray.getInt(i) for i in (18, 14, 10, 6, 2)],
+                                 [100, 101, 102, 103, -8])
+                jarray = self.jvm.JArray.newByteArray(6)
+                jarray.setByteSlice(0, 6, 2, b"\x01\xff\x03")
+                self.assertEqual([jarray.getByte(i) for i in range(6)], [1, 0, -1, 0, 3, 0])
+                jarray.setByteSlice(5, 0, -2, [4, b"\x05", -6])
+                self.assertEqual([jarray.getByte(i) for i in range(6)], [1, -6, -1, 5, 3, 4])
+                jarray = self.jvm.JArray.newBooleanArray(4)
+                jarray.setBooleanSlice(1, 4, 2, [True, True])
+                self.assertEqual([jarray.getBoolean(i) for i in range(4)],
+                                 [False, True, False, True])
+                jslice = jarray.getBooleanSlice(3, -1, -2)
+                self.assertEqual([jslice.getBoolean(i) for i in range(2)], [True, True])
+                jarray = self.jvm.JArray.newCharArray(4)
+                jarray.setCharSlice(0, 4, 3, "ab")
+                with jarray.getCharSlice(3, -1, -3).critical() as buf:
+                    self.assertEqual(buf.tolist(), [ord("b"), ord("a")])
+                with self.assertRaises(IndexError):
+                    self.jvm.JArray.newIntArray(5).setIntSlice(0, 5, 2, [1, 2])
+        finally:
+            JArray._staging_size = staging_size
+
+        # batched String/Object arrays
+        values = ["abc", None, "", "za\u017c\u00f3\u0142\u0107", "\U0001f600x", "last"]
+        jarray = self.jvm.JArray.newStringArray(len(values))
+        jarray.setStringSlice(0, len(values), 1, values)
+        self.assertEqual(jarray.getStringList(0, len(values), 1), values)
+        self.assertEqual(jarray.getStringList(5, -1, -2), values[5::-2])
+        self.assertEqual(jarray.getStringList(2, 2, 1), [])
+        jarray.setStringSlice(4, -1, -4, ["X", "Y"])
+        self.assertEqual(jarray.getStringList(0, 6, 4), ["Y", "X"])
+        jslice = jarray.getStringSlice(1, 6, 2)
+        self.assertEqual(len(jslice), 3)
+        self.assertEqual(jslice.getStringList(0, 3, 1), [None, values[3], values[5]])
+        jslice = jarray.getObjectSlice(0, 6, 5)
+        self.assertEqual(len(jslice), 2)
+        self.assertTrue(jslice.getObject(1).equals(jarray.getObject(5)))
+
+        # NumPy conversions
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover
+            numpy = None
+        if numpy is not None:
+            for dtype in ("bool", "uint16", "int8", "int16",
+                          "int32", "int64", "float32", "float64"):
+                ndarray = numpy.arange(5).astype(dtype)
+                jarray = self.jvm.JArray.newFromNumpy(ndarray)
+                self.assertEqual(len(jarray), 5)
+                result = jarray.to_numpy()
+                self.assertEqual(result.dtype, numpy.dtype(dtype))
+                self.assertTrue(numpy.array_equal(result, ndarray))
+            self.assertEqual(self.jvm.JArray.newFromNumpy(
+                             numpy.array([1.5, 2.5])).getDouble(1), 2.5)
+            ndarray = numpy.arange(12, dtype="float64").reshape(3, 4)
+            jarray = self.jvm.JArray.newFromNumpy(ndarray)
+            self.assertEqual(len(jarray), 3)
+            result = jarray.to_numpy()
+            self.assertEqual(result.shape, (3, 4))
+            self.assertTrue(numpy.array_equal(result, ndarray))
+            jarray = self.jvm.JArray.newFromNumpy(ndarray.T)  # non-contiguous
+            self.assertTrue(numpy.array_equal(jarray.to_numpy(), ndarray.T))
+            jarray = self.jvm.JArray.newObjectArray(3, self.jvm.JClass.forName("[I"))
+            jarray.setObject(0, self.jvm.JArray.newIntArray(2).asObject())
+            jarray.setObject(2, self.jvm.JArray.newIntArray(3).asObject())
+            result = jarray.to_numpy()
+            self.assertEqual(result.dtype, numpy.dtype(object))
+            self.assertEqual(len(result[0]), 2)
+            self.assertIsNone(result[1])
+            self.assertEqual(len(result[2]), 3)
+            with self.assertRaises(TypeError):
+                self.jvm.JArray.newFromNumpy(numpy.array([1, 2], dtype="uint32"))
+            jarray = self.jvm.JArray.newObjectArray(1, self.jvm.JClass.forName("java.lang.Object"))
+            jarray.setObject(0, self.jvm.JArray.newStringArray(1).asObject())
+            with self.assertRaises(TypeError):
+                jarray.to_numpy()
+
         pass  # TODO
 
     def test_JAnnotation(self):
@@ -2005,6 +2579,62 @@ class JVMTestCase(unittest.TestCase):
         return_value = jmethod.callStaticVoid(jclass, jargs)
         self.assertIsNone(return_value)
 
+    def test_JDispatcher(self):
+
+        dispatcher = self.jvm.JDispatcher()
+        StringBuilder = self.jvm.JClass.forName("java.lang.StringBuilder")
+        sb = dispatcher.newInstance(StringBuilder, "x")
+        for val in (1, 2.5, True, "s"):
+            dispatcher.callInstance(sb, "append", val)
+        dispatcher.callInstance(sb, "append", sb.getClass())
+        self.assertEqual(dispatcher.callInstance(sb, "toString"),
+                         "x12.5trues" + "class java.lang.StringBuilder")
+        self.assertEqual(dispatcher.callInstance(sb, "length"), 39)
+        ncached = len(dispatcher)
+        dispatcher.callInstance(sb, "append", 7)
+        self.assertEqual(len(dispatcher), ncached)
+        with self.assertRaises(TypeError):  # append(null) is ambiguous
+            dispatcher.callInstance(sb, "append", None)
+        with self.assertRaises(TypeError):
+            dispatcher.callInstance(sb, "append", 1, 2, 3, 4)
+
+        HashMap = self.jvm.JClass.forName("java.util.HashMap")
+        jmap = dispatcher.newInstance(HashMap)
+        self.assertIsNone(dispatcher.callInstance(jmap, "put", "a", 1))
+        self.assertEqual(str(dispatcher.callInstance(jmap, "get", "a")), "1")
+        self.assertEqual(dispatcher.callInstance(jmap, "size"), 1)
+
+        Math = self.jvm.JClass.forName("java.lang.Math")
+        self.assertEqual(dispatcher.callStatic(Math, "max", 3, 7), 7)
+        self.assertEqual(dispatcher.callStatic(Math, "max", 3.5, 7.5), 7.5)
+        String = self.jvm.JClass.forName("java.lang.String")
+        self.assertEqual(dispatcher.callStatic(String, "valueOf", 3.5), "3.5")
+        # a str matches a char only if it is a single character
+        self.assertEqual(dispatcher.callStatic(String, "valueOf", "c"), "c")
+        self.assertEqual(dispatcher.callStatic(String, "valueOf", "text"), "text")
+        member, _, _, static = dispatcher.resolve(String, "valueOf", ("text",), static=True)
+        self.assertEqual(member.getSignature(), "(Ljava/lang/Object;)Ljava/lang/String;")
+        self.assertTrue(static)
+        self.assertEqual(dispatcher.callInstance(self.jvm.JObject.newString("s"),
+                                                 "valueOf", 2.5), "2.5")  # static
+
+        # A type handler takes precedence over the built-in matching.
+        class IntHandler:
+            def match(self, val):
+                return EMatch.PERFECT if type(val) is int else EMatch.NONE
+            def setArgument(self, pdescr, args, pos, val):
+                args.setInt(pos, val)
+        handler = IntHandler()
+        dispatcher = self.jvm.JDispatcher(
+            handler=lambda ptype: handler if ptype.getName() == "int" else None)
+        member, _, _, _ = dispatcher.resolve(Math, "abs", (-3,), static=True)
+        self.assertEqual(member.getSignature(), "(I)I")
+        self.assertEqual(dispatcher.callStatic(Math, "abs", -3), 3)
+        self.assertEqual(len(dispatcher), 0)  # the matches of a handler are not cached
+        self.assertEqual(dispatcher.callStatic(Math, "abs", -2.5), 2.5)
+        dispatcher.clear()
+        self.assertEqual(len(dispatcher), 0)
+
     def test_JException(self):
         pass  # TODO
 
@@ -2048,17 +2678,56 @@ class JVMTestCase(unittest.TestCase):
         # "\uE000" - "\uFFFF"
         # "\U00010000" - "\U0010FFFF"
 
+        def round_trip(s):
+            _, jenv = self.jvm
+            jchars, size, _ = str2jchars(s)
+            jstr = jenv.NewString(jchars, size)
+            try:
+                jstring = JString(jenv, jstr, own=False)
+                self.assertEqual(jstring.length, size)
+                return jstring.str
+            finally:
+                jenv.DeleteLocalRef(jstr)
+
+        strings = ["", "hello \U0001F30E!", "a\0b"]
         s = ""
         for x in range(0x0000, 0xD7FF + 1):
             s += chr(x)
         for x in range(0xE000, 0xFFFF + 1):
             s += chr(x)
-
+        strings.append(s)
         s = ""
         for x in range(0x00010000, min(0x0010FFFF, sys.maxunicode) + 1):
             s += chr(x)
-
-        pass  # TODO
+        strings.append(s)
+
+        for s in strings:
+            self.assertEqual(round_trip(s), s)
+        # (Modified) UTF-8 transfer, with fallback for NUL and supplementary chars.
+        JString.utf8_min_length = 0
+        try:
+            for s in strings + ["ascii", "\u00e9t\u00e9", "x" * 256, "y" * 4096]:
+                self.assertEqual(round_trip(s), s)
+        finally:
+            JString.utf8_min_length = None
+
+        # Java Strings of the identifiers.
+        jfield = jclass.getDeclaredField(jfield_name)
+        self.assertIn(jfield_name, self.jvm._jvm.strings)
+        _, jenv = self.jvm
+        cache = JStringCache(maxsize=2)
+        for name in ("a", "b", "a", "c", "a"):
+            jstr = cache.get(jenv, name)
+            try:
+                self.assertEqual(JString(jenv, jstr, own=False).str, name)
+            finally:
+                jenv.DeleteLocalRef(jstr)
+        self.assertEqual(len(cache), 2)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        cache.clear(jenv)
+        self.assertEqual(len(cache), 0)
 
     @unittest.skip("jvm: crash!!!")
     def test_PythonInterpreter(self):
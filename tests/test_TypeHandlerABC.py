@@ -3,19 +3,11 @@
 # Please refer to the accompanying LICENSE file.
 
 import unittest
-import enum
 
-from jvm.jconstants      import EJavaType
+from jvm.jconstants      import EJavaType, EMatch
 from jvm.jtypehandlerabc import TypeHandlerABC
 
 
-class EMatch(enum.IntEnum):
-    NONE     =   0
-    EXPLICIT =   1
-    IMPLICIT =  10
-    PERFECT  = 100
-
-
 class IncompleteHandler(TypeHandlerABC):
 
     __slots__ = ()